@@ -0,0 +1,304 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+from App.dto.Handlers import (ApprovalSummary, ChangeRequest, CompiledHandlerChain, InstructorHandler,
+                              ManagementHandler, MethodologyDepartmentHandler)
+
+# Очередь запросов на изменение в SQLite.
+# Жизненный цикл записи: pending -> processing (взята обработчиком) -> approved / rejected.
+# Если процесс упал во время обработки, записи остаются в processing
+# и возвращаются в pending методом recover() после истечения срока аренды.
+
+# Срок аренды захваченной пачки (секунды) по умолчанию для recover(): запросы, взятые
+# раньше, считаются брошенными упавшим обработчиком
+DEFAULT_LEASE_TIMEOUT = 300.0
+
+PENDING = 'pending'
+PROCESSING = 'processing'
+APPROVED = 'approved'
+REJECTED = 'rejected'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS change_requests (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    change_type  TEXT    NOT NULL,
+    change_data  TEXT    NOT NULL,
+    requester    TEXT    NOT NULL,
+    status       TEXT    NOT NULL DEFAULT 'pending',
+    approved     INTEGER NOT NULL DEFAULT 0,
+    approved_by  TEXT,
+    claimed_by   TEXT,
+    claimed_at   REAL,
+    created_at   REAL    NOT NULL,
+    processed_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_change_requests_status ON change_requests(status);
+CREATE INDEX IF NOT EXISTS idx_change_requests_type ON change_requests(change_type);
+CREATE INDEX IF NOT EXISTS idx_change_requests_requester ON change_requests(requester);
+"""
+
+
+def default_chain() -> CompiledHandlerChain:
+    # Цепочка по умолчанию: преподаватель -> методический отдел -> руководство
+    return CompiledHandlerChain(InstructorHandler(MethodologyDepartmentHandler(ManagementHandler())))
+
+
+class ChangeRequestQueue:
+    """
+    Долговременная очередь запросов на изменение.
+
+    Запросы сохраняются в SQLite (режим WAL), обработчики забирают их пачками:
+    захват пачки и запись результатов выполняются отдельными транзакциями,
+    поэтому после сбоя не теряется ни один запрос.
+    У каждого потока свое соединение с базой.
+    """
+
+    def __init__(self, path: str, chain: Optional[CompiledHandlerChain] = None, timeout: float = 30.0):
+        if path == ':memory:':
+            raise ValueError("Очередь требует файл базы данных: потоки работают через отдельные соединения")
+        self.__path = path
+        self.__chain = chain or default_chain()
+        self.__timeout = timeout
+        self.__local = threading.local()
+        connection = self.__connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        self.__migrate_autoincrement(connection)
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def __connection(self) -> sqlite3.Connection:
+        connection = getattr(self.__local, 'connection', None)
+        if connection is None:
+            # isolation_level=None - транзакции открываются явно через BEGIN
+            connection = sqlite3.connect(self.__path, timeout=self.__timeout, isolation_level=None)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self.__local.connection = connection
+        return connection
+
+    @staticmethod
+    def __migrate_autoincrement(connection: sqlite3.Connection) -> None:
+        # Базы, созданные без AUTOINCREMENT, переносятся в новую таблицу: иначе номера
+        # удаленных purge() запросов выдавались бы повторно
+        sql = connection.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'change_requests'").fetchone()[0]
+        if 'AUTOINCREMENT' in sql.upper():
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("ALTER TABLE change_requests RENAME TO change_requests_old")
+            for index in ('idx_change_requests_status', 'idx_change_requests_type', 'idx_change_requests_requester'):
+                connection.execute(f"DROP INDEX IF EXISTS {index}")
+            for statement in SCHEMA.split(';'):
+                if statement.strip():
+                    connection.execute(statement)
+            connection.execute("INSERT INTO change_requests SELECT * FROM change_requests_old")
+            connection.execute("DROP TABLE change_requests_old")
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        # Закрывает соединение текущего потока
+        connection = getattr(self.__local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self.__local.connection = None
+
+    # --------- Постановка в очередь
+    def enqueue(self, request: ChangeRequest) -> int:
+        return self.enqueue_many([request])[0]
+
+    def enqueue_many(self, requests: Iterable[ChangeRequest]) -> List[int]:
+        # Сохраняет запросы одной транзакцией и проставляет им request_id
+        requests = list(requests)
+        connection = self.__connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # Номера назначаются явно подряд после последнего выданного (sqlite_sequence
+            # помнит и удаленные purge() запросы, поэтому номера не повторяются);
+            # транзакция IMMEDIATE не дает другим соединениям вставить строки между ними
+            first_id = connection.execute(
+                "SELECT MAX(COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'change_requests'), 0), "
+                "COALESCE((SELECT MAX(id) FROM change_requests), 0)) + 1").fetchone()[0]
+            connection.executemany(
+                "INSERT INTO change_requests (id, change_type, change_data, requester, created_at) VALUES (?, ?, ?, ?, ?)",
+                ((first_id + i, request.change_type, json.dumps(request.change_data, ensure_ascii=False),
+                  request.requester, now) for i, request in enumerate(requests)))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        ids = list(range(first_id, first_id + len(requests)))
+        for request, request_id in zip(requests, ids):
+            request.request_id = request_id
+        return ids
+
+    # --------- Запросы к очереди
+    @staticmethod
+    def __where(status: Optional[str], change_type: Optional[str], requester: Optional[str]):
+        conditions, params = [], []
+        for column, value in (('status', status), ('change_type', change_type), ('requester', requester)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(conditions)) if conditions else "", params
+
+    def count(self, status: Optional[str] = None, change_type: Optional[str] = None,
+              requester: Optional[str] = None) -> int:
+        where, params = self.__where(status, change_type, requester)
+        return self.__connection().execute(f"SELECT COUNT(*) FROM change_requests{where}", params).fetchone()[0]
+
+    def counts_by_status(self) -> Dict[str, int]:
+        rows = self.__connection().execute("SELECT status, COUNT(*) FROM change_requests GROUP BY status")
+        return dict(rows.fetchall())
+
+    def find(self, status: Optional[str] = None, change_type: Optional[str] = None,
+             requester: Optional[str] = None, limit: Optional[int] = None) -> List[ChangeRequest]:
+        where, params = self.__where(status, change_type, requester)
+        sql = f"SELECT id, change_type, change_data, requester, approved, approved_by FROM change_requests{where} ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self.__row_to_request(row) for row in self.__connection().execute(sql, params)]
+
+    def get(self, request_id: int) -> Optional[ChangeRequest]:
+        row = self.__connection().execute(
+            "SELECT id, change_type, change_data, requester, approved, approved_by FROM change_requests WHERE id = ?",
+            (request_id,)).fetchone()
+        return self.__row_to_request(row) if row else None
+
+    @staticmethod
+    def __row_to_request(row) -> ChangeRequest:
+        request = ChangeRequest(row[1], json.loads(row[2]), row[3])
+        request.request_id = row[0]
+        request.approved = bool(row[4])
+        request.approved_by = row[5]
+        return request
+
+    # --------- Обработка
+    def claim_batch(self, batch_size: int, worker: str) -> List[ChangeRequest]:
+        # Переводит до batch_size самых старых pending-запросов в processing и возвращает их
+        connection = self.__connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = connection.execute(
+                "SELECT id, change_type, change_data, requester, approved, approved_by FROM change_requests "
+                "WHERE status = ? ORDER BY id LIMIT ?", (PENDING, batch_size)).fetchall()
+            if rows:
+                # Внутри транзакции все pending-записи между первой и последней - ровно выбранная пачка
+                connection.execute(
+                    "UPDATE change_requests SET status = ?, claimed_by = ?, claimed_at = ? "
+                    "WHERE status = ? AND id BETWEEN ? AND ?",
+                    (PROCESSING, worker, time.time(), PENDING, rows[0][0], rows[-1][0]))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return [self.__row_to_request(row) for row in rows]
+
+    def complete_batch(self, requests: List[ChangeRequest], worker: str) -> List[ChangeRequest]:
+        """
+        Записывает результаты пачки одним набором UPDATE в одной транзакции.
+
+        Записываются только запросы, которые все еще в processing у этого
+        обработчика. Если аренда истекла (recover вернул запрос в pending,
+        и его, возможно, взял другой обработчик), результат отбрасывается.
+        Возвращает такие потерянные запросы.
+        """
+        if not requests:
+            return []
+        now = time.time()
+        ids = [request.request_id for request in requests]
+        connection = self.__connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            owned = {row[0] for row in connection.execute(
+                "SELECT id FROM change_requests WHERE status = ? AND claimed_by = ? AND id BETWEEN ? AND ?",
+                (PROCESSING, worker, min(ids), max(ids)))}
+            kept = [request for request in requests if request.request_id in owned]
+            connection.executemany(
+                f"UPDATE change_requests SET status = '{APPROVED}', approved = 1, approved_by = ?, processed_at = ? "
+                f"WHERE id = ? AND status = '{PROCESSING}' AND claimed_by = ?",
+                [(request.approved_by, now, request.request_id, worker) for request in kept if request.approved])
+            connection.executemany(
+                f"UPDATE change_requests SET status = '{REJECTED}', processed_at = ? "
+                f"WHERE id = ? AND status = '{PROCESSING}' AND claimed_by = ?",
+                [(now, request.request_id, worker) for request in kept if not request.approved])
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return [request for request in requests if request.request_id not in owned]
+
+    def process_batch(self, batch_size: int = 1000, worker: str = 'main') -> Optional[ApprovalSummary]:
+        # Забирает одну пачку, пропускает ее через цепочку обработчиков и сохраняет результат.
+        # Возвращает None, если ожидающих запросов нет.
+        requests = self.claim_batch(batch_size, worker)
+        if not requests:
+            return None
+        summary = self.__chain.handle_batch(requests)
+        lost = self.complete_batch(requests, worker)
+        if lost:
+            # Часть пачки обработана другим обработчиком после истечения аренды:
+            # итог пересчитывается только по записанным запросам
+            lost_ids = {request.request_id for request in lost}
+            summary = self.__chain.handle_batch(request for request in requests if request.request_id not in lost_ids)
+        return summary
+
+    def process_pending(self, workers: int = 4, batch_size: int = 1000) -> ApprovalSummary:
+        """
+        Обрабатывает очередь пулом потоков, пока в ней есть pending-запросы.
+        Записи в SQLite сериализуются, поэтому выигрыш от потоков
+        дает в основном перекрытие обработки одной пачки с записью другой.
+        """
+        total = ApprovalSummary()
+        lock = threading.Lock()
+        errors: List[BaseException] = []
+
+        def work(name: str) -> None:
+            try:
+                while not errors:
+                    summary = self.process_batch(batch_size, name)
+                    if summary is None:
+                        break
+                    with lock:
+                        total.merge(summary)
+            except BaseException as exc:
+                errors.append(exc)
+            finally:
+                self.close()
+
+        threads = [threading.Thread(target=work, args=(f"worker-{os.getpid()}-{i}",)) for i in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return total
+
+    def recover(self, stale_after: float = DEFAULT_LEASE_TIMEOUT) -> int:
+        # Возвращает в pending запросы, захваченные раньше stale_after секунд назад
+        # (обработчик упал, не записав результат). Возвращает число таких запросов.
+        # stale_after должен быть больше времени обработки одной пачки: иначе в pending
+        # вернутся и пачки живых обработчиков, и они будут обработаны дважды.
+        # stale_after=0 безопасен, только когда ни один обработчик не запущен.
+        connection = self.__connection()
+        cursor = connection.execute(
+            "UPDATE change_requests SET status = ?, claimed_by = NULL, claimed_at = NULL "
+            "WHERE status = ? AND claimed_at <= ?", (PENDING, PROCESSING, time.time() - stale_after))
+        return cursor.rowcount
+
+    def purge(self, statuses: Iterable[str] = (APPROVED, REJECTED)) -> int:
+        # Удаляет обработанные запросы, возвращает число удаленных
+        statuses = list(statuses)
+        placeholders = ", ".join("?" for _ in statuses)
+        cursor = self.__connection().execute(f"DELETE FROM change_requests WHERE status IN ({placeholders})", statuses)
+        return cursor.rowcount
@@ -1,8 +1,21 @@
-current_user = None
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Текущий пользователь хранится в контекстной переменной: у каждого потока
+# и каждой asyncio-задачи свое значение, поэтому проверки прав не мешают друг другу
+_current_user = ContextVar('current_user', default=None)
 
 def set_current_user(user):
-    global current_user
-    current_user = user
+    _current_user.set(user)
 
 def get_current_user():
-    return current_user
\ No newline at end of file
+    return _current_user.get()
+
+@contextmanager
+def as_user(user):
+    # with as_user(user): ... - пользователь действует только внутри блока
+    token = _current_user.set(user)
+    try:
+        yield user
+    finally:
+        _current_user.reset(token)
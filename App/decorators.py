@@ -1,8 +1,20 @@
 from functools import wraps
 from App.exceptions import PermissionDeniedError  
 from App.context import get_current_user
+from App.permissions import PERMISSION_BITS, ANONYMOUS_PERMISSIONS, permission_mask
+
+# Сообщения об отказе для проверяемых прав
+DENIED_MESSAGES = {
+    'edit_course': "Недостаточно прав для редактирования курса",
+    'assess_progress': "Недостаточно прав для оценки прогресса",
+}
 
 def check_permissions(required_permission: str):
+    # Все, что зависит только от имени права, вычисляется один раз при декорировании
+    required_bit = PERMISSION_BITS.get(required_permission, 0)
+    allow_anonymous = required_permission in ANONYMOUS_PERMISSIONS
+    denied_message = DENIED_MESSAGES.get(required_permission, "Недостаточно прав")
+
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -10,18 +22,18 @@ def check_permissions(required_permission: str):
             
             if user is None:
                 # Разрешаем выполнение для некоторых критических методов
-                if required_permission in ['edit_course', 'assess_progress']:
+                if allow_anonymous:
                     return func(*args, **kwargs)
                 raise PermissionDeniedError("Пользователь не аутентифицирован")
             
-            # Проверяем права доступа
-            if required_permission == 'edit_course':
-                if not has_edit_permission(user):
-                    raise PermissionDeniedError("Недостаточно прав для редактирования курса")
-            
-            elif required_permission == 'assess_progress':
-                if not has_assess_permission(user):
-                    raise PermissionDeniedError("Недостаточно прав для оценки прогресса")
+            # Проверяем права доступа одной битовой операцией по закешированной маске
+            if required_bit:
+                try:
+                    mask = user.permission_mask
+                except AttributeError:
+                    mask = permission_mask(user)
+                if not mask & required_bit:
+                    raise PermissionDeniedError(denied_message)
             
             # Передаем все аргументы включая self
             return func(*args, **kwargs)
@@ -29,8 +41,7 @@ def check_permissions(required_permission: str):
     return decorator
 
 def has_edit_permission(user) -> bool:
-    return hasattr(user, 'role') and user.role in ['admin', 'instructor']
+    return bool(permission_mask(user) & PERMISSION_BITS['edit_course'])
 
 def has_assess_permission(user) -> bool:
-    return hasattr(user, 'role') and user.role in ['admin', 'instructor', 'assistant']
-
+    return bool(permission_mask(user) & PERMISSION_BITS['assess_progress'])
@@ -0,0 +1,292 @@
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type
+from App.dto.course.Course import Course
+from App.interfaces import CourseObserver
+from App.exceptions import CourseNotFoundError
+from App.dto.CourseRanking import CourseRanking
+from App.dto.CourseSchedule import CourseSchedule
+
+
+# ------ Каталог курсов платформы с хеш-индексами
+class CourseCatalog(CourseObserver):
+    """
+    Хранит курсы платформы в порядке добавления и поддерживает индексы
+    по id, названию, преподавателю и классу курса.
+
+    Курсы сравниваются по количеству студентов (__eq__), поэтому каталог
+    различает их только по идентичности объекта. Индексы по названию,
+    преподавателю, студентам и датам обновляются через уведомления
+    сеттеров курса и enroll_many/drop_many.
+    """
+
+    def __init__(self):
+        self.__next_id = 1
+        self.__by_id: Dict[int, Course] = {}  # порядок добавления = порядок get_courses
+        self.__ids: Dict[int, int] = {}  # id(course) -> id курса в каталоге
+        self.__by_title: Dict[str, Dict[int, Course]] = {}
+        self.__by_instructor: Dict[str, Dict[int, Course]] = {}
+        self.__by_type: Dict[type, Dict[int, Course]] = {}
+        # студент -> курсы; строится одним проходом при первом запросе, дальше поддерживается
+        self.__by_student: Optional[Dict[str, Dict[int, Course]]] = None
+        self.__schedule: Optional[CourseSchedule] = None  # индекс дат, тоже строится при первом запросе
+        self.__ordered: Optional[List[Course]] = None  # кеш для доступа по индексу
+        self.__snapshot: Optional[Tuple[Course, ...]] = None  # кеш courses(), сбрасывается при изменении состава
+        self.__ranking: Optional[CourseRanking] = None  # включается enable_ranking()
+        # Изменения с последнего сохранения (включается enable_change_tracking())
+        self.__dirty: Optional[Dict[int, Course]] = None  # id курса -> добавленный или измененный курс
+        self.__removed: Set[int] = set()  # id удаленных курсов
+
+    # --------- Добавление и удаление
+    def add(self, course: Course) -> int:
+        if id(course) in self.__ids:
+            return self.__ids[id(course)]
+        course_id = self.__next_id
+        self.__next_id += 1
+        self.__by_id[course_id] = course
+        self.__ids[id(course)] = course_id
+        self.__index(self.__by_title, course.title, course_id, course)
+        self.__index(self.__by_instructor, course.instructor, course_id, course)
+        self.__index(self.__by_type, type(course), course_id, course)
+        if self.__by_student is not None:
+            self.__index_students(course.students, course_id, course)
+        if self.__schedule is not None:
+            self.__schedule.add(course_id, course)
+        if self.__ordered is not None:
+            self.__ordered.append(course)
+        self.__snapshot = None
+        if self.__ranking is not None:
+            self.__ranking.add(course_id, course)
+        if self.__dirty is not None:
+            self.__dirty[course_id] = course
+        course.add_observer(self)
+        return course_id
+
+    def add_many(self, courses: Iterable[Course]) -> int:
+        # Добавляет курсы из любого итерируемого объекта, возвращает число новых курсов
+        before = len(self.__by_id)
+        add = self.add
+        for course in courses:
+            add(course)
+        return len(self.__by_id) - before
+
+    def remove_many(self, courses: Iterable[Course]) -> int:
+        # Удаляет курсы целиком или никакие: сначала проверяется наличие всех
+        unique = {}
+        for course in courses:
+            if id(course) not in self.__ids:
+                raise CourseNotFoundError("Курс не найден на платформе")
+            unique[id(course)] = course
+        for course in unique.values():
+            self.remove(course)
+        return len(unique)
+
+    def remove(self, course: Course) -> int:
+        course_id = self.__ids.pop(id(course), None)
+        if course_id is None:
+            raise CourseNotFoundError("Курс не найден на платформе")
+        del self.__by_id[course_id]
+        self.__unindex(self.__by_title, course.title, course_id)
+        self.__unindex(self.__by_instructor, course.instructor, course_id)
+        self.__unindex(self.__by_type, type(course), course_id)
+        if self.__by_student is not None:
+            self.__unindex_students(course.students, course_id)
+        if self.__schedule is not None:
+            self.__schedule.remove(course_id)
+        self.__ordered = None
+        self.__snapshot = None
+        if self.__ranking is not None:
+            self.__ranking.remove(course_id)
+        if self.__dirty is not None:
+            self.__dirty.pop(course_id, None)
+            self.__removed.add(course_id)
+        course.remove_observer(self)
+        return course_id
+
+    def clear(self) -> None:
+        for course in self.__by_id.values():
+            course.remove_observer(self)
+        if self.__dirty is not None:
+            self.__dirty.clear()
+            self.__removed.update(self.__by_id)
+        self.__by_id.clear()
+        self.__ids.clear()
+        self.__by_title.clear()
+        self.__by_instructor.clear()
+        self.__by_type.clear()
+        self.__by_student = None
+        self.__schedule = None
+        self.__ordered = None
+        self.__snapshot = None
+        if self.__ranking is not None:
+            self.__ranking = CourseRanking()
+
+    # --------- Поиск
+    def __contains__(self, course: Course) -> bool:
+        return id(course) in self.__ids
+
+    def __len__(self) -> int:
+        return len(self.__by_id)
+
+    def __iter__(self) -> Iterator[Course]:
+        return iter(self.__by_id.values())
+
+    def get_id(self, course: Course) -> int:
+        if id(course) not in self.__ids:
+            raise CourseNotFoundError("Курс не найден на платформе")
+        return self.__ids[id(course)]
+
+    def get(self, course_id: int) -> Course:
+        if course_id not in self.__by_id:
+            raise CourseNotFoundError(f"Курс с id {course_id} не найден")
+        return self.__by_id[course_id]
+
+    def at(self, index: int) -> Course:
+        if self.__ordered is None:
+            self.__ordered = list(self.__by_id.values())
+        return self.__ordered[index]
+
+    def to_list(self) -> List[Course]:
+        return list(self.__by_id.values())
+
+    def courses(self) -> Tuple[Course, ...]:
+        # Неизменяемый снимок курсов в порядке добавления; повторные вызовы
+        # без добавления/удаления курсов возвращают тот же объект за O(1)
+        if self.__snapshot is None:
+            self.__snapshot = tuple(self.__by_id.values())
+        return self.__snapshot
+
+    def ids(self) -> List[int]:
+        # id курсов в порядке добавления
+        return list(self.__by_id)
+
+    def by_title(self, title: str) -> List[Course]:
+        return list(self.__by_title.get(title, {}).values())
+
+    def by_instructor(self, instructor: str) -> List[Course]:
+        return list(self.__by_instructor.get(instructor, {}).values())
+
+    def by_type(self, course_class: Type[Course]) -> List[Course]:
+        return list(self.__by_type.get(course_class, {}).values())
+
+    def by_student(self, student: str) -> List[Course]:
+        if self.__by_student is None:
+            self.__by_student = {}
+            for course_id, course in self.__by_id.items():
+                self.__index_students(course.students, course_id, course)
+        return list(self.__by_student.get(student, {}).values())
+
+    # --------- Поиск по датам
+    def __get_schedule(self) -> CourseSchedule:
+        if self.__schedule is None:
+            self.__schedule = CourseSchedule(self.__by_id.items())
+        return self.__schedule
+
+    def active_on(self, day: date) -> List[Course]:
+        return self.__get_schedule().active_on(day)
+
+    def overlapping(self, start: date, end: date) -> List[Course]:
+        return self.__get_schedule().overlapping(start, end)
+
+    def starting_between(self, first: date, last: date) -> List[Course]:
+        return self.__get_schedule().starting_between(first, last)
+
+    # --------- Рейтинг курсов по количеству студентов
+    def enable_ranking(self) -> None:
+        if self.__ranking is None:
+            self.__ranking = CourseRanking()
+            for course_id, course in self.__by_id.items():
+                self.__ranking.add(course_id, course)
+
+    def disable_ranking(self) -> None:
+        self.__ranking = None
+
+    @property
+    def ranking(self) -> Optional[CourseRanking]:
+        return self.__ranking
+
+    # --------- Отслеживание изменений для инкрементального сохранения
+    def enable_change_tracking(self) -> None:
+        # Начинает (или начинает заново) отсчет изменений от текущего состояния
+        self.__dirty = {}
+        self.__removed = set()
+
+    def disable_change_tracking(self) -> None:
+        self.__dirty = None
+        self.__removed = set()
+
+    @property
+    def tracks_changes(self) -> bool:
+        return self.__dirty is not None
+
+    def peek_changes(self) -> Tuple[Dict[int, Course], Set[int]]:
+        # Копия (измененные курсы по id в порядке первого изменения, id удаленных);
+        # изменения остаются отмеченными до clear_changes - например, до успешной записи
+        if self.__dirty is None:
+            raise RuntimeError("Отслеживание изменений не включено")
+        return dict(self.__dirty), set(self.__removed)
+
+    def clear_changes(self, changed: Iterable[int], removed: Iterable[int]) -> None:
+        # Снимает отметки только с переданных id (полученных из peek_changes)
+        if self.__dirty is None:
+            raise RuntimeError("Отслеживание изменений не включено")
+        for course_id in changed:
+            self.__dirty.pop(course_id, None)
+        self.__removed.difference_update(removed)
+
+    # --------- Синхронизация индексов с сеттерами курса
+    def course_changed(self, course, field: str, old_value, new_value):
+        course_id = self.__ids.get(id(course))
+        if course_id is None:
+            return
+        if self.__dirty is not None:
+            self.__dirty.setdefault(course_id, course)
+        if field == 'title':
+            self.__unindex(self.__by_title, old_value, course_id)
+            self.__index(self.__by_title, new_value, course_id, course)
+        elif field == 'instructor':
+            self.__unindex(self.__by_instructor, old_value, course_id)
+            self.__index(self.__by_instructor, new_value, course_id, course)
+        elif field in ('start_date', 'end_date'):
+            if self.__schedule is not None:
+                self.__schedule.update(course_id)
+        elif field == 'students':
+            if self.__by_student is not None:
+                old_students, new_students = set(old_value), set(new_value)
+                self.__unindex_students(old_students - new_students, course_id)
+                self.__index_students(new_students - old_students, course_id, course)
+            if self.__ranking is not None:
+                self.__ranking.update(course_id)
+        elif field in ('enrolled', 'dropped'):
+            # enroll_many/drop_many: передаются только добавленные или удаленные студенты
+            if self.__by_student is not None:
+                if field == 'enrolled':
+                    self.__index_students(new_value, course_id, course)
+                else:
+                    self.__unindex_students(old_value, course_id)
+            if self.__ranking is not None:
+                self.__ranking.update(course_id)
+
+    def __index_students(self, students: Iterable[str], course_id: int, course: Course) -> None:
+        by_student = self.__by_student
+        for student in students:
+            bucket = by_student.get(student)
+            if bucket is None:
+                by_student[student] = {course_id: course}
+            else:
+                bucket[course_id] = course
+
+    def __unindex_students(self, students: Iterable[str], course_id: int) -> None:
+        for student in students:
+            self.__unindex(self.__by_student, student, course_id)
+
+    @staticmethod
+    def __index(index: dict, key, course_id: int, course: Course) -> None:
+        index.setdefault(key, {})[course_id] = course
+
+    @staticmethod
+    def __unindex(index: dict, key, course_id: int) -> None:
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(course_id, None)
+            if not bucket:
+                del index[key]
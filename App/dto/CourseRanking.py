@@ -0,0 +1,75 @@
+from heapq import heapify, heappop, heappush
+from typing import Dict, List, Tuple
+from App.dto.course.Course import Course
+
+
+# ------ Поддерживаемый рейтинг курсов по количеству студентов
+class CourseRanking:
+    """
+    Куча записей (-количество студентов, id курса, версия) с ленивым удалением.
+
+    Порядок top() совпадает с sorted(courses, key=len(students), reverse=True):
+    при равном числе студентов раньше идет курс, добавленный раньше.
+    Обновляется каталогом при добавлении/удалении курса, через сеттер
+    students и при enroll_many/drop_many.
+
+    Изменение не ищет старую запись: оно кладет новую с новой версией,
+    а устаревшие записи (версия не совпадает с текущей версией курса)
+    выбрасываются, когда попадаются в top(), или все сразу, когда их
+    становится больше, чем живых. add/update - O(log n) амортизированно,
+    remove - O(1), top(N) - O((N + выброшенные) log n).
+    """
+
+    def __init__(self):
+        self.__heap: List[Tuple[int, int, int]] = []
+        self.__courses: Dict[int, Course] = {}
+        self.__sizes: Dict[int, int] = {}
+        self.__versions: Dict[int, int] = {}  # id курса -> версия его актуальной записи в куче
+        self.__next_version = 0
+
+    def add(self, course_id: int, course: Course) -> None:
+        self.__courses[course_id] = course
+        self.__push(course_id, len(course.students))
+
+    def remove(self, course_id: int) -> None:
+        # Запись в куче остается и выбрасывается позже как устаревшая
+        del self.__courses[course_id]
+        del self.__sizes[course_id]
+        del self.__versions[course_id]
+        self.__compact()
+
+    def update(self, course_id: int) -> None:
+        size = len(self.__courses[course_id].students)
+        if size != self.__sizes[course_id]:
+            self.__push(course_id, size)
+
+    def top(self, n: int) -> List[Course]:
+        # Снимает с кучи n актуальных записей (устаревшие выбрасываются) и возвращает их обратно
+        heap, versions = self.__heap, self.__versions
+        taken: List[Tuple[int, int, int]] = []
+        while heap and len(taken) < n:
+            entry = heappop(heap)
+            if versions.get(entry[1]) == entry[2]:
+                taken.append(entry)
+        for entry in taken:
+            heappush(heap, entry)
+        return [self.__courses[course_id] for _, course_id, _ in taken]
+
+    def __len__(self) -> int:
+        return len(self.__courses)
+
+    def __push(self, course_id: int, size: int) -> None:
+        version = self.__next_version
+        self.__next_version += 1
+        self.__sizes[course_id] = size
+        self.__versions[course_id] = version
+        heappush(self.__heap, (-size, course_id, version))
+        self.__compact()
+
+    def __compact(self) -> None:
+        # Перестраивает кучу только из актуальных записей, когда устаревших больше живых:
+        # O(n) на каждые ~n изменений
+        if len(self.__heap) > 2 * len(self.__courses) + 64:
+            versions = self.__versions
+            self.__heap = [entry for entry in self.__heap if versions.get(entry[1]) == entry[2]]
+            heapify(self.__heap)
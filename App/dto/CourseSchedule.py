@@ -0,0 +1,164 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from App.dto.course.Course import Course
+from App.exceptions import InvalidDateError
+
+
+# ------ Узел статического центрированного дерева интервалов
+class _IntervalNode:
+    __slots__ = ('center', 'left', 'right', 'starts', 'start_ids', 'ends', 'end_ids')
+
+    def __init__(self, intervals: List[Tuple[int, int, int]]):
+        # intervals - (начало, конец, id курса) в днях от начала эры, начало <= конец
+        # Центр - медиана середин интервалов (для больших узлов - по равномерной выборке)
+        sample = intervals if len(intervals) <= 512 else intervals[::len(intervals) // 256]
+        midpoints = sorted((start + end) // 2 for start, end, _ in sample)
+        self.center = center = midpoints[len(midpoints) // 2]
+        left, right, here = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+        # Интервалы узла содержат center: отсортированы по началу и по концу
+        by_start = sorted((start, course_id) for start, _, course_id in here)
+        by_end = sorted((end, course_id) for _, end, course_id in here)
+        self.starts = [start for start, _ in by_start]
+        self.start_ids = [course_id for _, course_id in by_start]
+        self.ends = [end for end, _ in by_end]
+        self.end_ids = [course_id for _, course_id in by_end]
+        self.left = _IntervalNode(left) if left else None
+        self.right = _IntervalNode(right) if right else None
+
+    def stab(self, day: int, found: List[int]) -> None:
+        # Добавляет в found id интервалов, содержащих day: O(log n + k)
+        node = self
+        while node is not None:
+            if day < node.center:
+                found.extend(node.start_ids[:bisect_right(node.starts, day)])
+                node = node.left
+            elif day > node.center:
+                found.extend(node.end_ids[bisect_left(node.ends, day):])
+                node = node.right
+            else:
+                found.extend(node.start_ids)
+                return
+
+
+# ------ Индекс дат курсов
+class CourseSchedule:
+    """
+    Индекс курсов по датам проведения.
+
+    Начала курсов лежат в отсортированном списке - для курсов, начинающихся
+    в интервале дат. Для "курс идет в этот день" используется центрированное
+    дерево интервалов; оно статическое, поэтому добавленные и измененные
+    курсы сначала попадают в небольшой буфер (проверяется перебором),
+    а удаленные помечаются. Когда буфер и пометки вырастают до ~sqrt(n),
+    дерево перестраивается при следующем запросе.
+
+    Пересечение с интервалом [a, b] = курсы, идущие в день a, плюс курсы,
+    начинающиеся в (a, b]. Результаты возвращаются в порядке id курса.
+
+    Реальная стоимость (n курсов, k найденных):
+      - add/remove/update: O(log n) поиск и O(n) сдвиг списка начал
+        (memmove, на 10^5 курсов - микросекунды), плюс амортизированная
+        доля перестроек дерева O(sqrt(n) log n);
+      - active_on: O(log n + sqrt(n) + k log k) - спуск по дереву,
+        перебор буфера (до ~sqrt(n) записей) и сортировка результата;
+      - overlapping: то же плюс O(log n) на курсы, начинающиеся в (a, b];
+      - starting_between: O(log n + k log k);
+      - запрос, после которого буфер превысил порог, перестраивает дерево
+        за O(n log n).
+    Гарантии O(log n + k) на запрос без перебора буфера здесь нет.
+    """
+
+    def __init__(self, courses: Iterable[Tuple[int, Course]] = ()):
+        # courses - пары (id курса, курс) для построения индекса за один проход
+        self.__courses: Dict[int, Course] = dict(courses)
+        self.__intervals: Dict[int, Tuple[int, int]] = {  # id курса -> (начало, конец)
+            course_id: (course.start_date.toordinal(), course.end_date.toordinal())
+            for course_id, course in self.__courses.items()
+        }
+        # (начало, id курса), по возрастанию
+        self.__starts: List[Tuple[int, int]] = sorted((start, course_id) for course_id, (start, _) in self.__intervals.items())
+        self.__tree: Optional[_IntervalNode] = None
+        self.__in_tree: Dict[int, Tuple[int, int]] = {}  # интервалы, по которым построено дерево
+        self.__pending: Dict[int, Tuple[int, int]] = dict(self.__intervals)  # добавлены или изменены после постройки дерева
+        self.__stale: Set[int] = set()  # удалены или изменены после постройки дерева
+
+    # --------- Изменения (вызываются каталогом)
+    def add(self, course_id: int, course: Course) -> None:
+        interval = (course.start_date.toordinal(), course.end_date.toordinal())
+        self.__courses[course_id] = course
+        self.__intervals[course_id] = interval
+        insort(self.__starts, (interval[0], course_id))
+        self.__pending[course_id] = interval
+
+    def remove(self, course_id: int) -> None:
+        start, _ = self.__intervals.pop(course_id)
+        del self.__courses[course_id]
+        del self.__starts[bisect_left(self.__starts, (start, course_id))]
+        self.__pending.pop(course_id, None)
+        if course_id in self.__in_tree:
+            self.__stale.add(course_id)
+
+    def update(self, course_id: int) -> None:
+        # Вызывается после изменения start_date/end_date курса
+        course = self.__courses[course_id]
+        if (course.start_date.toordinal(), course.end_date.toordinal()) != self.__intervals[course_id]:
+            self.remove(course_id)
+            self.add(course_id, course)
+
+    def __len__(self) -> int:
+        return len(self.__intervals)
+
+    # --------- Дерево интервалов
+    def __refresh_tree(self) -> None:
+        changes = len(self.__pending) + len(self.__stale)
+        if self.__tree is not None and changes * changes <= max(len(self.__intervals), 4096):
+            return
+        if self.__tree is None and not changes:
+            return
+        self.__in_tree = dict(self.__intervals)
+        items = [(start, end, course_id) for course_id, (start, end) in self.__in_tree.items()]
+        self.__tree = _IntervalNode(items) if items else None
+        self.__pending.clear()
+        self.__stale.clear()
+
+    def __stab(self, day: int) -> List[int]:
+        self.__refresh_tree()
+        found: List[int] = []
+        if self.__tree is not None:
+            self.__tree.stab(day, found)
+            if self.__stale:
+                found = [course_id for course_id in found if course_id not in self.__stale]
+        found.extend(course_id for course_id, (start, end) in self.__pending.items() if start <= day <= end)
+        return found
+
+    def __starting(self, first: int, last: int) -> List[int]:
+        low = bisect_left(self.__starts, (first, -1))
+        high = bisect_left(self.__starts, (last + 1, -1))
+        return [course_id for _, course_id in self.__starts[low:high]]
+
+    def __courses_by_ids(self, course_ids: Iterable[int]) -> List[Course]:
+        return [self.__courses[course_id] for course_id in sorted(course_ids)]
+
+    # --------- Запросы
+    def active_on(self, day: date) -> List[Course]:
+        return self.__courses_by_ids(self.__stab(day.toordinal()))
+
+    def overlapping(self, start: date, end: date) -> List[Course]:
+        if end < start:
+            raise InvalidDateError("Дата окончания интервала не может быть раньше даты начала")
+        first, last = start.toordinal(), end.toordinal()
+        # Курсы, идущие в день start, и курсы, начинающиеся позже start, но не позже end
+        return self.__courses_by_ids(self.__stab(first) + self.__starting(first + 1, last))
+
+    def starting_between(self, first: date, last: date) -> List[Course]:
+        if last < first:
+            raise InvalidDateError("Дата окончания интервала не может быть раньше даты начала")
+        return self.__courses_by_ids(self.__starting(first.toordinal(), last.toordinal()))
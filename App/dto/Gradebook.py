@@ -0,0 +1,73 @@
+from typing import Dict, List
+from App.decorators import check_permissions
+from App.dto.ProgressAssessors import ProgressAssessor
+
+
+# ------ Инкрементальный журнал оценок курса
+class Gradebook:
+    """
+    Хранит для каждого студента уже нормализованные оценщиком курса
+    оценки и их текущую сумму, поэтому средний балл доступен за O(1).
+
+    Средние совпадают с полным пересчетом через assess_progress
+    по тем же оценкам в том же порядке.
+    """
+
+    def __init__(self, assessor: ProgressAssessor):
+        self.__assessor = assessor
+        self.__grades: Dict[str, List[float]] = {}  # исходные оценки студента
+        self.__totals: Dict[str, float] = {}  # сумма нормализованных оценок
+
+    @check_permissions('assess_progress')
+    def add_grade(self, student: str, value: float) -> None:
+        # Добавляет оценку: валидация и нормализация как в assess_progress
+        normalized = self.__normalize(student, value)
+        if student in self.__grades:
+            self.__grades[student].append(value)
+            self.__totals[student] += normalized
+        else:
+            self.__grades[student] = [value]
+            self.__totals[student] = normalized
+
+    @check_permissions('assess_progress')
+    def remove_grade(self, student: str, value: float) -> None:
+        # Удаляет одну оценку; сумма пересчитывается только по этому студенту
+        grades = self.__grades.get(student)
+        if not grades or value not in grades:
+            raise ValueError(f"Оценка {value} не найдена у студента {student}")
+        grades.remove(value)
+        if not grades:
+            del self.__grades[student]
+            del self.__totals[student]
+            return
+        transform = self.__assessor.transform_grade
+        self.__totals[student] = sum(transform(student, grade) for grade in grades)
+
+    def average(self, student: str) -> float:
+        if student not in self.__grades:
+            raise ValueError(f"Нет оценок у студента {student}")
+        average = self.__totals[student] / len(self.__grades[student])
+        return self.__assessor.apply_assessment({student: average})[student]
+
+    def averages(self) -> Dict[str, float]:
+        # Текущие итоговые баллы: {студент: средний_балл}
+        student_averages = {
+            student: self.__totals[student] / len(grades)
+            for student, grades in self.__grades.items()
+        }
+        return self.__assessor.apply_assessment(student_averages)
+
+    def grades(self) -> Dict[str, List[float]]:
+        # Копия исходных оценок, пригодная для assess_progress
+        return {student: list(grades) for student, grades in self.__grades.items()}
+
+    def __len__(self) -> int:
+        return len(self.__grades)
+
+    def __contains__(self, student: str) -> bool:
+        return student in self.__grades
+
+    def __normalize(self, student: str, value: float) -> float:
+        if value < 0:
+            raise ValueError(f"Отрицательная оценка {value} у студента {student}")
+        return self.__assessor.transform_grade(student, value)
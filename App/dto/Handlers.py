@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
 # Класс для представления запроса на изменение
 class ChangeRequest:
@@ -9,12 +9,36 @@ class ChangeRequest:
         self.requester = requester # кто запросил
         self.approved = False # был ли запрос одобрен
         self.approved_by = None # какой обработчик одобрил
+        self.request_id = None # номер запроса в очереди ChangeRequestQueue (если он туда поставлен)
 
 # Абстракный класс обработчика
 class Handler(ABC):
+    # Типы изменений, которые одобряет обработчик (None - любые); по ним строится CompiledHandlerChain.
+    # Учитываются, только если объявлены в том же классе, что и can_handle, или в его потомке -
+    # иначе скомпилированная цепочка спрашивает can_handle (см. declares_change_types)
+    change_types: Optional[Tuple[str, ...]] = ()
+    approver = None # кто одобряет (записывается в request.approved_by)
+
     def __init__(self, successor = None):
         self._successor = successor # следующий обработчик в цепочке
 
+    @property
+    def successor(self):
+        return self._successor
+
+    def declares_change_types(self) -> bool:
+        # True, если change_types описывают именно ту can_handle, которая будет вызвана
+        if 'change_types' in vars(self):
+            return True
+        mro = type(self).__mro__
+        types_owner = next(cls for cls in mro if 'change_types' in vars(cls))
+        handle_owner = next(cls for cls in mro if 'can_handle' in vars(cls))
+        return types_owner is not Handler and mro.index(types_owner) <= mro.index(handle_owner)
+
+    def approve(self, request: ChangeRequest) -> None: # отмечает запрос одобренным без вывода в консоль
+        request.approved = True
+        request.approved_by = self.approver
+
     @abstractmethod
     def can_handle(self, request: ChangeRequest) -> bool: # проверяет, может ли этот обработчик решить запрос
         pass
@@ -23,14 +47,16 @@ class Handler(ABC):
         pass
 
 class InstructorHandler(Handler): #Обработчик преподавателя, он может одобрить изменения в материалах
+    change_types = ("materials",)
+    approver = "Instructor"
+
     def can_handle(self, request: ChangeRequest) -> bool:
         return request.change_type == "materials"
 
     def handle_request(self, request: ChangeRequest) -> bool:
         if self.can_handle(request):
             print(f"Преподаватель одобрил изменения в материалх от {request.requester}")
-            request.approved = True
-            request.approved_by = "Instructor"
+            self.approve(request)
             return True
         elif self._successor: # Если есть следующий обработчик
             return self._successor.handle_request(request) # Передаем далее другому обработчику
@@ -38,27 +64,128 @@ class InstructorHandler(Handler): #Обработчик преподавател
 
 
 class MethodologyDepartmentHandler(Handler):  # Обработчик методического отдела, он может одобрить изменения в структуре
+    change_types = ("structure",)
+    approver = "MethodologyDepartment"
+
     def can_handle(self, request: ChangeRequest) -> bool:
         return request.change_type == "structure"
 
     def handle_request(self, request: ChangeRequest) -> bool:
         if self.can_handle(request):
             print(f"Методический отдел одобрил изменения в структуре от {request.requester}")
-            request.approved = True
-            request.approved_by = "MethodologyDepartment"
+            self.approve(request)
             return True
         elif self._successor:  # Если есть следующий обработчик
             return self._successor.handle_request(request)  # Передаем далее другому обработчику
         return False  # Никто не можеть одобрить изменения
 
 class ManagementHandler(Handler):  # Обработчик руководства, оно может одобрить изменения в материалах
+    change_types = None
+    approver = "Management"
+
     def can_handle(self, request: ChangeRequest) -> bool:
         return True # Может одобрить все
 
     def handle_request(self, request: ChangeRequest) -> bool:
         if self.can_handle(request):
             print(f"Руководство одобрило изменения от {request.requester}")
-            request.approved = True
-            request.approved_by = "Management"
+            self.approve(request)
             return True
-        return False  # Никто не можеть одобрить изменения
\ No newline at end of file
+        return False  # Никто не можеть одобрить изменения
+
+
+# Итог пакетной обработки запросов
+class ApprovalSummary:
+    def __init__(self):
+        self.total = 0
+        self.approved = 0
+        self.by_approver: Dict[str, int] = {} # сколько запросов одобрил каждый обработчик
+        self.by_type: Dict[str, int] = {} # сколько запросов пришло каждого типа
+        self.rejected: List[ChangeRequest] = [] # запросы, которые никто не может одобрить
+
+    def merge(self, other: 'ApprovalSummary') -> None: # добавляет итоги другого пакета
+        self.total += other.total
+        self.approved += other.approved
+        for name, count in other.by_approver.items():
+            self.by_approver[name] = self.by_approver.get(name, 0) + count
+        for change_type, count in other.by_type.items():
+            self.by_type[change_type] = self.by_type.get(change_type, 0) + count
+        self.rejected.extend(other.rejected)
+
+    def __str__(self) -> str:
+        approvers = ", ".join(f"{name}: {count}" for name, count in self.by_approver.items())
+        return f"Обработано {self.total} запросов, одобрено {self.approved} ({approvers}), отклонено {len(self.rejected)}"
+
+
+# Скомпилированная цепочка: обход цепочки выполняется один раз при создании,
+# дальше обработчик для запроса находится по словарю change_type -> обработчик.
+# Начиная с первого обработчика без объявленных change_types (например, подкласса,
+# переопределившего только can_handle) цепочка обходится как обычно - через can_handle
+class CompiledHandlerChain:
+    def __init__(self, head: Handler):
+        self.__dispatch: Dict[str, Handler] = {}
+        self.__fallback: Optional[Handler] = None
+        self.__dynamic: Optional[Handler] = None # начало части цепочки, которая проверяется через can_handle
+        handler = head
+        while handler is not None:
+            if not handler.declares_change_types():
+                self.__dynamic = handler
+                break
+            if handler.change_types is None: # обработчик одобряет все - дальше по цепочке запросы не дойдут
+                self.__fallback = handler
+                break
+            for change_type in handler.change_types:
+                self.__dispatch.setdefault(change_type, handler) # первый в цепочке обработчик имеет приоритет
+            handler = handler.successor
+
+    def handler_for(self, change_type: str) -> Optional[Handler]:
+        # Обработчик по одному типу; если в цепочке есть обработчики без change_types,
+        # ответ зависит от самого запроса - используйте handler_for_request
+        return self.__dispatch.get(change_type, self.__fallback)
+
+    def handler_for_request(self, request: ChangeRequest) -> Optional[Handler]:
+        handler = self.__dispatch.get(request.change_type)
+        if handler is not None or self.__dynamic is None:
+            return handler if handler is not None else self.__fallback
+        handler = self.__dynamic
+        while handler is not None:
+            if handler.can_handle(request):
+                return handler
+            handler = handler.successor
+        return None
+
+    def handle(self, request: ChangeRequest) -> bool:
+        handler = self.handler_for_request(request)
+        if handler is None:
+            return False # Никто не можеть одобрить изменения
+        handler.approve(request)
+        return True
+
+    def handle_batch(self, requests: Iterable[ChangeRequest]) -> ApprovalSummary:
+        # Группируем запросы по типу, чтобы искать обработчик один раз на группу
+        groups: Dict[str, List[ChangeRequest]] = {}
+        for request in requests:
+            groups.setdefault(request.change_type, []).append(request)
+
+        summary = ApprovalSummary()
+        for change_type, group in groups.items():
+            summary.total += len(group)
+            summary.by_type[change_type] = len(group)
+            handler = self.__dispatch.get(change_type)
+            if handler is None and self.__dynamic is not None:
+                # Тип не покрыт скомпилированной частью: каждый запрос проверяется через can_handle
+                for request in group:
+                    self.__approve(self.handler_for_request(request), [request], summary)
+                continue
+            self.__approve(handler if handler is not None else self.__fallback, group, summary)
+        return summary
+
+    @staticmethod
+    def __approve(handler: Optional[Handler], group: List[ChangeRequest], summary: ApprovalSummary) -> None:
+        if handler is None:
+            summary.rejected.extend(group)
+            return
+        for request in group:
+            handler.approve(request)
+        summary.approved += len(group)
+        summary.by_approver[handler.approver] = summary.by_approver.get(handler.approver, 0) + len(group)
@@ -1,11 +1,18 @@
 from App.dto.course.Course import Course
 from App.dto.Address import Address
-from typing import List
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Tuple, Type
+import heapq
+import itertools
+import math
+import os
 from App.decorators import check_permissions
 from App.exceptions import CourseNotFoundError  
 from App.dto.course.ProgrammingCourse import ProgrammingCourse
 from App.dto.course.DesignCourse import DesignCourse
 from App.dto.course.ScienceCourse import ScienceCourse
+from App.dto.CourseCatalog import CourseCatalog
+from App.dto.ScheduleConflicts import ScheduleConflict, ScheduleConflictAnalyzer
 import logging
 
 
@@ -13,11 +20,19 @@ platform_logger = logging.getLogger('platform')
 
 # ------------ Класс для списка курсов и методов управления ими
 class Platform:
-    def __init__(self, name: str, address: Address):
+    def __init__(self, name: str, address: Address, maintain_ranking: bool = False):
         self.__name = name
         self.__address = address
-        self.__courses: List["Course"] = []
-        platform_logger.info(f"Создана платформа: {name}")
+        self.__courses = CourseCatalog()
+        if maintain_ranking:
+            self.__courses.enable_ranking()
+        self.__source = None  # ленивый источник записей курсов (например, JSONL-хранилище)
+        self.__loaded = {}  # номер записи в источнике -> уже созданный курс
+        self.__repository = None  # SQLite-хранилище, в которое записываются изменения (save_to_sqlite/open_sqlite)
+        self.__journal = None  # журнал изменений JSON-файла (save_incremental/load_incremental)
+        self.__journal_keys = {}  # id курса в каталоге -> ключ записи в журнале
+        self.__next_journal_key = 1
+        platform_logger.info("Создана платформа: %s", name)
 
     @property
     def name(self) -> str:
@@ -27,78 +42,455 @@ class Platform:
     def address(self) -> Address:
         return self.__address
 
+    # ---------- Ленивый источник курсов
+    def __catalog(self) -> CourseCatalog:
+        # Операции над всем каталогом сначала создают все курсы источника (в его порядке)
+        if self.__source is not None:
+            source, loaded = self.__source, self.__loaded
+            self.__source, self.__loaded = None, {}
+            for index in range(len(source)):
+                course = loaded.get(index)
+                self.__courses.add(course if course is not None else source.load_course(index))
+            source.close()
+        return self.__courses
+
+    def __load_course_at(self, index: int) -> "Course":
+        course = self.__loaded.get(index)
+        if course is None:
+            course = self.__source.load_course(index)
+            self.__loaded[index] = course
+        return course
+
+    def __course_count(self) -> int:
+        if self.__source is not None:
+            return len(self.__source)
+        return len(self.__courses)
+
     #---------- Метод добавления курса на платформу
     @check_permissions('edit_course')
     def add_course(self, course: "Course") -> None:
-        platform_logger.info(f"Добавлен курс '{course.title}' на платформу '{self.__name}'")
-        self.__courses.append(course)
+        if platform_logger.isEnabledFor(logging.INFO):
+            platform_logger.info("Добавлен курс '%s' на платформу '%s'", course.title, self.__name)
+        self.__catalog().add(course)
+        if self.__repository is not None:
+            self.__repository.add_course(course)
 
     # ---------- Метод удаления курса с платформы
     @check_permissions('edit_course')
     def remove_course(self, course: "Course") -> None:
-        if course not in self.__courses:
-            platform_logger.warning(f"Попытка удаления несуществующего курса: {course.title}")
+        if course not in self.__catalog():
+            platform_logger.warning("Попытка удаления несуществующего курса: %s", course.title)
             raise CourseNotFoundError("Курс не найден на платформе")
-        platform_logger.info(f"Удален курс '{course.title}' с платформы '{self.__name}'")
-        self.__courses.remove(course)
+        platform_logger.info("Удален курс '%s' с платформы '%s'", course.title, self.__name)
+        self.__catalog().remove(course)
+        if self.__repository is not None:
+            self.__repository.remove_course(course)
 
-    # --------- Метод получения списка всех курсов
-    def get_courses(self) -> List["Course"]:
-        return self.__courses
+    # ---------- Пакетные операции: одна проверка прав и одна запись в лог на весь пакет
+    @check_permissions('edit_course')
+    def add_courses(self, courses: Iterable["Course"]) -> int:
+        # Принимает любой итерируемый объект, в том числе генератор потокового загрузчика
+        if self.__repository is not None:
+            courses = list(courses)
+        count = self.__catalog().add_many(courses)
+        if self.__repository is not None:
+            self.__repository.add_courses(courses)
+        platform_logger.info("Добавлено курсов на платформу '%s': %d", self.__name, count)
+        return count
+
+    @check_permissions('edit_course')
+    def remove_courses(self, courses: Iterable["Course"]) -> int:
+        if self.__repository is not None:
+            courses = list(courses)
+        try:
+            count = self.__catalog().remove_many(courses)
+        except CourseNotFoundError:
+            platform_logger.warning("Попытка пакетного удаления несуществующего курса")
+            raise
+        if self.__repository is not None:
+            self.__repository.remove_courses(courses)
+        platform_logger.info("Удалено курсов с платформы '%s': %d", self.__name, count)
+        return count
+
+    # --------- Метод получения списка всех курсов (в порядке добавления)
+    def get_courses(self) -> Tuple["Course", ...]:
+        """
+        Курсы платформы в порядке добавления - неизменяемый кортеж.
+
+        Кортеж кешируется каталогом до следующего добавления или удаления
+        курса, поэтому частые вызовы не копируют список. Состав платформы
+        меняется только через add_course(s)/remove_course(s).
+        """
+        return self.__catalog().courses()
+
+    # --------- Обход курсов; в ленивом режиме курсы создаются по мере обхода
+    def __iter__(self):
+        if self.__source is None:
+            return iter(self.__courses.courses())
+        return self.__iter_lazy()
+
+    def __iter_lazy(self):
+        for index in range(self.__course_count()):
+            if self.__source is None:
+                # Каталог был полностью создан во время обхода
+                yield from self.__courses.to_list()[index:]
+                return
+            yield self.__load_course_at(index)
+
+    def __len__(self) -> int:
+        return self.__course_count()
+
+    def __bool__(self) -> bool:
+        # Платформа без курсов - все равно существующий объект: "if platform:" не зависит от len
+        return True
+
+    @property
+    def is_lazy(self) -> bool:
+        return self.__source is not None
+
+    # --------- Поиск курсов по индексам каталога
+    def get_course_id(self, course: "Course") -> int:
+        return self.__catalog().get_id(course)
+
+    def get_course_by_id(self, course_id: int) -> "Course":
+        return self.__catalog().get(course_id)
+
+    def find_courses_by_title(self, title: str) -> List["Course"]:
+        if self.__source is not None:
+            # Кандидаты из индекса источника плюс уже созданные курсы, переименованные в title
+            indices = set(self.__source.find_indices_by_title(title))
+            indices.update(index for index, course in self.__loaded.items() if course.title == title)
+            courses = (self.__load_course_at(index) for index in sorted(indices))
+            return [course for course in courses if course.title == title]
+        return self.__courses.by_title(title)
+
+    def find_courses_by_instructor(self, instructor: str) -> List["Course"]:
+        return self.__catalog().by_instructor(instructor)
+
+    def find_courses_by_type(self, course_class: Type["Course"]) -> List["Course"]:
+        return self.__catalog().by_type(course_class)
+
+    # --------- Поиск по датам проведения (индекс интервалов строится при первом вызове)
+    # Стоимость см. CourseSchedule: запрос - O(log n + sqrt(n) + k log k) с буфером
+    # недавних изменений, изредка перестройка дерева за O(n log n); добавление,
+    # удаление и смена дат курса - O(n) сдвиг отсортированного списка начал
+    def courses_active_on(self, day: date) -> List["Course"]:
+        return self.__catalog().active_on(day)
+
+    def courses_overlapping(self, start: date, end: date) -> List["Course"]:
+        # Курсы, которые идут хотя бы один день в интервале [start, end]
+        return self.__catalog().overlapping(start, end)
+
+    def courses_starting_between(self, first: date, last: date) -> List["Course"]:
+        # O(log n + k log k): бинарный поиск по списку начал и сортировка по id
+        return self.__catalog().starting_between(first, last)
+
+    def courses_for_student(self, student: str) -> List["Course"]:
+        # Обратный индекс студент -> курсы строится при первом вызове и дальше обновляется
+        # при добавлении/удалении курсов и через сеттер students
+        return self.__catalog().by_student(student)
+
+    def schedule_conflicts(self, instructors: bool = True, students: bool = True) -> Iterator[ScheduleConflict]:
+        # Пересечения дат курсов у одного преподавателя и/или студента, выдаются по мере нахождения;
+        # анализ идет по снимку списка курсов на момент вызова
+        analyzer = ScheduleConflictAnalyzer(self.__catalog().to_list())
+        found = []
+        if instructors:
+            found.append(analyzer.instructor_conflicts())
+        if students:
+            found.append(analyzer.student_conflicts())
+        return itertools.chain.from_iterable(found)
+
+    # ---------- Параллельная оценка прогресса по многим курсам
+    @check_permissions('assess_progress')
+    def assess_courses(self, progress_by_course, max_workers: int = None, chunksize: int = None) -> List[Dict[str, float]]:
+        """
+        Оценивает прогресс по многим курсам в пуле процессов.
+
+        progress_by_course - пары (курс, данные прогресса) или словарь с ними.
+        Результаты возвращаются в порядке входа и совпадают с последовательными
+        вызовами assess_progress; первая ошибка (по порядку курсов) пробрасывается.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from App.dto.ProgressAssessors import assess_progress_chunk
+
+        if hasattr(progress_by_course, 'items'):
+            progress_by_course = progress_by_course.items()
+        tasks = [(course.create_progress_assessor(), progress) for course, progress in progress_by_course]
+        if not tasks:
+            return []
+
+        workers = max_workers or os.cpu_count() or 1
+        if chunksize is None:
+            # Несколько пачек на процесс сглаживают разную длительность курсов
+            chunksize = max(1, math.ceil(len(tasks) / (workers * 4)))
+        chunks = [tasks[i:i + chunksize] for i in range(0, len(tasks), chunksize)]
+        platform_logger.info("Оценка прогресса по %d курсам: %d процессов, %d пачек", len(tasks), workers, len(chunks))
+
+        if workers == 1 or len(chunks) == 1:
+            return assess_progress_chunk(tasks)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = []
+            for chunk_results in executor.map(assess_progress_chunk, chunks):
+                results.extend(chunk_results)
+            return results
 
     # ---------- Метод получения топ-N курсов по кол-ву студентов
+    # Порядок (включая равные) совпадает с sorted(..., reverse=True)[:n]
     def get_top_courses(self, n: int) -> List["Course"]:
-        platform_logger.info(f"Получен топ-{n} курсов по количеству студентов")
-        return sorted(self.__courses, key=lambda c: len(c.students), reverse=True)[:n]
+        platform_logger.info("Получен топ-%d курсов по количеству студентов", n)
+        ranking = self.__catalog().ranking
+        if ranking is not None:
+            return ranking.top(n)
+        return heapq.nlargest(n, self.__catalog(), key=lambda c: len(c.students))
+
+    # ---------- Поддерживаемый рейтинг для частых вызовов get_top_courses
+    def enable_top_courses_ranking(self) -> None:
+        self.__catalog().enable_ranking()
+
+    def disable_top_courses_ranking(self) -> None:
+        self.__courses.disable_ranking()
 
     # ---------- Вывод данных платформы в строку
     def __str__(self):
-        return f"Платформа: {self.__name}, Адрес: {self.__address}, Количество курсов: {len(self.__courses)}"
+        return f"Платформа: {self.__name}, Адрес: {self.__address}, Количество курсов: {self.__course_count()}"
     
     def to_dict(self) -> dict:
         return {
             'name': self.__name,
             'address': self.__address.to_dict(),
-            'courses': [course.to_dict() for course in self.__courses]
+            'courses': [course.to_dict() for course in self.__catalog()]
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'Platform':
+    def from_dict(cls, data: dict, lazy: bool = False) -> 'Platform':
         address = Address.from_dict(data['address'])
         platform = cls(
             name=data['name'],
             address=address
         )
         
-        platform._Platform__courses = []
+        platform._Platform__courses.clear()
+
+        if lazy:
+            # Курсы создаются при первом обращении (get_course_by_index, обход и т.д.)
+            from App.serializers import CourseRecordSource
+            platform.__source = CourseRecordSource(data['courses'])
+            return platform
         
         for course_data in data['courses']:
             from App.serializers import JSONSerializer
             course = JSONSerializer._create_course_from_dict(course_data)
-            platform._Platform__courses.append(course)
+            platform._Platform__courses.add(course)
         
         return platform
 
-    def save_to_file(self, filename: str) -> None:
+    def save_to_file(self, filename: str, streaming: bool = False, compact: bool = False) -> None:
         #Сохраняет платформу в файл JSON
+        # streaming: курсы пишутся по одному через буферизованный поток (формат тот же)
+        # compact: без отступов и пробелов
         import json
-        from App.serializers import DateTimeEncoder
+        from App.serializers import DateTimeEncoder, JSONSerializer
+
+        if streaming:
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                JSONSerializer.write_platform_stream(self, f, compact=compact)
+            return
         
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2, cls=DateTimeEncoder)
+            if compact:
+                json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'), cls=DateTimeEncoder)
+            else:
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2, cls=DateTimeEncoder)
 
     @classmethod
-    def load_from_file(cls, filename: str) -> 'Platform':
+    def load_from_file(cls, filename: str, streaming: bool = False, lazy: bool = False) -> 'Platform':
         #Загружает платформу из файла JSON
+        # streaming: курсы разбираются и создаются по одному
+        # lazy: хранятся словари курсов, объекты создаются при первом обращении
         import json
+
+        if streaming:
+            return cls.__load_streaming(filename)
         
         with open(filename, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
-        return cls.from_dict(data)
+        return cls.from_dict(data, lazy=lazy)
+
+    @classmethod
+    def __load_streaming(cls, filename: str) -> 'Platform':
+        # Курсы создаются и добавляются по одному, пока файл читается блоками.
+        # Если courses в файле идет раньше name/address, курсы копятся до появления заголовка.
+        from App.serializers import JSONSerializer
+
+        header = {}
+        platform = None
+        pending = []
+        for key, value in JSONSerializer.iter_platform_file(filename):
+            if key != 'course':
+                header[key] = value
+                continue
+            course = JSONSerializer._create_course_from_dict(value)
+            if platform is None and 'name' in header and 'address' in header:
+                platform = cls(name=header['name'], address=Address.from_dict(header['address']))
+            if platform is None:
+                pending.append(course)
+            else:
+                platform.__courses.add(course)
+
+        if platform is None:
+            platform = cls(name=header['name'], address=Address.from_dict(header['address']))
+        for course in pending:
+            platform.__courses.add(course)
+        return platform
     
+    # ---------- Инкрементальное сохранение: базовый JSON-файл + журнал изменений
+    def save_incremental(self, filename: str, compact_ratio: float = 0.5) -> int:
+        """
+        Дописывает в журнал filename + '.journal' только курсы, добавленные,
+        измененные или удаленные с прошлого сохранения. Первый вызов (или вызов
+        для другого файла) записывает базовый файл целиком. Когда журнал
+        становится больше compact_ratio * размер базового файла, журнал
+        сворачивается в новый базовый файл. Возвращает число записанных записей.
+        """
+        catalog = self.__catalog()
+        journal = self.__journal
+        if journal is None or journal.base_path != filename or not journal.is_current():
+            return self.compact_journal(filename)
+
+        # Изменения и ключи журнала сбрасываются только после успешной записи:
+        # если append упадет (нет места, ошибка ввода-вывода), следующий вызов запишет их снова
+        changed, removed = catalog.peek_changes()
+        entries = []
+        new_keys = {}
+        next_key = self.__next_journal_key
+        for course_id in removed:
+            key = self.__journal_keys.get(course_id)
+            if key is not None:
+                entries.append({'op': 'remove', 'key': key})
+        for course_id, course in changed.items():
+            key = self.__journal_keys.get(course_id)
+            if key is None:
+                key = new_keys[course_id] = next_key
+                next_key += 1
+            entries.append({'op': 'upsert', 'key': key, 'course': course.to_dict()})
+        written = journal.append(entries)
+        for course_id in removed:
+            self.__journal_keys.pop(course_id, None)
+        self.__journal_keys.update(new_keys)
+        self.__next_journal_key = next_key
+        catalog.clear_changes(changed, removed)
+        platform_logger.info("Записано изменений в журнал '%s': %d", journal.path, written)
+
+        if journal.size() > compact_ratio * os.path.getsize(filename):
+            self.compact_journal(filename)
+        return written
+
+    def compact_journal(self, filename: str) -> int:
+        # Переписывает базовый файл целиком (через временный файл) и начинает пустой журнал
+        from App.journal import PlatformJournal
+
+        catalog = self.__catalog()
+        temp_path = filename + '.tmp'
+        self.save_to_file(temp_path, streaming=True)
+        os.replace(temp_path, filename)
+        self.__journal = PlatformJournal(filename)
+        self.__journal.reset()
+        course_ids = catalog.ids()
+        self.__journal_keys = {course_id: key for key, course_id in enumerate(course_ids, start=1)}
+        self.__next_journal_key = len(course_ids) + 1
+        catalog.enable_change_tracking()
+        platform_logger.info("Журнал свернут в базовый файл '%s': %d курсов", filename, len(course_ids))
+        return len(course_ids)
+
+    @classmethod
+    def load_incremental(cls, filename: str) -> 'Platform':
+        # Загружает базовый файл и применяет к нему журнал; устаревший журнал игнорируется
+        import json
+        from App.journal import PlatformJournal
+
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        journal = PlatformJournal(filename)
+        entries = journal.read()
+        if entries is None:
+            return cls.from_dict(data)
+
+        records, next_key = PlatformJournal.replay(data['courses'], entries)
+        data['courses'] = list(records.values())
+        platform = cls.from_dict(data)
+        platform.__journal = journal
+        platform.__journal_keys = dict(zip(platform.__courses.ids(), records))
+        platform.__next_journal_key = next_key
+        platform.__courses.enable_change_tracking()
+        return platform
+
     def get_course_by_index(self, index: int) -> "Course":
-        if index < 0 or index >= len(self.__courses):
-            platform_logger.warning(f"Попытка получения курса по несуществующему индексу: {index}")
+        if index < 0 or index >= self.__course_count():
+            platform_logger.warning("Попытка получения курса по несуществующему индексу: %s", index)
             raise CourseNotFoundError(f"Курс с индексом {index} не найден")
-        return self.__courses[index]
\ No newline at end of file
+        if self.__source is not None:
+            return self.__load_course_at(index)
+        return self.__courses.at(index)
+
+    # ---------- Формат JSON Lines с индексом смещений
+    def save_to_jsonl(self, path: str) -> None:
+        from App.jsonl_storage import JSONLCourseStore
+
+        header = {'name': self.__name, 'address': self.__address.to_dict()}
+        JSONLCourseStore.write(path, header, (course.to_dict() for course in self.__catalog()))
+
+    @classmethod
+    def open_jsonl(cls, path: str) -> 'Platform':
+        # Платформа поверх JSONL: get_course_by_index и find_courses_by_title читают
+        # только нужные записи, остальные операции создают все курсы при первом вызове
+        from App.jsonl_storage import JSONLCourseStore
+
+        store = JSONLCourseStore(path)
+        platform = cls(name=store.name, address=Address.from_dict(store.address))
+        platform.__source = store
+        return platform
+
+    # ---------- Освобождение файлов источника и хранилища
+    def close(self) -> None:
+        # Закрывает ленивый источник (файл и mmap JSONL) и подключенную базу SQLite.
+        # Уже созданные курсы остаются, но курсы источника, которые еще не читались,
+        # после закрытия недоступны - для работы со всеми курсами close не нужен
+        if self.__source is not None:
+            self.__source.close()
+        if self.__repository is not None:
+            self.__repository.close()
+            self.__repository = None
+
+    def __enter__(self) -> 'Platform':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    # ---------- Хранилище SQLite: изменения курсов записываются в базу по мере их появления
+    def save_to_sqlite(self, path: str, compact: bool = False):
+        # Записывает платформу в базу и подключает ее: дальше add/remove и сеттеры курсов
+        # обновляют только затронутые строки
+        from App.sqlite_storage import PlatformRepository
+
+        if self.__repository is not None:
+            self.__repository.close()
+        self.__repository = PlatformRepository(path, compact=compact)
+        self.__repository.save(self)
+        return self.__repository
+
+    @classmethod
+    def open_sqlite(cls, path: str, compact: bool = False) -> 'Platform':
+        from App.sqlite_storage import PlatformRepository
+
+        repository = PlatformRepository(path, compact=compact)
+        platform = repository.load()
+        platform.__repository = repository
+        return platform
+
+    @property
+    def repository(self):
+        # Подключенное SQLite-хранилище (поиск по студенту, датам и т.д. в SQL) или None
+        return self.__repository
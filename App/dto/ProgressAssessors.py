@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для пакетного режима
+    np = None
 
 
 # Общие функции для оценки прогресса
@@ -24,11 +29,103 @@ def calculate_student_averages(progress_data: Dict[str, List[float]]) -> Dict[st
     return student_averages
 
 
+# ------ Матрица оценок для пакетного (векторизованного) режима
+class GradeMatrix:
+    """
+    Дополненная нулями матрица оценок: одна строка на студента.
+
+    counts[i] хранит реальное число оценок в строке i, хвост строки
+    после counts[i] заполнен нулями и в расчетах не участвует.
+    """
+
+    def __init__(self, students: List[str], grades: "np.ndarray", counts: "np.ndarray", rows=None):
+        if np is None:
+            raise ImportError("Для пакетного режима оценки требуется numpy")
+        grades = np.asarray(grades, dtype=np.float64)
+        counts = np.asarray(counts, dtype=np.int64)
+        if grades.ndim != 2 or grades.shape[0] != len(students) or counts.shape != (len(students),):
+            raise ValueError("Размеры матрицы оценок не совпадают со списком студентов")
+        if (counts < 0).any() or (counts > grades.shape[1]).any():
+            raise ValueError("Некорректное число оценок в матрице")
+        self.students = list(students)
+        self.grades = grades
+        self.counts = counts
+        self._rows = rows  # исходные списки, чтобы сообщения об ошибках выводили оценку как есть
+
+    @classmethod
+    def from_rows(cls, students: List[str], rows: Sequence[Sequence[float]]) -> "GradeMatrix":
+        # Строит матрицу из "рваных" списков оценок разной длины
+        if np is None:
+            raise ImportError("Для пакетного режима оценки требуется numpy")
+        counts = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+        width = int(counts.max()) if len(rows) else 0
+        grades = np.zeros((len(rows), width), dtype=np.float64)
+        for i, row in enumerate(rows):
+            if row:
+                grades[i, :len(row)] = row
+        return cls(students, grades, counts, rows)
+
+    @classmethod
+    def from_dict(cls, progress_data: Dict[str, List[float]]) -> "GradeMatrix":
+        return cls.from_rows(list(progress_data.keys()), list(progress_data.values()))
+
+    def valid_mask(self) -> "np.ndarray":
+        # True для реальных оценок, False для дополнения
+        return np.arange(self.grades.shape[1]) < self.counts[:, None]
+
+    def first_invalid(self, invalid: "np.ndarray"):
+        # Первая (в порядке обхода словаря) ячейка с True -> (студент, оценка) или None
+        invalid = invalid & self.valid_mask()
+        if not invalid.any():
+            return None
+        row, col = divmod(int(np.argmax(invalid)), self.grades.shape[1])
+        return self.students[row], self.grade_at(row, col)
+
+    def row_averages(self, normalized: "np.ndarray") -> "np.ndarray":
+        # Суммируем по столбцам слева направо - тот же порядок сложения, что и sum() по списку
+        normalized = np.where(self.valid_mask(), normalized, 0.0)
+        totals = np.zeros(self.grades.shape[0], dtype=np.float64)
+        for col in range(normalized.shape[1]):
+            totals += normalized[:, col]
+        averages = np.zeros_like(totals)
+        nonempty = self.counts > 0
+        averages[nonempty] = totals[nonempty] / self.counts[nonempty]
+        return averages
+
+    def grade_at(self, row: int, col: int) -> float:
+        if self._rows is not None:
+            return self._rows[row][col]
+        return float(self.grades[row, col])
+
+
+def validate_grade_matrix(matrix: GradeMatrix) -> None:
+    # Векторизованный аналог validate_progress_data с теми же сообщениями об ошибках
+    if not matrix.students:
+        raise ValueError("Данные прогресса не могут быть пустыми")
+    negative = matrix.valid_mask() & (matrix.grades < 0)
+    bad_rows = (matrix.counts == 0) | negative.any(axis=1)
+    if not bad_rows.any():
+        return
+    row = int(np.argmax(bad_rows))
+    student = matrix.students[row]
+    if matrix.counts[row] == 0:
+        raise ValueError(f"Нет оценок у студента {student}")
+    col = int(np.argmax(negative[row]))
+    raise ValueError(f"Отрицательная оценка {matrix.grade_at(row, col)} у студента {student}")
+
+
 # Абстрактный класс для шаблонного метода оценки прогресса
 class ProgressAssessor(ABC):
     def __init__(self, course: "Course"):
         self.course = course
 
+    # В другой процесс оценщик передается без курса: для расчета он не нужен,
+    # а курс тянет за собой наблюдателей и всю платформу
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['course'] = None
+        return state
+
     def assess_progress(self, progress_data: Dict[str, List[float]]) -> Dict[str, float]:
         # Возвращает словарь: {студент: средний_балл}
         validate_progress_data(progress_data)  # 1. Валидация
@@ -37,6 +134,59 @@ class ProgressAssessor(ABC):
         final_assessments = self.apply_assessment(student_averages)  # 4. Применение оценки
         return final_assessments
 
+    def assess_progress_batch(self, progress_data) -> Dict[str, float]:
+        """
+        Пакетный режим на numpy: принимает словарь или готовую GradeMatrix,
+        валидирует, нормализует и усредняет за векторизованные проходы.
+        Результат совпадает с assess_progress.
+        """
+        if isinstance(progress_data, GradeMatrix):
+            matrix = progress_data
+        else:
+            if not progress_data:
+                raise ValueError("Данные прогресса не могут быть пустыми")
+            matrix = GradeMatrix.from_dict(progress_data)
+        validate_grade_matrix(matrix)  # 1. Валидация
+        normalized = self.normalize_grade_matrix(matrix)  # 2. Обработка оценок
+        averages = matrix.row_averages(normalized)  # 3. Вычисление средних баллов
+        student_averages = dict(zip(matrix.students, averages.tolist()))
+        return self.apply_assessment(student_averages)  # 4. Применение оценки
+
+    def assess_progress_streaming(self, progress_data: Dict[str, List[float]]) -> Dict[str, float]:
+        """
+        Потоковый режим: валидация, преобразование оценки и накопление
+        суммы/количества за один проход, без промежуточных списков.
+        Списки оценок могут быть любыми итерируемыми объектами.
+        При нескольких ошибках в данных первой может быть выброшена другая
+        ошибка, чем в assess_progress, но тексты сообщений те же.
+        """
+        if not progress_data:
+            raise ValueError("Данные прогресса не могут быть пустыми")
+        transform = self.transform_grade
+        student_averages = {}
+        for student, grades in progress_data.items():
+            total = 0
+            count = 0
+            for grade in grades:
+                if grade < 0:
+                    raise ValueError(f"Отрицательная оценка {grade} у студента {student}")
+                total += transform(student, grade)
+                count += 1
+            if not count:
+                raise ValueError(f"Нет оценок у студента {student}")
+            student_averages[student] = total / count
+        return self.apply_assessment(student_averages)
+
+    # Преобразование одной (уже неотрицательной) оценки для потокового режима
+    @abstractmethod
+    def transform_grade(self, student: str, grade: float) -> float:
+        pass
+
+    # Векторизованная обработка оценок (дополнение матрицы должно оставаться нулевым)
+    @abstractmethod
+    def normalize_grade_matrix(self, matrix: GradeMatrix) -> "np.ndarray":
+        pass
+
     # Обработка оценок
     @abstractmethod
     def process_student_grades(self, progress_data: Dict[str, List[float]]) -> Dict[str, List[float]]:
@@ -48,6 +198,11 @@ class ProgressAssessor(ABC):
         pass
 
 
+# Оценка пачки курсов в процессе-исполнителе: [(оценщик, данные прогресса)] -> [результат]
+def assess_progress_chunk(chunk: List[tuple]) -> List[Dict[str, float]]:
+    return [assessor.assess_progress(progress_data) for assessor, progress_data in chunk]
+
+
 # Конкретные реализации
 class ProgrammingProgressAssessor(ProgressAssessor):
     def process_student_grades(self, progress_data: Dict[str, List[float]]) -> Dict[str, List[float]]:
@@ -67,6 +222,18 @@ class ProgrammingProgressAssessor(ProgressAssessor):
             processed_grades[student] = valid_grades
         return processed_grades
 
+    def normalize_grade_matrix(self, matrix: GradeMatrix) -> "np.ndarray":
+        invalid = matrix.first_invalid(~((matrix.grades >= 0) & (matrix.grades <= 1)))
+        if invalid is not None:
+            student, grade = invalid
+            raise ValueError(f"Некорректная оценка {grade} у студента {student}. Ожидается 0-1")
+        return matrix.grades * 100
+
+    def transform_grade(self, student: str, grade: float) -> float:
+        if grade <= 1:
+            return grade * 100
+        raise ValueError(f"Некорректная оценка {grade} у студента {student}. Ожидается 0-1")
+
     def apply_assessment(self, student_averages: Dict[str, float]) -> Dict[str, float]:
         """
         Для программирования: возвращаем средний балл как есть (уже в процентах)
@@ -90,6 +257,18 @@ class DesignProgressAssessor(ProgressAssessor):
             processed_grades[student] = valid_grades
         return processed_grades
 
+    def normalize_grade_matrix(self, matrix: GradeMatrix) -> "np.ndarray":
+        invalid = matrix.first_invalid(~((matrix.grades >= 0) & (matrix.grades <= 100)))
+        if invalid is not None:
+            student, grade = invalid
+            raise ValueError(f"Некорректная оценка {grade} у студента {student}. Ожидается 0-100")
+        return matrix.grades
+
+    def transform_grade(self, student: str, grade: float) -> float:
+        if grade <= 100:
+            return grade
+        raise ValueError(f"Некорректная оценка {grade} у студента {student}. Ожидается 0-100")
+
     def apply_assessment(self, student_averages: Dict[str, float]) -> Dict[str, float]:
         """
         Для дизайна: возвращаем средний балл как есть (уже в процентах)
@@ -117,6 +296,18 @@ class ScienceProgressAssessor(ProgressAssessor):
             processed_grades[student] = normalized_grades
         return processed_grades
 
+    def normalize_grade_matrix(self, matrix: GradeMatrix) -> "np.ndarray":
+        max_score_per_task = 10  # Максимальный балл за одно задание
+        invalid = matrix.first_invalid(matrix.grades < 0)
+        if invalid is not None:
+            student, grade = invalid
+            raise ValueError(f"Отрицательная оценка {grade} у студента {student}")
+        return np.minimum(matrix.grades, max_score_per_task) / max_score_per_task * 100
+
+    def transform_grade(self, student: str, grade: float) -> float:
+        max_score_per_task = 10  # Максимальный балл за одно задание
+        return min(grade, max_score_per_task) / max_score_per_task * 100
+
     def apply_assessment(self, student_averages: Dict[str, float]) -> Dict[str, float]:
         """
         Для науки: возвращаем средний балл как есть (уже в процентах)
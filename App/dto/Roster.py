@@ -0,0 +1,198 @@
+import logging
+import struct
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from App.dto.StudentSymbols import STUDENT_SYMBOLS
+
+course_logger = logging.getLogger('course')
+
+# До такого размера "студент in roster" и изменения работают перебором массива,
+# словарь номеров создается только для больших списков
+SCAN_LIMIT = 64
+_pack_id = struct.Struct('I').pack
+
+
+# ------ Список студентов курса: упорядоченное множество номеров студентов
+class Roster:
+    """
+    Студенты курса в порядке записи, без повторов.
+
+    Хранятся не строки, а номера из общей таблицы имен STUDENT_SYMBOLS
+    в массиве array('I') (4 байта на запись). Проверка "студент in roster"
+    и запись/отчисление в списке до SCAN_LIMIT студентов - перебор массива;
+    больший список при первой такой операции переводится в словарь номеров
+    (порядок сохраняется, операции становятся O(1)). Имена появляются
+    только при чтении (обход, индекс, to_list). Номера берутся из таблицы
+    со счетчиком ссылок и возвращаются при отчислении и удалении списка.
+
+    Для совместимости с прежним списком студентов поддерживаются append,
+    extend и remove: у списка курса они выполняются через
+    Course.enroll_many/drop_many (проверка прав, уведомления индексов).
+    В отличие от списка повторы не хранятся - отброшенные повторы
+    записываются в лог 'course'.
+    """
+    __slots__ = ('__items', '__ordered', '__owner')
+
+    def __init__(self, students: Iterable[str] = (), owner=None):
+        ids = array('I', STUDENT_SYMBOLS.acquire_many(students))
+        if len(set(ids)) != len(ids):
+            unique = array('I', dict.fromkeys(ids))  # повторы отбрасываются, первый сохраняет позицию
+            course_logger.warning("Повторяющиеся студенты в списке отброшены: %d", len(ids) - len(unique))
+            extra = Counter(ids)
+            extra.subtract(unique)
+            STUDENT_SYMBOLS.release_many(extra.elements())
+            ids = unique
+        self.__items: Union[array, Dict[int, None]] = ids
+        self.__ordered: Optional[array] = None  # кеш для доступа по номеру в режиме словаря
+        self.__owner = owner  # курс, через который идут append/extend/remove
+
+    def __del__(self, release=STUDENT_SYMBOLS.release_many):
+        # release привязан заранее: при завершении интерпретатора глобальные имена модуля уже могут быть очищены
+        try:
+            items = self.__items
+        except AttributeError:  # __init__ не завершился
+            return
+        release(items)
+
+    def __has(self, student_id: Optional[int]) -> bool:
+        items = self.__items
+        if student_id is None:
+            return False
+        if isinstance(items, array):
+            if len(items) <= SCAN_LIMIT:
+                # Поиск байтов номера в копии массива быстрее поэлементного сравнения;
+                # совпадение засчитывается только на границе элемента
+                data, key = items.tobytes(), _pack_id(student_id)
+                position = data.find(key)
+                while position > 0 and position % items.itemsize:
+                    position = data.find(key, position + 1)
+                return position >= 0
+            items = self.__items = dict.fromkeys(items)
+        return student_id in items
+
+    def __ids(self) -> array:
+        # Номера в порядке записи
+        if isinstance(self.__items, array):
+            return self.__items
+        if self.__ordered is None:
+            self.__ordered = array('I', self.__items)
+        return self.__ordered
+
+    # --------- Чтение
+    def __contains__(self, student: str) -> bool:
+        return self.__has(STUDENT_SYMBOLS.find(student))
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __iter__(self) -> Iterator[str]:
+        return map(STUDENT_SYMBOLS.names.__getitem__, self.__items)
+
+    def __getitem__(self, index):
+        ids = self.__ids()
+        if isinstance(index, slice):
+            return [STUDENT_SYMBOLS.name_of(student_id) for student_id in ids[index]]
+        return STUDENT_SYMBOLS.name_of(ids[index])
+
+    def __eq__(self, other) -> bool:
+        # Сравнение по составу и порядку, в том числе со списком или кортежем
+        if isinstance(other, Roster):
+            return len(self) == len(other) and self.__ids() == other.__ids()
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        # Как у списка, который раньше возвращал Course.students
+        return repr(self.to_list())
+
+    def __add__(self, other) -> List[str]:
+        return self.to_list() + list(other)
+
+    def __reduce__(self):
+        # Номера имеют смысл только в таблице своего процесса, поэтому pickle хранит имена
+        return (Roster, (self.to_list(), self.__owner))
+
+    def to_list(self) -> List[str]:
+        return list(self)
+
+    copy = to_list
+
+    def count(self, student: str) -> int:
+        return 1 if student in self else 0
+
+    def index(self, student: str) -> int:
+        student_id = STUDENT_SYMBOLS.find(student)
+        if self.__has(student_id):
+            return self.__ids().index(student_id)
+        raise ValueError(f"Студент {student} не записан")
+
+    def student_ids(self) -> Iterator[int]:
+        # Номера студентов из STUDENT_SYMBOLS в порядке записи (без перевода в строки)
+        return iter(self.__items)
+
+    # --------- Изменение в стиле списка
+    def append(self, student: str) -> None:
+        self.extend((student,))
+
+    def extend(self, students: Iterable[str]) -> None:
+        students = list(students)
+        if self.__owner is not None:
+            added = self.__owner.enroll_many(students)
+        else:
+            added = len(self._add_many(students))
+        if added != len(students):
+            course_logger.warning("Повторная запись студентов пропущена: %d", len(students) - added)
+
+    def remove(self, student: str) -> None:
+        if student not in self:
+            raise ValueError(f"Студент {student} не записан")
+        if self.__owner is not None:
+            self.__owner.drop_many((student,))
+        else:
+            self._discard_many((student,))
+
+    # --------- Изменение (вызывается курсом после проверки прав)
+    def _detach(self) -> None:
+        # Список заменен сеттером students: дальше он не меняет курс
+        self.__owner = None
+
+    def _add_many(self, students: Iterable[str]) -> Tuple[str, ...]:
+        # Дописывает новых студентов в конец, возвращает действительно добавленных
+        added = []
+        find, acquire = STUDENT_SYMBOLS.find, STUDENT_SYMBOLS.acquire
+        for student in students:
+            if self.__has(find(student)):
+                continue
+            student_id = acquire(student)
+            if isinstance(self.__items, array):
+                self.__items.append(student_id)
+            else:
+                self.__items[student_id] = None
+            added.append(student)
+        if added:
+            self.__ordered = None
+        return tuple(added)
+
+    def _discard_many(self, students: Iterable[str]) -> Tuple[str, ...]:
+        # Удаляет студентов, возвращает действительно удаленных
+        removed = []
+        removed_ids = []
+        find = STUDENT_SYMBOLS.find
+        for student in students:
+            student_id = find(student)
+            if not self.__has(student_id):
+                continue
+            if isinstance(self.__items, array):
+                self.__items.remove(student_id)
+            else:
+                del self.__items[student_id]
+            removed.append(student)
+            removed_ids.append(student_id)
+        if removed:
+            self.__ordered = None
+            STUDENT_SYMBOLS.release_many(removed_ids)
+        return tuple(removed)
@@ -0,0 +1,96 @@
+from datetime import date
+from heapq import heappop, heappush
+from typing import Dict, Iterable, Iterator, List, Tuple
+from App.dto.course.Course import Course
+from App.dto.StudentSymbols import STUDENT_SYMBOLS
+
+
+# ------ Пересечение расписаний двух курсов у одного человека
+class ScheduleConflict:
+    __slots__ = ('kind', 'person', 'first', 'second', 'overlap_start', 'overlap_end')
+
+    def __init__(self, kind: str, person: str, first: Course, second: Course,
+                 overlap_start: date, overlap_end: date):
+        self.kind = kind  # 'instructor' или 'student'
+        self.person = person
+        self.first = first  # курс, который начинается раньше
+        self.second = second
+        self.overlap_start = overlap_start
+        self.overlap_end = overlap_end
+
+    def __repr__(self):
+        return (f"ScheduleConflict({self.kind!r}, {self.person!r}, {self.first.title!r}, {self.second.title!r}, "
+                f"{self.overlap_start.isoformat()}..{self.overlap_end.isoformat()})")
+
+
+def sweep_overlaps(course_indices: List[int], starts: List[int], ends: List[int]) -> Iterator[Tuple[int, int]]:
+    """
+    Пары пересекающихся интервалов одной группы: O(m log m + k).
+
+    Интервалы обходятся по возрастанию начала; в куче лежат еще не
+    закончившиеся (по концу). Каждый новый интервал пересекается со всеми,
+    кто остался в куче после удаления закончившихся до его начала.
+    Даты включительные: курс, заканчивающийся в день начала другого, - пересечение.
+    """
+    course_indices = sorted(course_indices, key=starts.__getitem__)
+    active: List[Tuple[int, int]] = []  # (конец, номер курса)
+    for index in course_indices:
+        start = starts[index]
+        while active and active[0][0] < start:
+            heappop(active)
+        for _, other in active:
+            yield other, index
+        heappush(active, (ends[index], index))
+
+
+# ------ Поиск пересечений расписаний по преподавателям и студентам
+class ScheduleConflictAnalyzer:
+    """
+    Анализирует снимок списка курсов: для каждого преподавателя и каждого
+    студента находит пары его курсов с пересекающимися датами.
+
+    Курсы группируются по человеку за один проход, внутри группы работает
+    заметающая прямая, поэтому общее время O(n log n + k) вместо попарного
+    сравнения. Конфликты выдаются генератором по мере нахождения.
+    """
+
+    def __init__(self, courses: Iterable[Course]):
+        self.__courses = list(courses)
+        self.__starts = [course.start_date.toordinal() for course in self.__courses]
+        self.__ends = [course.end_date.toordinal() for course in self.__courses]
+
+    def __conflicts(self, kind: str, groups: Iterable[Tuple[str, List[int]]]) -> Iterator[ScheduleConflict]:
+        courses, starts, ends = self.__courses, self.__starts, self.__ends
+        for person, course_indices in groups:
+            if len(course_indices) < 2:
+                continue
+            for first, second in sweep_overlaps(course_indices, starts, ends):
+                yield ScheduleConflict(kind, person, courses[first], courses[second],
+                                       date.fromordinal(max(starts[first], starts[second])),
+                                       date.fromordinal(min(ends[first], ends[second])))
+
+    def instructor_conflicts(self) -> Iterator[ScheduleConflict]:
+        groups: Dict[str, List[int]] = {}
+        for index, course in enumerate(self.__courses):
+            groups.setdefault(course.instructor, []).append(index)
+        return self.__conflicts('instructor', groups.items())
+
+    def student_conflicts(self) -> Iterator[ScheduleConflict]:
+        # Группировка по номерам студентов из Roster, без перевода в строки
+        groups: Dict[int, List[int]] = {}
+        for index, course in enumerate(self.__courses):
+            for student_id in course.students.student_ids():
+                group = groups.get(student_id)
+                if group is None:
+                    groups[student_id] = [index]
+                else:
+                    group.append(index)
+        # Имена нужны только студентам минимум с двумя курсами; они получаются сразу,
+        # пока списки курсов снимка держат номера в таблице имен
+        name_of = STUDENT_SYMBOLS.name_of
+        named = [(name_of(student_id), indices) for student_id, indices in groups.items() if len(indices) > 1]
+        return self.__conflicts('student', named)
+
+    def conflicts(self) -> Iterator[ScheduleConflict]:
+        yield from self.instructor_conflicts()
+        yield from self.student_conflicts()
@@ -0,0 +1,88 @@
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+
+# ------ Таблица имен студентов: имя <-> плотный целочисленный id
+class StudentSymbolTable:
+    """
+    Каждое имя студента хранится один раз, списки студентов курсов
+    хранят только его номер (см. Roster).
+
+    Таблица считает ссылки: список студентов берет номер через acquire/
+    acquire_many и возвращает через release_many (при отчислении и при
+    удалении самого списка). Имя, на которое не ссылается ни один список,
+    удаляется, а его номер выдается следующему новому имени, поэтому
+    таблица не растет в процессе, который создает и выбрасывает платформы.
+    """
+
+    def __init__(self):
+        self.__ids: Dict[str, int] = {}
+        self.__names: List[Optional[str]] = []
+        self.__refs = array('I')  # номер -> число ссылок из списков студентов
+        self.__free: List[int] = []  # освобожденные номера
+        # RLock: release_many вызывается из Roster.__del__, а сборщик мусора может
+        # запуститься в этом же потоке внутри acquire
+        self.__lock = threading.RLock()
+
+    def __len__(self) -> int:
+        # Число живых имен
+        return len(self.__ids)
+
+    def acquire(self, name: str) -> int:
+        # Номер имени с увеличением числа ссылок; новое имя получает свободный номер
+        with self.__lock:
+            student_id = self.__ids.get(name)
+            if student_id is None:
+                if self.__free:
+                    student_id = self.__free.pop()
+                    self.__names[student_id] = name
+                else:
+                    student_id = len(self.__names)
+                    self.__names.append(name)
+                    self.__refs.append(0)
+                self.__ids[name] = student_id
+            self.__refs[student_id] += 1
+            return student_id
+
+    def acquire_many(self, names: Iterable[str]) -> List[int]:
+        with self.__lock:
+            ids, refs, acquire = self.__ids, self.__refs, self.acquire
+            result = []
+            for name in names:
+                student_id = ids.get(name)
+                if student_id is None:
+                    student_id = acquire(name)
+                else:
+                    refs[student_id] += 1
+                result.append(student_id)
+            return result
+
+    def release_many(self, student_ids: Iterable[int]) -> None:
+        # Уменьшает число ссылок; имя без ссылок удаляется из таблицы
+        with self.__lock:
+            refs = self.__refs
+            for student_id in student_ids:
+                refs[student_id] -= 1
+                if not refs[student_id]:
+                    del self.__ids[self.__names[student_id]]
+                    self.__names[student_id] = None
+                    self.__free.append(student_id)
+
+    def find(self, name: str) -> Optional[int]:
+        # Номер имени без регистрации нового (None для неизвестного имени)
+        return self.__ids.get(name)
+
+    def name_of(self, student_id: int) -> str:
+        return self.__names[student_id]
+
+    @property
+    def names(self) -> List[Optional[str]]:
+        # Список имен по номерам (только для чтения; у свободных номеров - None)
+        return self.__names
+
+
+# Общая таблица процесса: курсы создаются без ссылки на платформу,
+# поэтому все платформы и курсы процесса используют одну таблицу;
+# имена студентов выброшенных платформ освобождаются по счетчику ссылок
+STUDENT_SYMBOLS = StudentSymbolTable()
@@ -1,3 +1,7 @@
+from typing import Tuple
+from App.permissions import PERMISSION_BITS, ROLE_PERMISSIONS
+
+
 class User:
     #Класс для представления пользователя системы
     
@@ -5,22 +9,34 @@ class User:
         self.username = username
         self.role = role  # 'admin', 'instructor', 'assistant', 'student'
         self.email = email
-        self.permissions = self._get_permissions_by_role(role)
+
+    # Права и маска прав пересчитываются только при смене роли из одного списка прав,
+    # поэтому permissions, has_permission и permission_mask не расходятся
+    @property
+    def role(self) -> str:
+        return self.__role
+
+    @role.setter
+    def role(self, value: str):
+        permissions = tuple(self._get_permissions_by_role(value))
+        self.__role = value
+        self.__permissions = permissions
+        self.__permission_set = frozenset(permissions)
+        # Битовая маска для check_permissions: обычный атрибут, чтобы не замедлять проверку прав
+        self.permission_mask = sum(PERMISSION_BITS.get(name, 0) for name in self.__permission_set)
+
+    @property
+    def permissions(self) -> Tuple[str, ...]:
+        return self.__permissions
     
     def _get_permissions_by_role(self, role: str) -> list:
-        permissions_map = {
-            'admin': ['edit_course', 'assess_progress', 'manage_users'],
-            'instructor': ['edit_course', 'assess_progress'],
-            'assistant': ['assess_progress'],
-            'student': []
-        }
-        return permissions_map.get(role, [])
+        return list(ROLE_PERMISSIONS.get(role, ()))
     
     def has_permission(self, permission: str) -> bool:
-        return permission in self.permissions
+        return permission in self.__permission_set
     
     def __str__(self):
         return f"User(username={self.username}, role={self.role})"
     
     def __repr__(self):
-        return self.__str__()
\ No newline at end of file
+        return self.__str__()
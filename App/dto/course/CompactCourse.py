@@ -0,0 +1,49 @@
+from datetime import date
+from functools import lru_cache
+from sys import intern
+from typing import Any, Dict, Iterable, Tuple
+from App.dto.course.Course import Course
+
+
+# Даты курсов повторяются, поэтому объекты date переиспользуются
+@lru_cache(maxsize=None)
+def shared_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def intern_strings(values: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(intern(value) for value in values)
+
+
+# ------ Базовый класс компактных курсов (__slots__, кортежи интернированных строк)
+class CompactCourse(Course):
+    """
+    Компактный вариант курса: нет __dict__, темы хранятся кортежем
+    интернированных строк, преподаватель интернируется (студенты, как и
+    у обычных курсов, хранятся номерами в Roster).
+    Свойства и проверки прав те же, что у Course; списки заменяются
+    только через сеттеры.
+    """
+    __slots__ = ()
+
+    # Имя типа в to_dict - как у обычного класса, чтобы формат файлов не менялся
+    serialized_type = None
+
+    def __init__(self, title: str, start_date: date, end_date: date, instructor: str,
+                 students: Iterable[str], topics: Iterable[str]):
+        super().__init__(title, start_date, end_date, intern(instructor),
+                         students, intern_strings(topics))
+
+    @Course.instructor.setter
+    def instructor(self, value: str):
+        Course.instructor.fset(self, intern(value))
+
+    @Course.topics.setter
+    def topics(self, value: Iterable[str]):
+        Course.topics.fset(self, intern_strings(value))
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data['type'] = self.serialized_type
+        data['topics'] = list(data['topics'])
+        return data
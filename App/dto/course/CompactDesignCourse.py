@@ -0,0 +1,60 @@
+from datetime import date
+from typing import Iterable, Tuple, Dict, Any
+from App.dto.course.CompactCourse import CompactCourse, intern_strings, shared_date
+from App.interfaces import Teachable, Assessable
+from App.mixins import LoggingMixin, NotificationMixin
+from App.notifications import LessonResult
+from App.dto.ProgressAssessors import DesignProgressAssessor
+
+
+# -------- Компактный курс по дизайну
+class CompactDesignCourse(CompactCourse, Teachable, Assessable, LoggingMixin, NotificationMixin):
+    __slots__ = ('__tools',)
+    serialized_type = 'DesignCourse'
+
+    def __init__(self, title: str, start_date: date, end_date: date,
+                 instructor: str, students: Iterable[str], topics: Iterable[str],
+                 tools: Iterable[str]):
+        super().__init__(title, start_date, end_date, instructor, students, topics)
+        self.__tools = intern_strings(tools)
+
+    # -------- геттер для tools
+    @property
+    def tools(self) -> Tuple[str, ...]:
+        return self.__tools
+
+    #  Метод для оценки прогресса
+    def create_progress_assessor(self):
+        return DesignProgressAssessor(self)
+
+    def __str__(self) -> str:
+        tools = ", ".join(self.__tools)
+        return f"Курс дизайна: {self.title}, Преподаватель: {self.instructor}, Инструменты: {tools}"
+
+    def teach(self):
+        self.log_action("Начало лекции по дизайну")
+        handle = self.notify_students("Началась лекция по дизайну")
+        return LessonResult("Объясняю принципы композиции", handle)
+
+    def assess_progress(self, progress: Dict[str, float]):
+        self.log_action("Оценка прогресса студентов")
+        return super().assess_progress(progress)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data.update({
+            'tools': list(self.__tools)
+        })
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactDesignCourse':
+        return cls(
+            title=data['title'],
+            start_date=shared_date(data['start_date']),
+            end_date=shared_date(data['end_date']),
+            instructor=data['instructor'],
+            students=data['students'],
+            topics=data['topics'],
+            tools=data.get('tools', [])
+        )
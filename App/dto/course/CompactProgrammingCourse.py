@@ -0,0 +1,62 @@
+from datetime import date
+from typing import Iterable, Tuple, Dict, Any
+from App.dto.course.CompactCourse import CompactCourse, intern_strings, shared_date
+from App.interfaces import Teachable, Assessable
+from App.mixins import LoggingMixin, NotificationMixin
+from App.notifications import LessonResult
+from App.dto.ProgressAssessors import ProgrammingProgressAssessor
+
+
+#-------- Компактный курс по программированию
+class CompactProgrammingCourse(CompactCourse, Teachable, Assessable, LoggingMixin, NotificationMixin):
+    __slots__ = ('__languages',)
+    serialized_type = 'ProgrammingCourse'
+
+    def __init__(self, title: str, start_date: date, end_date: date,
+                 instructor: str, students: Iterable[str], topics: Iterable[str],
+                 languages: Iterable[str]):
+        super().__init__(title, start_date, end_date, instructor, students, topics)
+        self.__languages = intern_strings(languages)
+
+    #-------- геттер для languages
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return self.__languages
+
+    #  Метод для оценки прогресса
+    def create_progress_assessor(self):
+        return ProgrammingProgressAssessor(self)
+
+    def __str__(self) -> str:
+        langs = ", ".join(self.__languages)
+        return f"Курс программирования: {self.title}, Преподаватель: {self.instructor}, Языки: {langs}"
+
+    def teach(self):
+        self.log_action("Начало лекции")
+        handle = None
+        if self.students:
+            handle = self.notify_students("Началась лекция по алгоритмам")
+        return LessonResult("Провожу лекции по алгоритмам", handle)
+
+    def assess_progress(self, progress: Dict[str, float]):
+        self.log_action("Оценка прогресса студентов")
+        return super().assess_progress(progress)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data.update({
+            'languages': list(self.__languages)
+        })
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactProgrammingCourse':
+        return cls(
+            title=data['title'],
+            start_date=shared_date(data['start_date']),
+            end_date=shared_date(data['end_date']),
+            instructor=data['instructor'],
+            students=data['students'],
+            topics=data['topics'],
+            languages=data.get('languages', [])
+        )
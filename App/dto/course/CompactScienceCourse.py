@@ -0,0 +1,60 @@
+from datetime import date
+from typing import Iterable, Tuple, Dict, Any
+from App.dto.course.CompactCourse import CompactCourse, intern_strings, shared_date
+from App.interfaces import Teachable, Assessable
+from App.mixins import LoggingMixin, NotificationMixin
+from App.notifications import LessonResult
+from App.dto.ProgressAssessors import ScienceProgressAssessor
+
+
+# -------- Компактный курс по науке
+class CompactScienceCourse(CompactCourse, Teachable, Assessable, LoggingMixin, NotificationMixin):
+    __slots__ = ('__field',)
+    serialized_type = 'ScienceCourse'
+
+    def __init__(self, title: str, start_date: date, end_date: date,
+                 instructor: str, students: Iterable[str], topics: Iterable[str],
+                 field: Iterable[str]):
+        super().__init__(title, start_date, end_date, instructor, students, topics)
+        self.__field = intern_strings(field)
+
+    # -------- геттер для field
+    @property
+    def field(self) -> Tuple[str, ...]:
+        return self.__field
+
+    #  Метод для оценки прогресса
+    def create_progress_assessor(self):
+        return ScienceProgressAssessor(self)
+
+    def __str__(self) -> str:
+        fields = ", ".join(self.__field)
+        return f"Курс науки: {self.title}, Преподаватель: {self.instructor}, Области: {fields}"
+
+    def teach(self) -> str:
+        self.log_action("Начало лабораторной работы")
+        handle = self.notify_students("Началась лабораторная работа")
+        return LessonResult("Провожу лабораторные работы", handle)
+
+    def assess_progress(self, progress: Dict[str, float]) -> float:
+        self.log_action("Оценка прогресса студентов")
+        return super().assess_progress(progress)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data.update({
+            'field': list(self.__field)
+        })
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactScienceCourse':
+        return cls(
+            title=data['title'],
+            start_date=shared_date(data['start_date']),
+            end_date=shared_date(data['end_date']),
+            instructor=data['instructor'],
+            students=data['students'],
+            topics=data['topics'],
+            field=data.get('field', [])
+        )
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any
 import logging
+import weakref
 from App.metaclasses import CourseMeta
 from App.dto.ProgressAssessors import ProgressAssessor
+from App.dto.Gradebook import Gradebook
+from App.dto.Roster import Roster
 from App.decorators import check_permissions
 from App.exceptions import InvalidDateError  
 
@@ -12,6 +15,11 @@ course_logger = logging.getLogger('course')
 
 # ------ Абстрактный класс для наследования всеми классами курсов
 class Course(ABC, metaclass=CourseMeta):
+    # Слоты не мешают обычным подклассам (у них остается __dict__),
+    # но позволяют компактным подклассам обходиться без него
+    __slots__ = ('__title', '__start_date', '__end_date', '__instructor', '__students', '__topics',
+                 '__progress_assessor', '__gradebook', '__observers')
+
     def __init__(self, title: str, start_date: date, end_date: date, instructor: str, students: List[str], topics: List[str]):
         if end_date < start_date:
             raise InvalidDateError("Дата окончания курса не может быть раньше даты начала")
@@ -20,22 +28,74 @@ class Course(ABC, metaclass=CourseMeta):
         self.__start_date = start_date
         self.__end_date = end_date
         self.__instructor = instructor
-        self.__students = students
+        self.__students = Roster(students, owner=self)
         self.__topics = topics
         self.__progress_assessor = None
-        course_logger.info(f"Создан курс: {title} с {len(students)} студентами")
+        self.__gradebook = None
+        # Слабые ссылки на наблюдателей (каталог платформы и т.п.), список создается по требованию:
+        # курс, переживший платформу, не держит ее каталог и базу
+        self.__observers = None
+        if course_logger.isEnabledFor(logging.INFO):
+            course_logger.info("Создан курс: %s с %d студентами", title, len(students))
 
     @abstractmethod
     def create_progress_assessor(self) -> ProgressAssessor:
         """Фабричный метод для создания оценщика прогресса"""
         pass
 
+    def __get_progress_assessor(self) -> ProgressAssessor:
+        # Оценщик создается лениво, один раз на курс
+        if self.__progress_assessor is None:
+            self.__progress_assessor = self.create_progress_assessor()
+        return self.__progress_assessor
+
     @check_permissions('assess_progress')
     def assess_progress(self, progress: Dict[str, float]) -> float:
         """Используем шаблонный метод для оценки прогресса"""
-        if self.__progress_assessor is None:
-            self.__progress_assessor = self.create_progress_assessor()
-        return self.__progress_assessor.assess_progress(progress)
+        return self.__get_progress_assessor().assess_progress(progress)
+
+    @check_permissions('assess_progress')
+    def assess_progress_batch(self, progress) -> Dict[str, float]:
+        """Пакетная (numpy) оценка прогресса: словарь или GradeMatrix"""
+        return self.__get_progress_assessor().assess_progress_batch(progress)
+
+    @check_permissions('assess_progress')
+    def assess_progress_streaming(self, progress: Dict[str, List[float]]) -> Dict[str, float]:
+        """Потоковая оценка прогресса за один проход по оценкам"""
+        return self.__get_progress_assessor().assess_progress_streaming(progress)
+
+    @property
+    def gradebook(self) -> Gradebook:
+        """Инкрементальный журнал оценок, нормализованных оценщиком курса"""
+        if self.__gradebook is None:
+            self.__gradebook = Gradebook(self.__get_progress_assessor())
+        return self.__gradebook
+
+    #---------Наблюдатели за изменениями курса
+    def add_observer(self, observer) -> None:
+        if self.__observers is None:
+            self.__observers = []
+        reference = weakref.ref(observer)
+        if reference not in self.__observers:
+            self.__observers.append(reference)
+
+    def remove_observer(self, observer) -> None:
+        # Заодно убирает ссылки на уже удаленных наблюдателей
+        if self.__observers:
+            self.__observers = [reference for reference in self.__observers
+                                if reference() is not None and reference() is not observer] or None
+
+    def __notify(self, field: str, old_value, new_value) -> None:
+        if self.__observers:
+            dead = False
+            for reference in tuple(self.__observers):
+                observer = reference()
+                if observer is None:
+                    dead = True
+                else:
+                    observer.course_changed(self, field, old_value, new_value)
+            if dead:
+                self.__observers = [reference for reference in self.__observers if reference() is not None] or None
 
     #---------Геттеры сеттеры
     @property
@@ -45,8 +105,10 @@ class Course(ABC, metaclass=CourseMeta):
     @title.setter
     @check_permissions('edit_course')
     def title(self, value: str):
-        course_logger.info(f"Изменено название курса: {self.__title} -> {value}")
-        self.__title = value
+        if course_logger.isEnabledFor(logging.INFO):
+            course_logger.info("Изменено название курса: %s -> %s", self.__title, value)
+        old_value, self.__title = self.__title, value
+        self.__notify('title', old_value, value)
 
     @property
     def start_date(self) -> date:
@@ -59,7 +121,8 @@ class Course(ABC, metaclass=CourseMeta):
         # Устанавливает дату начала курса.
         if hasattr(self, '_Course__end_date') and value > self.__end_date:
             raise InvalidDateError("Дата начала курса не может быть позже даты окончания")
-        self.__start_date = value
+        old_value, self.__start_date = self.__start_date, value
+        self.__notify('start_date', old_value, value)
 
     @property
     def end_date(self) -> date:
@@ -73,8 +136,10 @@ class Course(ABC, metaclass=CourseMeta):
             error_msg = f"Дата начала {value} не может быть позже даты окончания {self.__end_date}"
             course_logger.error(error_msg)
             raise InvalidDateError(error_msg)
-        course_logger.info(f"Изменена дата начала курса: {self.__start_date} -> {value}")
-        self.__end_date = value
+        if course_logger.isEnabledFor(logging.INFO):
+            course_logger.info("Изменена дата начала курса: %s -> %s", self.__start_date, value)
+        old_value, self.__end_date = self.__end_date, value
+        self.__notify('end_date', old_value, value)
 
     @property
     def instructor(self) -> str:
@@ -85,19 +150,47 @@ class Course(ABC, metaclass=CourseMeta):
     @check_permissions('edit_course')
     def instructor(self, value: str):
         # Устанавливает имя инструктора.
-        course_logger.info(f"Изменен инструктор курса: {self.__instructor} -> {value}")
-        self.__instructor = value
+        if course_logger.isEnabledFor(logging.INFO):
+            course_logger.info("Изменен инструктор курса: %s -> %s", self.__instructor, value)
+        old_value, self.__instructor = self.__instructor, value
+        self.__notify('instructor', old_value, value)
 
     @property
-    def students(self) -> List[str]:
+    def students(self) -> Roster:
+        # Студенты без копирования; "student in course.students" - O(1),
+        # append/extend/remove работают как enroll_many/drop_many
         return self.__students
     
     @students.setter
     @check_permissions('edit_course')
-    def students(self, value: List[str]):
+    def students(self, value: Iterable[str]):
         # Устанавливает список студентов.
-        course_logger.info(f"Изменен список студентов: {len(self.__students)} -> {len(value)} студентов")
-        self.__students = value
+        value = Roster(value, owner=self)
+        if course_logger.isEnabledFor(logging.INFO):
+            course_logger.info("Изменен список студентов: %d -> %d студентов", len(self.__students), len(value))
+        old_value, self.__students = self.__students, value
+        old_value._detach()
+        self.__notify('students', old_value, value)
+
+    @check_permissions('edit_course')
+    def enroll_many(self, students: Iterable[str]) -> int:
+        """Записывает студентов на курс (уже записанные пропускаются), возвращает число новых"""
+        added = self.__students._add_many(students)
+        if added:
+            if course_logger.isEnabledFor(logging.INFO):
+                course_logger.info("Записано студентов на курс %s: %d", self.__title, len(added))
+            self.__notify('enrolled', None, added)
+        return len(added)
+
+    @check_permissions('edit_course')
+    def drop_many(self, students: Iterable[str]) -> int:
+        """Отчисляет студентов с курса (незаписанные пропускаются), возвращает число отчисленных"""
+        removed = self.__students._discard_many(students)
+        if removed:
+            if course_logger.isEnabledFor(logging.INFO):
+                course_logger.info("Отчислено студентов с курса %s: %d", self.__title, len(removed))
+            self.__notify('dropped', removed, None)
+        return len(removed)
 
     @property
     def topics(self) -> List[str]:
@@ -107,13 +200,16 @@ class Course(ABC, metaclass=CourseMeta):
     @check_permissions('edit_course')
     def topics(self, value: List[str]):
         # Устанавливает список тем курса.
-        course_logger.info(f"Изменен список тем курса: {len(self.__topics)} -> {len(value)} тем")
-        self.__topics = value
+        if course_logger.isEnabledFor(logging.INFO):
+            course_logger.info("Изменен список тем курса: %d -> %d тем", len(self.__topics), len(value))
+        old_value, self.__topics = self.__topics, value
+        self.__notify('topics', old_value, value)
 
     @check_permissions('edit_course')
     def update_course_program(self, new_topics: List[str]):
         """Обновляет программу курса"""
-        course_logger.info(f"Обновлена программа курса: {len(self.__topics)} -> {len(new_topics)} тем")
+        if course_logger.isEnabledFor(logging.INFO):
+            course_logger.info("Обновлена программа курса: %d -> %d тем", len(self.__topics), len(new_topics))
         self.topics = new_topics
 
     # --------- Методы сравнения ---------
@@ -185,7 +281,7 @@ class Course(ABC, metaclass=CourseMeta):
             'start_date': self.__start_date.isoformat(),
             'end_date': self.__end_date.isoformat(),
             'instructor': self.__instructor,
-            'students': self.__students,
+            'students': self.__students.to_list(),
             'topics': self.__topics
         }
 
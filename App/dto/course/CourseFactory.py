@@ -1,21 +1,29 @@
 from App.dto.course.ScienceCourse import ScienceCourse
 from App.dto.course.ProgrammingCourse import ProgrammingCourse
 from App.dto.course.DesignCourse import DesignCourse
+from App.dto.course.CompactProgrammingCourse import CompactProgrammingCourse
+from App.dto.course.CompactDesignCourse import CompactDesignCourse
+from App.dto.course.CompactScienceCourse import CompactScienceCourse
 from datetime import date
 from typing import List
 
 class CourseFactory:
     @staticmethod
     def create_course(course_type: str, title: str, start_date: date, end_date: date, instructor: str, students: List[str], topics: List[str], **kwargs):
+        # compact=True создает слотовый вариант курса с интернированными строками
+        compact = kwargs.get("compact", False)
         if course_type == "programming":
             languages = kwargs.get("languages", ["Python", "Java"])
-            return ProgrammingCourse(title, start_date, end_date, instructor, students, topics, languages)
+            course_class = CompactProgrammingCourse if compact else ProgrammingCourse
+            return course_class(title, start_date, end_date, instructor, students, topics, languages)
         elif course_type == "design":
             tools = kwargs.get("tools", ["Figma", "Photoshop"])
-            return DesignCourse(title, start_date, end_date, instructor, students, topics, tools)
+            course_class = CompactDesignCourse if compact else DesignCourse
+            return course_class(title, start_date, end_date, instructor, students, topics, tools)
         elif course_type == "science":
             field = kwargs.get("field", ["Physics", "Mathematics"])
-            return ScienceCourse(title, start_date, end_date, instructor, students, topics, field)
+            course_class = CompactScienceCourse if compact else ScienceCourse
+            return course_class(title, start_date, end_date, instructor, students, topics, field)
         else:
             return ValueError(f"Неизвестный тип курса: {course_type}")
 
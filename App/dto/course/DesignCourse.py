@@ -1,5 +1,6 @@
 from datetime import date
 from App.mixins import LoggingMixin, NotificationMixin
+from App.notifications import LessonResult
 from App.interfaces import Teachable, Assessable
 from typing import List, Dict, Any
 from App.dto.course.Course import Course
@@ -30,8 +31,8 @@ class DesignCourse(Course, Teachable, Assessable, LoggingMixin, NotificationMixi
         # --- Методы интерфейса ---
     def teach(self):
             self.log_action("Начало лекции по дизайну")
-            self.notify_students("Началась лекция по дизайну")
-            return "Объясняю принципы композиции"
+            handle = self.notify_students("Началась лекция по дизайну")
+            return LessonResult("Объясняю принципы композиции", handle)
 
     def assess_progress(self, progress: Dict[str, float]):
             self.log_action("Оценка прогресса студентов")
@@ -2,6 +2,7 @@ from App.dto.course.Course import Course
 from datetime import date
 from App.interfaces import Teachable, Assessable
 from App.mixins import LoggingMixin, NotificationMixin
+from App.notifications import LessonResult
 from typing import List, Dict, Any
 from App.dto.ProgressAssessors import ProgrammingProgressAssessor
 
@@ -31,9 +32,10 @@ class ProgrammingCourse(Course, Teachable, Assessable, LoggingMixin, Notificatio
     def teach(self):
         self.log_action("Начало лекции")
         students_list = self.students if hasattr(self, 'students') else []
+        handle = None
         if students_list:
-            self.notify_students("Началась лекция по алгоритмам")
-        return "Провожу лекции по алгоритмам"
+            handle = self.notify_students("Началась лекция по алгоритмам")
+        return LessonResult("Провожу лекции по алгоритмам", handle)
 
     def assess_progress(self, progress: Dict[str, float]):
             self.log_action("Оценка прогресса студентов")
@@ -3,6 +3,7 @@ from typing import List, Dict, Any
 from App.dto.course.Course import Course
 from App.interfaces import Teachable, Assessable
 from App.mixins import LoggingMixin, NotificationMixin
+from App.notifications import LessonResult
 from App.dto.ProgressAssessors import ScienceProgressAssessor
 
 # -------- Курс по науке
@@ -30,8 +31,8 @@ class ScienceCourse(Course, Teachable, Assessable, LoggingMixin, NotificationMix
     # --- Методы интерфейсов ---
     def teach(self) -> str:
         self.log_action("Начало лабораторной работы")
-        self.notify_students("Началась лабораторная работа")
-        return "Провожу лабораторные работы"
+        handle = self.notify_students("Началась лабораторная работа")
+        return LessonResult("Провожу лабораторные работы", handle)
 
     def assess_progress(self, progress: Dict[str, float]) -> float:
         self.log_action("Оценка прогресса студентов")
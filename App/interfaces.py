@@ -4,6 +4,8 @@ from typing import Dict
 
 # Интерфейс для процесса обучения курса
 class Teachable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def teach(self):
         """Метод описывает процесс обучения курса"""
@@ -11,6 +13,8 @@ class Teachable(ABC):
 
 # Интерфейс для оценки прогресса студентов
 class Assessable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def assess_progress(self, progress: Dict[str, float]):
         """Метод для оценки прогресса студентов"""
@@ -20,3 +24,17 @@ class Assessable(ABC):
     def create_progress_assessor(self):
         """Фабричный метод для создания оценщика прогресса"""
         pass
+
+# Интерфейс наблюдателя за изменениями курса
+class CourseObserver(ABC):
+    @abstractmethod
+    def course_changed(self, course, field: str, old_value, new_value):
+        """Вызывается сеттерами курса после изменения поля"""
+        pass
+
+# Интерфейс получателя уведомлений (консоль, почта, мессенджер, память для тестов)
+class NotificationSink(ABC):
+    @abstractmethod
+    def send_batch(self, channel: str, notifications):
+        """Доставляет пачку уведомлений одного канала; исключение означает неудачу"""
+        pass
@@ -0,0 +1,115 @@
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from App.serializers import DateTimeEncoder
+
+# Журнал изменений поверх JSON-файла платформы (platform.json + platform.json.journal).
+# Первая строка журнала - заголовок с размером и временем изменения базового файла,
+# дальше по строке на запись:
+#   {"op": "upsert", "key": 7, "course": {...}}  - курс добавлен или изменен
+#   {"op": "remove", "key": 7}                    - курс удален
+# Ключ 1..n - позиция курса в базовом файле, новые курсы получают ключи n+1, n+2, ...
+# Журнал, заголовок которого не совпадает с базовым файлом, считается устаревшим.
+
+JOURNAL_SUFFIX = '.journal'
+
+
+class PlatformJournal:
+    """Журнал изменений (JSON Lines), дописываемый к базовому JSON-файлу платформы"""
+
+    def __init__(self, base_path: str):
+        self.__base_path = base_path
+        self.__path = base_path + JOURNAL_SUFFIX
+
+    @property
+    def base_path(self) -> str:
+        return self.__base_path
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def __base_signature(self) -> List[int]:
+        stat = os.stat(self.__base_path)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def size(self) -> int:
+        return os.path.getsize(self.__path) if os.path.exists(self.__path) else 0
+
+    # --------- Запись
+    def reset(self) -> None:
+        # Начинает пустой журнал для текущего базового файла (вызывается после его перезаписи)
+        header = {'op': 'base', 'base': self.__base_signature()}
+        temp_path = self.__path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.__path)
+
+    def append(self, entries: Iterable[Dict[str, Any]]) -> int:
+        # Дописывает записи и сбрасывает их на диск; возвращает число записей
+        # Запись либо дописывается целиком, либо (при ошибке) журнал обрезается до прежнего
+        # размера: недописанная строка иначе скрыла бы при чтении все следующие записи
+        lines = [json.dumps(entry, ensure_ascii=False, cls=DateTimeEncoder) + '\n' for entry in entries]
+        if lines:
+            data = memoryview(''.join(lines).encode('utf-8'))
+            with open(self.__path, 'ab', buffering=0) as f:  # без буфера: при закрытии нечего дописывать
+                size = f.seek(0, os.SEEK_END)
+                try:
+                    while data:
+                        data = data[f.write(data):]
+                    os.fsync(f.fileno())
+                except BaseException:
+                    try:
+                        f.truncate(size)
+                    except OSError:
+                        pass
+                    raise
+        return len(lines)
+
+    # --------- Чтение
+    def is_current(self) -> bool:
+        # True, если журнал существует и относится к текущему базовому файлу
+        return self.__read_header() is not None
+
+    def __read_header(self) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(self.__path) or not os.path.exists(self.__base_path):
+            return None
+        with open(self.__path, 'r', encoding='utf-8') as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                return None
+        if header.get('op') != 'base' or header.get('base') != self.__base_signature():
+            return None
+        return header
+
+    def read(self) -> Optional[List[Dict[str, Any]]]:
+        # Записи журнала или None, если журнала нет или он устарел.
+        # Недописанная последняя строка (сбой во время записи) пропускается.
+        if self.__read_header() is None:
+            return None
+        entries = []
+        with open(self.__path, 'r', encoding='utf-8') as f:
+            f.readline()
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break
+        return entries
+
+    @staticmethod
+    def replay(base_records: List[Dict[str, Any]], entries: Iterable[Dict[str, Any]]) -> Tuple[Dict[int, Dict[str, Any]], int]:
+        # Применяет журнал к записям базового файла: (ключ -> запись в порядке платформы, следующий свободный ключ)
+        records = {key: record for key, record in enumerate(base_records, start=1)}
+        next_key = len(base_records) + 1
+        for entry in entries:
+            key = entry['key']
+            if entry['op'] == 'upsert':
+                records[key] = entry['course']  # изменение сохраняет позицию, новый ключ - в конец
+            elif entry['op'] == 'remove':
+                records.pop(key, None)
+            next_key = max(next_key, key + 1)
+        return records, next_key
@@ -0,0 +1,170 @@
+import json
+import mmap
+import os
+import weakref
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List
+from App.dto.course.Course import Course
+from App.exceptions import CourseNotFoundError
+from App.serializers import JSONSerializer, DateTimeEncoder
+
+# Формат JSON Lines для курсов платформы:
+#   courses.jsonl            - одна запись Course.to_dict() на строку
+#   courses.jsonl.idx        - смещения начала строк (array('Q'), n + 1 значений)
+#   courses.jsonl.meta.json  - имя и адрес платформы, индекс {название: [номера строк]}
+
+INDEX_SUFFIX = '.idx'
+META_SUFFIX = '.meta.json'
+
+
+class JSONLCourseStore:
+    """
+    Хранилище курсов в формате JSON Lines со вспомогательным индексом смещений.
+
+    Чтение идет через mmap: запись курса по номеру или по названию находится
+    по индексу, и десериализуется только она. Файл и mmap освобождаются
+    close() (или выходом из with), а если хранилище просто забыли -
+    при его сборке мусора.
+    """
+
+    def __init__(self, path: str):
+        self.__path = path
+        with open(path + META_SUFFIX, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        self.__name = meta['name']
+        self.__address = meta['address']
+        self.__titles: Dict[str, List[int]] = meta['titles']
+        self.__offsets = array('Q')
+        with open(path + INDEX_SUFFIX, 'rb') as f:
+            self.__offsets.frombytes(f.read())
+        self.__file = open(path, 'rb')
+        # mmap нельзя создать для пустого файла
+        self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ) if len(self) else None
+        self.__finalizer = weakref.finalize(self, JSONLCourseStore.__release, self.__file, self.__mmap)
+
+    @staticmethod
+    def __release(file, mapped) -> None:
+        if mapped is not None:
+            mapped.close()
+        file.close()
+
+    # --------- Запись
+    @staticmethod
+    def write(path: str, header: Dict[str, Any], course_records: Iterable[Dict[str, Any]]) -> int:
+        # Пишет записи курсов построчно, возвращает число курсов.
+        # header ({'name', 'address'}) читается после записей и может заполняться по ходу чтения.
+        offsets = array('Q', [0])
+        titles: Dict[str, List[int]] = {}
+        with open(path, 'wb', buffering=1 << 20) as f:
+            position = 0
+            for index, record in enumerate(course_records):
+                line = json.dumps(record, ensure_ascii=False, cls=DateTimeEncoder).encode('utf-8') + b'\n'
+                f.write(line)
+                position += len(line)
+                offsets.append(position)
+                titles.setdefault(record['title'], []).append(index)
+        with open(path + INDEX_SUFFIX, 'wb') as f:
+            offsets.tofile(f)
+        with open(path + META_SUFFIX, 'w', encoding='utf-8') as f:
+            meta = {'name': header['name'], 'address': header['address'], 'titles': titles}
+            json.dump(meta, f, ensure_ascii=False)
+        return len(offsets) - 1
+
+    # --------- Чтение
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def address(self) -> Dict[str, Any]:
+        return self.__address
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1
+
+    def get_record(self, index: int) -> Dict[str, Any]:
+        if index < 0 or index >= len(self):
+            raise CourseNotFoundError(f"Курс с индексом {index} не найден")
+        if self.closed:
+            raise ValueError("Хранилище JSONL закрыто")
+        return json.loads(self.__mmap[self.__offsets[index]:self.__offsets[index + 1]])
+
+    def load_course(self, index: int) -> Course:
+        return JSONSerializer._create_course_from_dict(self.get_record(index))
+
+    def find_indices_by_title(self, title: str) -> List[int]:
+        return list(self.__titles.get(title, []))
+
+    def find_courses_by_title(self, title: str) -> List[Course]:
+        return [self.load_course(index) for index in self.__titles.get(title, [])]
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self.get_record(index)
+
+    @property
+    def closed(self) -> bool:
+        return not self.__finalizer.alive
+
+    def close(self) -> None:
+        # Повторный вызов ничего не делает
+        self.__finalizer()
+        self.__mmap = None
+
+    def __enter__(self) -> 'JSONLCourseStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+# ------ Конвертация между platform_data.json и JSON Lines
+def convert_json_to_jsonl(json_path: str, jsonl_path: str) -> int:
+    """Потоково переводит документ платформы в JSONL, возвращает число курсов"""
+    header = {}
+
+    def course_records():
+        for key, value in JSONSerializer.iter_platform_file(json_path):
+            if key == 'course':
+                yield value
+            else:
+                header[key] = value
+
+    # Метаданные пишутся после курсов, поэтому порядок полей в документе не важен
+    return JSONLCourseStore.write(jsonl_path, header, course_records())
+
+
+def convert_jsonl_to_json(jsonl_path: str, json_path: str, compact: bool = False) -> int:
+    """Собирает документ платформы в формате save_to_file из JSONL, возвращает число курсов"""
+    with JSONLCourseStore(jsonl_path) as store, open(json_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        JSONSerializer.write_platform_records(store.name, store.address, store.iter_records(), f, compact=compact)
+        return len(store)
+
+
+def remove_jsonl_files(jsonl_path: str) -> None:
+    for path in (jsonl_path, jsonl_path + INDEX_SUFFIX, jsonl_path + META_SUFFIX):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    # python -m App.jsonl_storage to-jsonl platform_data.json courses.jsonl
+    # python -m App.jsonl_storage to-json courses.jsonl platform_data.json [--compact]
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Конвертация platform_data.json <-> JSON Lines")
+    parser.add_argument('direction', choices=['to-jsonl', 'to-json'])
+    parser.add_argument('source')
+    parser.add_argument('target')
+    parser.add_argument('--compact', action='store_true')
+    args = parser.parse_args()
+
+    if args.direction == 'to-jsonl':
+        count = convert_json_to_jsonl(args.source, args.target)
+    else:
+        count = convert_jsonl_to_json(args.source, args.target, compact=args.compact)
+    print(f"Сконвертировано курсов: {count}")
@@ -1,15 +1,30 @@
 # App/logging_config.py
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 
+# Слушатель очереди и QueueHandler корневого логгера в production-режиме (по одному на процесс)
+_queue_listener = None
+_queue_handler = None
+_atexit_registered = False
 
-def setup_logging():
+
+def setup_logging(production: bool = False, level: int = logging.INFO, console: bool = True):
     """
     Настраивает систему логирования для приложения.
 
-    Логи записываются в файл и выводятся в консоль.
+    Логи записываются в файл и выводятся в консоль. Обработчики корневого
+    логгера, добавленные раньше (например, basicConfig в App/mixins.py),
+    заменяются, чтобы сообщения не дублировались.
+
+    В production-режиме корневой логгер получает только QueueHandler,
+    а запись в файл и консоль выполняет QueueListener в отдельном потоке.
     """
+    global _queue_listener, _queue_handler, _atexit_registered
+
     # Создаем папку для логов если ее нет
     log_dir = "logs"
     if not os.path.exists(log_dir):
@@ -18,29 +33,67 @@ def setup_logging():
     # Формат логов
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
+    formatter = logging.Formatter(log_format, datefmt=date_format)
 
-    # Базовый уровень логирования
-    logging.basicConfig(level=logging.INFO, format=log_format, datefmt=date_format)
+    shutdown_logging()
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+        handler.close()
+    root_logger.setLevel(level)
 
     # Файловый обработчик
     log_filename = f"{log_dir}/educational_platform_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
     file_handler = logging.FileHandler(log_filename, encoding='utf-8')
-    file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
+    file_handler.setLevel(level)
+    file_handler.setFormatter(formatter)
 
     # Консольный обработчик
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
+    console_handler.setLevel(level)
+    console_handler.setFormatter(formatter)
 
-    # Добавляем обработчики к корневому логгеру
-    root_logger = logging.getLogger()
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    handlers = [file_handler, console_handler] if console else [file_handler]
+    if production:
+        # Запись в файл и консоль уходит из потока запроса в поток слушателя
+        log_queue = queue.SimpleQueue()
+        _queue_handler = logging.handlers.QueueHandler(log_queue)
+        root_logger.addHandler(_queue_handler)
+        _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        if not _atexit_registered:
+            atexit.register(shutdown_logging)
+            _atexit_registered = True
+    else:
+        # Добавляем обработчики к корневому логгеру
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # Устанавливаем уровень логирования для разных компонентов
-    logging.getLogger('course').setLevel(logging.INFO)
-    logging.getLogger('platform').setLevel(logging.INFO)
-    logging.getLogger('user').setLevel(logging.INFO)
+    logging.getLogger('course').setLevel(level)
+    logging.getLogger('platform').setLevel(level)
+    logging.getLogger('user').setLevel(level)
+
+    return log_filename
 
-    return log_filename
\ No newline at end of file
+
+def shutdown_logging():
+    """
+    Останавливает слушатель очереди, дописывая накопленные сообщения.
+
+    QueueHandler снимается с корневого логгера, а обработчики слушателя
+    подключаются к нему напрямую: сообщения после остановки пишутся
+    синхронно, а не копятся в очереди, которую уже никто не разбирает.
+    """
+    global _queue_listener, _queue_handler
+    if _queue_listener is None:
+        return
+    root_logger = logging.getLogger()
+    if _queue_handler is not None:
+        root_logger.removeHandler(_queue_handler)
+        _queue_handler.close()
+        _queue_handler = None
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        root_logger.addHandler(handler)
+    _queue_listener = None
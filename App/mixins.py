@@ -4,19 +4,26 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 
 class LoggingMixin:
+    __slots__ = ()
+
     def log_action(self, message: str):
         """Логирование действий курса"""
         if hasattr(self, "title"):
-            logging.info(f"[{self.title}] {message}")
+            logging.info("[%s] %s", self.title, message)
         else:
-            logging.info(f"[Курс без названия] {message}")
+            logging.info("[Курс без названия] %s", message)
 
 class NotificationMixin:
-    def notify_students(self, message: str):
-        """Отправка уведомлений студентам"""
+    __slots__ = ()
+
+    def notify_students(self, message: str, channel: str = 'default'):
+        """
+        Отправка уведомлений студентам через диспетчер уведомлений.
+        Возвращается сразу; доставку можно отследить по DeliveryHandle.
+        """
+        from App.notifications import DeliveryHandle, get_notification_dispatcher
+
         if hasattr(self, "students") and self.students:
-            for student in self.students:
-                # В реальной программе здесь можно сделать отправку email/telegram
-                print(f"Уведомление для {student}: {message}")
-        else:
-            print("Студенты не найдены, уведомления не отправлены")
+            return get_notification_dispatcher().submit(self.students, message, channel)
+        print("Студенты не найдены, уведомления не отправлены")
+        return DeliveryHandle(0)
@@ -0,0 +1,269 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+from App.interfaces import NotificationSink
+
+notification_logger = logging.getLogger('notifications')
+
+
+class Notification:
+    # Одно уведомление студенту
+    __slots__ = ('student', 'message', 'channel')
+
+    def __init__(self, student: str, message: str, channel: str = 'default'):
+        self.student = student
+        self.message = message
+        self.channel = channel
+
+    def __repr__(self):
+        return f"Notification({self.student!r}, {self.message!r}, {self.channel!r})"
+
+
+# ------ Получатели уведомлений
+class PrintSink(NotificationSink):
+    """Печатает уведомления в консоль (поведение по умолчанию)"""
+
+    def send_batch(self, channel: str, notifications: List[Notification]) -> None:
+        print("\n".join(f"Уведомление для {n.student}: {n.message}" for n in notifications))
+
+
+class InMemorySink(NotificationSink):
+    """
+    Сохраняет доставленные уведомления в памяти - для тестов.
+    fail_times: сколько первых вызовов send_batch завершатся ошибкой (проверка повторов).
+    """
+
+    def __init__(self, fail_times: int = 0):
+        self.delivered: Dict[str, List[Notification]] = {}
+        self.batches: List[tuple] = []  # (канал, размер пачки) в порядке доставки
+        self.__fail_times = fail_times
+        self.__lock = threading.Lock()
+
+    def send_batch(self, channel: str, notifications: List[Notification]) -> None:
+        with self.__lock:
+            if self.__fail_times > 0:
+                self.__fail_times -= 1
+                raise ConnectionError("Сбой доставки (имитация)")
+            self.delivered.setdefault(channel, []).extend(notifications)
+            self.batches.append((channel, len(notifications)))
+
+
+# ------ Дескриптор для отслеживания доставки
+class DeliveryHandle:
+    """Счетчики доставки одного вызова notify_students"""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.delivered = 0
+        self.failed = 0
+        self.errors: List[Exception] = []
+        self.__lock = threading.Lock()
+        self.__done = threading.Event()
+        if total == 0:
+            self.__done.set()
+
+    def _record(self, delivered: int = 0, failed: int = 0, error: Exception = None) -> None:
+        with self.__lock:
+            self.delivered += delivered
+            self.failed += failed
+            if error is not None:
+                self.errors.append(error)
+            if self.delivered + self.failed >= self.total:
+                self.__done.set()
+
+    def done(self) -> bool:
+        return self.__done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        # Ждет завершения доставки; True, если все уведомления обработаны
+        return self.__done.wait(timeout)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.done() and self.failed == 0
+
+    def __repr__(self):
+        return f"DeliveryHandle(total={self.total}, delivered={self.delivered}, failed={self.failed})"
+
+
+class LessonResult(str):
+    """Результат teach(): прежняя строка плюс дескриптор доставки уведомлений"""
+
+    def __new__(cls, text: str, notification: Optional[DeliveryHandle] = None):
+        result = super().__new__(cls, text)
+        result.notification = notification
+        return result
+
+
+# ------ Диспетчер: очередь, пачки по каналам, фоновые потоки, повторы
+class NotificationDispatcher:
+    """
+    Принимает задания на рассылку в ограниченную очередь (при переполнении
+    submit ждет - это и есть обратное давление), фоновые потоки забирают
+    задания, группируют уведомления по каналам в пачки до batch_size
+    и передают их получателю. Неудачная пачка повторяется до max_retries
+    раз с экспоненциальной задержкой.
+
+    close() не кладет в очередь блокирующих сигналов остановки: потоки
+    завершаются сами, когда диспетчер закрыт, очередь пуста и ни один
+    submit не находится между проверкой и постановкой задания. Поэтому
+    каждое принятое задание будет доставлено (или отмечено ошибкой).
+    """
+
+    POLL_INTERVAL = 0.2  # как часто простаивающий поток проверяет, не закрыт ли диспетчер
+
+    def __init__(self, sink: NotificationSink, workers: int = 2, batch_size: int = 500,
+                 max_queue: int = 1000, max_retries: int = 3, retry_delay: float = 0.05):
+        self.__sink = sink
+        self.__batch_size = batch_size
+        self.__max_retries = max_retries
+        self.__retry_delay = retry_delay
+        self.__queue = queue.Queue(maxsize=max_queue)
+        self.__lock = threading.Lock()
+        self.__closed = False
+        self.__submitting = 0  # вызовы submit, которые прошли проверку __closed, но еще не положили задание
+        self.__threads = [
+            threading.Thread(target=self.__work, name=f"notifications-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self.__threads:
+            thread.start()
+
+    @property
+    def sink(self) -> NotificationSink:
+        return self.__sink
+
+    def submit(self, students: Iterable[str], message: str, channel: str = 'default',
+               timeout: Optional[float] = None) -> DeliveryHandle:
+        # Ставит рассылку в очередь и сразу возвращает дескриптор
+        notifications = [Notification(student, message, channel) for student in students]
+        handle = DeliveryHandle(len(notifications))
+        if not notifications:
+            return handle
+        with self.__lock:
+            if self.__closed:
+                raise RuntimeError("Диспетчер уведомлений остановлен")
+            self.__submitting += 1
+        try:
+            # Ожидание места в очереди - вне блокировки, чтобы не задерживать close
+            self.__queue.put((notifications, handle), timeout=timeout)
+        finally:
+            with self.__lock:
+                self.__submitting -= 1
+        return handle
+
+    def flush(self) -> None:
+        # Ждет, пока все поставленные задания будут обработаны
+        self.__queue.join()
+
+    def close(self, wait: bool = True) -> None:
+        # wait=False не блокируется: оставшиеся задания потоки доставят в фоне
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+        for _ in self.__threads:
+            try:
+                self.__queue.put_nowait(None)  # только будит простаивающий поток
+            except queue.Full:
+                break  # потоки заняты очередью и сами заметят закрытие
+        if wait:
+            self.flush()
+            for thread in self.__threads:
+                thread.join()
+
+    def __can_stop(self) -> bool:
+        with self.__lock:
+            return self.__closed and not self.__submitting and self.__queue.empty()
+
+    def __work(self) -> None:
+        while True:
+            try:
+                job = self.__queue.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                job = None
+            else:
+                if job is None:
+                    self.__queue.task_done()
+            if job is None:
+                if self.__can_stop():
+                    return
+                continue
+            jobs = [job]
+            # Забираем уже накопившиеся задания, чтобы собрать пачки крупнее
+            while len(jobs) < 64:
+                try:
+                    extra = self.__queue.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is None:
+                    self.__queue.task_done()  # сигнал пробуждения, остановку проверит следующий цикл
+                    continue
+                jobs.append(extra)
+            try:
+                self.__deliver(jobs)
+            finally:
+                for _ in jobs:
+                    self.__queue.task_done()
+
+    def __deliver(self, jobs: List[tuple]) -> None:
+        by_channel: Dict[str, List[tuple]] = {}
+        for notifications, handle in jobs:
+            for notification in notifications:
+                by_channel.setdefault(notification.channel, []).append((notification, handle))
+        for channel, items in by_channel.items():
+            for start in range(0, len(items), self.__batch_size):
+                self.__send_with_retry(channel, items[start:start + self.__batch_size])
+
+    def __send_with_retry(self, channel: str, items: List[tuple]) -> None:
+        batch = [notification for notification, _ in items]
+        error = None
+        for attempt in range(self.__max_retries + 1):
+            try:
+                self.__sink.send_batch(channel, batch)
+                error = None
+                break
+            except Exception as exc:
+                error = exc
+                notification_logger.warning("Ошибка доставки пачки (%s, попытка %d): %s", channel, attempt + 1, exc)
+                if attempt < self.__max_retries:
+                    time.sleep(self.__retry_delay * (2 ** attempt))
+        counts: Dict[int, list] = {}
+        for _, handle in items:
+            counts.setdefault(id(handle), [handle, 0])[1] += 1
+        for handle, count in counts.values():
+            if error is None:
+                handle._record(delivered=count)
+            else:
+                handle._record(failed=count, error=error)
+
+
+# ------ Диспетчер по умолчанию для NotificationMixin
+_default_dispatcher: Optional[NotificationDispatcher] = None
+_default_lock = threading.Lock()
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    global _default_dispatcher
+    with _default_lock:
+        if _default_dispatcher is None:
+            _default_dispatcher = NotificationDispatcher(PrintSink())
+        return _default_dispatcher
+
+
+def set_notification_dispatcher(dispatcher: Optional[NotificationDispatcher]) -> Optional[NotificationDispatcher]:
+    # Подменяет диспетчер (например, на диспетчер с InMemorySink), возвращает прежний
+    global _default_dispatcher
+    with _default_lock:
+        previous, _default_dispatcher = _default_dispatcher, dispatcher
+        return previous
+
+
+@atexit.register
+def _flush_default_dispatcher() -> None:
+    # Доставляем накопленные уведомления перед выходом из программы
+    if _default_dispatcher is not None:
+        _default_dispatcher.close(wait=True)
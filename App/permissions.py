@@ -0,0 +1,37 @@
+# Таблицы прав доступа, построенные один раз при импорте.
+# Каждое право - бит маски, роль - готовая маска и frozenset имен прав.
+
+PERMISSION_BITS = {
+    'edit_course': 1,
+    'assess_progress': 2,
+    'manage_users': 4,
+}
+
+ROLE_PERMISSIONS = {
+    'admin': ('edit_course', 'assess_progress', 'manage_users'),
+    'instructor': ('edit_course', 'assess_progress'),
+    'assistant': ('assess_progress',),
+    'student': (),
+}
+
+ROLE_PERMISSION_SETS = {role: frozenset(names) for role, names in ROLE_PERMISSIONS.items()}
+
+ROLE_MASKS = {
+    role: sum(PERMISSION_BITS[name] for name in names)
+    for role, names in ROLE_PERMISSIONS.items()
+}
+
+# Права, которые разрешены без аутентифицированного пользователя
+ANONYMOUS_PERMISSIONS = frozenset({'edit_course', 'assess_progress'})
+
+
+def mask_for_role(role) -> int:
+    return ROLE_MASKS.get(role, 0)
+
+
+def permission_mask(user) -> int:
+    # У User маска закеширована; для прочих объектов вычисляется по атрибуту role
+    try:
+        return user.permission_mask
+    except AttributeError:
+        return mask_for_role(getattr(user, 'role', None))
@@ -1,10 +1,13 @@
 import json
 from datetime import date
-from typing import Dict, Any, List, Type
+from typing import Dict, Any, List, Type, Iterator, Iterable, Tuple, TextIO
 from App.dto.course.Course import Course
 from App.dto.course.ProgrammingCourse import ProgrammingCourse
 from App.dto.course.DesignCourse import DesignCourse
 from App.dto.course.ScienceCourse import ScienceCourse
+from App.dto.course.CompactProgrammingCourse import CompactProgrammingCourse
+from App.dto.course.CompactDesignCourse import CompactDesignCourse
+from App.dto.course.CompactScienceCourse import CompactScienceCourse
 from App.dto.Platform import Platform
 from App.dto.Address import Address
 
@@ -49,21 +52,214 @@ class JSONSerializer:
         return data
 
     @staticmethod
-    def _create_course_from_dict(data: Dict[str, Any]) -> Course:
-        """Создает конкретный экземпляр курса на основе типа"""
+    def _create_course_from_dict(data: Dict[str, Any], compact: bool = False) -> Course:
+        """Создает конкретный экземпляр курса на основе типа (compact - слотовый вариант)"""
         course_type = data.get('type', 'Course')
         
-        course_classes = {
-            'ProgrammingCourse': ProgrammingCourse,
-            'DesignCourse': DesignCourse,
-            'ScienceCourse': ScienceCourse
-        }
+        if compact:
+            course_classes = {
+                'ProgrammingCourse': CompactProgrammingCourse,
+                'DesignCourse': CompactDesignCourse,
+                'ScienceCourse': CompactScienceCourse
+            }
+        else:
+            course_classes = {
+                'ProgrammingCourse': ProgrammingCourse,
+                'DesignCourse': DesignCourse,
+                'ScienceCourse': ScienceCourse
+            }
         
         if course_type in course_classes:
             return course_classes[course_type].from_dict(data)
         else:
             raise ValueError(f"Неизвестный тип курса: {course_type}")
 
+    @staticmethod
+    def write_platform_stream(platform: Platform, stream: TextIO, compact: bool = False) -> None:
+        """
+        Пишет платформу в поток по одному курсу, не строя platform.to_dict().
+        Без compact результат побайтно совпадает с json.dump(..., indent=2).
+        """
+        course_records = (course.to_dict() for course in platform.get_courses())
+        JSONSerializer.write_platform_records(
+            platform.name, platform.address.to_dict(), course_records, stream, compact=compact
+        )
+
+    @staticmethod
+    def write_platform_records(name: str, address: Dict[str, Any], course_records: Iterable[Dict[str, Any]],
+                               stream: TextIO, compact: bool = False) -> None:
+        """Пишет документ платформы из готовых словарей курсов (формат save_to_file)"""
+        if compact:
+            def encode(obj, level):
+                return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), cls=DateTimeEncoder)
+            open_obj, key_sep, item_sep, close_obj = '{', ':', ',', '}'
+            open_list, close_list, empty_list = '[', ']', '[]'
+            prefix = lambda level: ''
+        else:
+            def encode(obj, level):
+                # В строках JSON нет сырых переводов строк, поэтому сдвиг отступа безопасен
+                text = json.dumps(obj, ensure_ascii=False, indent=2, cls=DateTimeEncoder)
+                return text.replace('\n', '\n' + '  ' * level)
+            open_obj, key_sep, item_sep, close_obj = '{\n', ': ', ',\n', '\n}'
+            open_list, close_list, empty_list = '[\n', '\n  ]', '[]'
+            prefix = lambda level: '  ' * level
+
+        write = stream.write
+        write(open_obj)
+        write(prefix(1) + encode('name', 1) + key_sep + encode(name, 1) + item_sep)
+        write(prefix(1) + encode('address', 1) + key_sep + encode(address, 1) + item_sep)
+        write(prefix(1) + encode('courses', 1) + key_sep)
+        first = True
+        for record in course_records:
+            write(open_list if first else item_sep)
+            write(prefix(2) + encode(record, 2))
+            first = False
+        write(empty_list if first else close_list)
+        write(close_obj)
+
+    @staticmethod
+    def iter_platform_file(filename: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Потоково читает файл платформы: выдает ('course', словарь_курса) для
+        каждого элемента массива courses и (ключ, значение) для остальных полей.
+        В памяти одновременно находится только одна запись курса.
+        """
+        with open(filename, 'r', encoding='utf-8') as f:
+            yield from StreamingJSONReader(f).iter_platform_items()
+
+    @staticmethod
+    def iter_courses_from_file(filename: str) -> Iterator[Course]:
+        """Потоково создает курсы из файла платформы по одному"""
+        for key, value in JSONSerializer.iter_platform_file(filename):
+            if key == 'course':
+                yield JSONSerializer._create_course_from_dict(value)
+
+
+# ------ Ленивый источник курсов из уже прочитанных словарей
+class CourseRecordSource:
+    """
+    Хранит сырые словари курсов и создает объект курса только по запросу.
+    Используется ленивым режимом Platform наравне с JSONLCourseStore.
+    """
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        self.__records = records
+        self.__titles = None  # индекс по названию строится при первом поиске
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
+    def load_course(self, index: int) -> Course:
+        return JSONSerializer._create_course_from_dict(self.__records[index])
+
+    def find_indices_by_title(self, title: str) -> List[int]:
+        if self.__titles is None:
+            self.__titles = {}
+            for index, record in enumerate(self.__records):
+                self.__titles.setdefault(record['title'], []).append(index)
+        return list(self.__titles.get(title, []))
+
+    def close(self) -> None:
+        self.__records = []
+        self.__titles = None
+
+
+# ------ Инкрементальный разбор JSON-документа платформы
+class StreamingJSONReader:
+    """
+    Разбирает верхний уровень документа {"name": ..., "address": ...,
+    "courses": [...]} вручную, а отдельные значения декодирует через
+    json.JSONDecoder.raw_decode по мере чтения файла блоками.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = 1 << 16):
+        self.__stream = stream
+        self.__chunk_size = chunk_size
+        self.__decoder = json.JSONDecoder()
+        self.__buf = ''
+        self.__pos = 0
+        self.__eof = False
+
+    def iter_platform_items(self) -> Iterator[Tuple[str, Any]]:
+        self.__expect('{')
+        if self.__peek() == '}':
+            self.__pos += 1
+            return
+        while True:
+            key = self.__decode_value()
+            if not isinstance(key, str):
+                raise ValueError("Ожидался ключ-строка в JSON платформы")
+            self.__expect(':')
+            if key == 'courses':
+                yield from self.__iter_array('course')
+            else:
+                yield key, self.__decode_value()
+            if self.__next_separator('}'):
+                return
+
+    def __iter_array(self, item_name: str) -> Iterator[Tuple[str, Any]]:
+        self.__expect('[')
+        if self.__peek() == ']':
+            self.__pos += 1
+            return
+        while True:
+            yield item_name, self.__decode_value()
+            if self.__next_separator(']'):
+                return
+
+    def __next_separator(self, closing: str) -> bool:
+        # Съедает ',' (вернет False) или закрывающую скобку (вернет True)
+        char = self.__peek()
+        self.__pos += 1
+        if char == ',':
+            return False
+        if char == closing:
+            return True
+        raise ValueError(f"Некорректный JSON: ожидалось ',' или '{closing}', получено {char!r}")
+
+    def __decode_value(self) -> Any:
+        self.__peek()
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buf, self.__pos)
+            except json.JSONDecodeError:
+                if not self.__fill(len(self.__buf) - self.__pos):
+                    raise
+                continue
+            # Число на границе блока может быть обрезано - дочитываем
+            if end == len(self.__buf) and self.__fill(self.__chunk_size):
+                continue
+            self.__pos = end
+            return value
+
+    def __expect(self, char: str) -> None:
+        found = self.__peek()
+        if found != char:
+            raise ValueError(f"Некорректный JSON: ожидалось {char!r}, получено {found!r}")
+        self.__pos += 1
+
+    def __peek(self) -> str:
+        # Пропускает пробелы и возвращает следующий символ
+        while True:
+            while self.__pos < len(self.__buf) and self.__buf[self.__pos] in ' \t\r\n':
+                self.__pos += 1
+            if self.__pos < len(self.__buf):
+                return self.__buf[self.__pos]
+            if not self.__fill(self.__chunk_size):
+                raise ValueError("Неожиданный конец JSON-файла")
+
+    def __fill(self, size: int) -> bool:
+        # Дочитывает не меньше size символов, отбрасывая уже разобранную часть буфера
+        if self.__eof:
+            return False
+        chunk = self.__stream.read(max(size, self.__chunk_size))
+        if not chunk:
+            self.__eof = True
+            return False
+        self.__buf = self.__buf[self.__pos:] + chunk
+        self.__pos = 0
+        return True
+
 class DateTimeEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, date):
@@ -0,0 +1,315 @@
+import sqlite3
+from contextlib import contextmanager
+from datetime import date
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from App.dto.Address import Address
+from App.dto.course.Course import Course
+from App.interfaces import CourseObserver
+from App.exceptions import CourseNotFoundError
+from App.serializers import JSONSerializer
+
+# Хранилище платформы в SQLite:
+#   platform        - имя и адрес (одна строка)
+#   courses         - поля курса; порядок id = порядок курсов на платформе
+#   course_students - студенты курса (course_id, position, student)
+#   course_topics   - темы курса
+#   course_extras   - список, специфичный для типа курса (см. EXTRA_FIELDS)
+
+# Поле to_dict(), которое хранится в course_extras для каждого типа курса
+EXTRA_FIELDS = {
+    'ProgrammingCourse': 'languages',
+    'DesignCourse': 'tools',
+    'ScienceCourse': 'field',
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS platform (
+    id     INTEGER PRIMARY KEY CHECK (id = 1),
+    name   TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    url    TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS courses (
+    id         INTEGER PRIMARY KEY,
+    type       TEXT NOT NULL,
+    title      TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date   TEXT NOT NULL,
+    instructor TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS course_students (
+    course_id INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    position  INTEGER NOT NULL,
+    student   TEXT    NOT NULL,
+    PRIMARY KEY (course_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS course_topics (
+    course_id INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    position  INTEGER NOT NULL,
+    topic     TEXT    NOT NULL,
+    PRIMARY KEY (course_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS course_extras (
+    course_id INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    position  INTEGER NOT NULL,
+    value     TEXT    NOT NULL,
+    PRIMARY KEY (course_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_courses_title ON courses(title);
+CREATE INDEX IF NOT EXISTS idx_courses_instructor ON courses(instructor);
+CREATE INDEX IF NOT EXISTS idx_courses_type ON courses(type);
+CREATE INDEX IF NOT EXISTS idx_courses_dates ON courses(start_date, end_date);
+"""
+STUDENT_INDEX = "CREATE INDEX IF NOT EXISTS idx_course_students_student ON course_students(student)"
+
+INSERT_COURSE = "INSERT INTO courses (id, type, title, start_date, end_date, instructor) VALUES (?, ?, ?, ?, ?, ?)"
+INSERT_STUDENT = "INSERT INTO course_students (course_id, position, student) VALUES (?, ?, ?)"
+INSERT_TOPIC = "INSERT INTO course_topics (course_id, position, topic) VALUES (?, ?, ?)"
+INSERT_EXTRA = "INSERT INTO course_extras (course_id, position, value) VALUES (?, ?, ?)"
+SELECT_COURSES = "SELECT id, type, title, start_date, end_date, instructor FROM courses"
+
+# Столбцы courses, которые обновляются сеттерами курса
+COLUMN_FIELDS = ('title', 'start_date', 'end_date', 'instructor')
+LIST_TABLES = {
+    'students': ("course_students", INSERT_STUDENT),
+    'topics': ("course_topics", INSERT_TOPIC),
+}
+
+
+class PlatformRepository(CourseObserver):
+    """
+    Репозиторий платформы в SQLite.
+
+    save() пишет платформу целиком пакетными executemany, load() читает ее
+    несколькими запросами. После save/load репозиторий подписан на курсы
+    и записывает в базу только измененное поле измененного курса.
+    Поиск по преподавателю, типу, датам и студенту выполняется в SQL.
+    """
+
+    def __init__(self, path: str, compact: bool = False):
+        self.__path = path
+        self.__compact = compact  # создавать компактные (слотовые) курсы при чтении
+        # isolation_level=None - транзакции открываются явно через BEGIN
+        self.__connection = sqlite3.connect(path, isolation_level=None)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute("PRAGMA foreign_keys=ON")
+        self.__connection.executescript(SCHEMA)
+        self.__connection.execute(STUDENT_INDEX)
+        self.__courses: Dict[int, Course] = {}  # id в базе -> курс
+        self.__ids: Dict[int, int] = {}  # id(course) -> id в базе
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def close(self) -> None:
+        for course in self.__courses.values():
+            course.remove_observer(self)
+        self.__courses.clear()
+        self.__ids.clear()
+        self.__connection.close()
+
+    @contextmanager
+    def __transaction(self):
+        self.__connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.__connection
+        except BaseException:
+            self.__connection.execute("ROLLBACK")
+            raise
+        self.__connection.execute("COMMIT")
+
+    # --------- Запись платформы целиком
+    def save(self, platform) -> int:
+        # Заменяет содержимое базы платформой, возвращает число курсов
+        for course in self.__courses.values():
+            course.remove_observer(self)
+        self.__courses.clear()
+        self.__ids.clear()
+        with self.__transaction() as connection:
+            for table in ("course_students", "course_topics", "course_extras", "courses", "platform"):
+                connection.execute(f"DELETE FROM {table}")
+            # Индекс по студентам быстрее построить один раз после вставки, чем обновлять на каждой строке
+            connection.execute("DROP INDEX IF EXISTS idx_course_students_student")
+            address = platform.address
+            connection.execute("INSERT INTO platform (id, name, domain, url) VALUES (1, ?, ?, ?)",
+                               (platform.name, address.domain, address.url))
+            count = self.__insert_courses(connection, platform.get_courses(), first_id=1)
+            connection.execute(STUDENT_INDEX)
+        return count
+
+    def __insert_courses(self, connection: sqlite3.Connection, courses: Iterable[Course], first_id: int) -> int:
+        course_rows, student_rows, topic_rows, extra_rows = [], [], [], []
+        added: Dict[int, Course] = {}  # id(course) -> курс; записываются после успешной вставки
+        course_id = first_id
+        for course in courses:
+            if id(course) in self.__ids or id(course) in added:
+                continue
+            record = course.to_dict()
+            course_rows.append((course_id, record['type'], record['title'], record['start_date'],
+                                record['end_date'], record['instructor']))
+            student_rows.extend((course_id, i, s) for i, s in enumerate(record['students']))
+            topic_rows.extend((course_id, i, t) for i, t in enumerate(record['topics']))
+            extra_field = EXTRA_FIELDS.get(record['type'])
+            if extra_field is not None:
+                extra_rows.extend((course_id, i, v) for i, v in enumerate(record.get(extra_field, ())))
+            added[id(course)] = course
+            course_id += 1
+        connection.executemany(INSERT_COURSE, course_rows)
+        connection.executemany(INSERT_STUDENT, student_rows)
+        connection.executemany(INSERT_TOPIC, topic_rows)
+        connection.executemany(INSERT_EXTRA, extra_rows)
+        for course_id, course in enumerate(added.values(), start=first_id):
+            self.__track(course_id, course)
+        return len(course_rows)
+
+    def __track(self, course_id: int, course: Course) -> None:
+        self.__courses[course_id] = course
+        self.__ids[id(course)] = course_id
+        course.add_observer(self)
+
+    # --------- Добавление и удаление отдельных курсов
+    def add_courses(self, courses: Iterable[Course]) -> int:
+        with self.__transaction() as connection:
+            next_id = connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM courses").fetchone()[0]
+            return self.__insert_courses(connection, courses, first_id=next_id)
+
+    def add_course(self, course: Course) -> None:
+        self.add_courses([course])
+
+    def remove_courses(self, courses: Iterable[Course]) -> int:
+        course_ids = []
+        for course in courses:
+            course_id = self.__ids.pop(id(course), None)
+            if course_id is not None:
+                del self.__courses[course_id]
+                course.remove_observer(self)
+                course_ids.append((course_id,))
+        with self.__transaction() as connection:
+            # Строки студентов, тем и доп. полей удаляются каскадно
+            connection.executemany("DELETE FROM courses WHERE id = ?", course_ids)
+        return len(course_ids)
+
+    def remove_course(self, course: Course) -> None:
+        self.remove_courses([course])
+
+    # --------- Инкрементальные обновления из сеттеров курса
+    def course_changed(self, course, field: str, old_value, new_value):
+        course_id = self.__ids.get(id(course))
+        if course_id is None:
+            return
+        with self.__transaction() as connection:
+            if field in COLUMN_FIELDS:
+                if isinstance(new_value, date):
+                    new_value = new_value.isoformat()
+                connection.execute(f"UPDATE courses SET {field} = ? WHERE id = ?", (new_value, course_id))
+            elif field in LIST_TABLES:
+                table, insert = LIST_TABLES[field]
+                connection.execute(f"DELETE FROM {table} WHERE course_id = ?", (course_id,))
+                connection.executemany(insert, ((course_id, i, v) for i, v in enumerate(new_value)))
+            elif field == 'enrolled':
+                # Новые студенты дописываются после последней позиции курса
+                first = connection.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM course_students "
+                                           "WHERE course_id = ?", (course_id,)).fetchone()[0]
+                connection.executemany(INSERT_STUDENT, ((course_id, first + i, s) for i, s in enumerate(new_value)))
+            elif field == 'dropped':
+                connection.executemany("DELETE FROM course_students WHERE course_id = ? AND student = ?",
+                                       ((course_id, s) for s in old_value))
+
+    # --------- Чтение
+    def load(self):
+        # Создает платформу со всеми курсами базы; курсы остаются подписанными на репозиторий
+        from App.dto.Platform import Platform
+
+        row = self.__connection.execute("SELECT name, domain, url FROM platform WHERE id = 1").fetchone()
+        if row is None:
+            raise ValueError(f"В базе {self.__path} нет сохраненной платформы")
+        platform = Platform(name=row[0], address=Address(domain=row[1], url=row[2]))
+        platform._Platform__courses.add_many(self.__load_courses(SELECT_COURSES + " ORDER BY id", ()))
+        return platform
+
+    def __load_courses(self, sql: str, params) -> List[Course]:
+        # Курсы, уже созданные репозиторием, возвращаются как есть; для остальных
+        # студенты, темы и доп. поля читаются по одному запросу на таблицу
+        rows = self.__connection.execute(sql, params).fetchall()
+        missing = [row for row in rows if row[0] not in self.__courses]
+        if missing:
+            ids = [row[0] for row in missing]
+            students = self.__load_lists("SELECT course_id, student FROM course_students", ids)
+            topics = self.__load_lists("SELECT course_id, topic FROM course_topics", ids)
+            extras = self.__load_lists("SELECT course_id, value FROM course_extras", ids)
+            for course_id, course_type, title, start_date, end_date, instructor in missing:
+                record: Dict[str, Any] = {
+                    'type': course_type,
+                    'title': title,
+                    'start_date': start_date,
+                    'end_date': end_date,
+                    'instructor': instructor,
+                    'students': students.get(course_id, []),
+                    'topics': topics.get(course_id, []),
+                }
+                extra_field = EXTRA_FIELDS.get(course_type)
+                if extra_field is not None:
+                    record[extra_field] = extras.get(course_id, [])
+                self.__track(course_id, JSONSerializer._create_course_from_dict(record, compact=self.__compact))
+        return [self.__courses[row[0]] for row in rows]
+
+    def __load_lists(self, select: str, course_ids: List[int]) -> Dict[int, List[str]]:
+        if len(course_ids) == self.__connection.execute("SELECT COUNT(*) FROM courses").fetchone()[0]:
+            cursor = self.__connection.execute(select + " ORDER BY course_id, position")
+        else:
+            # Набор id передается через временную таблицу, чтобы не упереться в лимит параметров
+            self.__connection.execute("CREATE TEMP TABLE IF NOT EXISTS wanted_courses (id INTEGER PRIMARY KEY)")
+            self.__connection.execute("DELETE FROM wanted_courses")
+            self.__connection.executemany("INSERT INTO wanted_courses (id) VALUES (?)", ((i,) for i in course_ids))
+            cursor = self.__connection.execute(
+                select + " WHERE course_id IN (SELECT id FROM wanted_courses) ORDER BY course_id, position")
+        return {course_id: [row[1] for row in group] for course_id, group in groupby(cursor, key=itemgetter(0))}
+
+    def __len__(self) -> int:
+        return self.__connection.execute("SELECT COUNT(*) FROM courses").fetchone()[0]
+
+    def get_course(self, course_id: int) -> Course:
+        courses = self.__load_courses(SELECT_COURSES + " WHERE id = ?", (course_id,))
+        if not courses:
+            raise CourseNotFoundError(f"Курс с id {course_id} не найден")
+        return courses[0]
+
+    def get_course_id(self, course: Course) -> int:
+        if id(course) not in self.__ids:
+            raise CourseNotFoundError("Курс не найден в хранилище")
+        return self.__ids[id(course)]
+
+    # --------- Поиск в SQL
+    def find_by_title(self, title: str) -> List[Course]:
+        return self.__load_courses(SELECT_COURSES + " WHERE title = ? ORDER BY id", (title,))
+
+    def find_by_instructor(self, instructor: str) -> List[Course]:
+        return self.__load_courses(SELECT_COURSES + " WHERE instructor = ? ORDER BY id", (instructor,))
+
+    def find_by_type(self, course_type: Union[str, Type[Course]]) -> List[Course]:
+        # Принимает имя типа ('ProgrammingCourse') или класс, в том числе компактный
+        if isinstance(course_type, type):
+            course_type = getattr(course_type, 'serialized_type', None) or course_type.__name__
+        return self.__load_courses(SELECT_COURSES + " WHERE type = ? ORDER BY id", (course_type,))
+
+    def find_by_date_range(self, start: Optional[date] = None, end: Optional[date] = None) -> List[Course]:
+        # Курсы, которые идут хотя бы один день в интервале [start, end]; границы можно опустить.
+        # Даты хранятся в ISO-формате, поэтому сравнение строк совпадает со сравнением дат.
+        conditions, params = [], []
+        if end is not None:
+            conditions.append("start_date <= ?")
+            params.append(end.isoformat())
+        if start is not None:
+            conditions.append("end_date >= ?")
+            params.append(start.isoformat())
+        where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+        return self.__load_courses(SELECT_COURSES + where + " ORDER BY id", params)
+
+    def find_by_student(self, student: str) -> List[Course]:
+        return self.__load_courses(
+            SELECT_COURSES + " WHERE id IN (SELECT course_id FROM course_students WHERE student = ?) ORDER BY id",
+            (student,))
@@ -0,0 +1,53 @@
+import argparse
+import os
+import tempfile
+import time
+from App.change_queue import ChangeRequestQueue, PENDING, PROCESSING
+from App.dto.Handlers import ChangeRequest
+
+# Бенчмарк очереди запросов на изменение в SQLite: постановка в очередь,
+# имитация сбоя обработчика с восстановлением и разбор очереди пулом потоков.
+#
+#   python change_queue_benchmark.py                        # 300 000 запросов
+#   python change_queue_benchmark.py --count 100000 --workers 2 --batch 2000
+
+TYPES = ["materials", "structure", "schedule", "other"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пропускная способность очереди запросов на изменение")
+    parser.add_argument('--count', type=int, default=300_000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--batch', type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        queue = ChangeRequestQueue(os.path.join(directory, 'changes.db'))
+
+        start = time.perf_counter()
+        requests = (ChangeRequest(TYPES[i % len(TYPES)], {'course': f"Course {i % 500}"}, f"user{i % 1000}")
+                    for i in range(args.count))
+        queue.enqueue_many(requests)
+        elapsed = time.perf_counter() - start
+        print(f"   В очередь: {args.count} запросов за {elapsed:.2f} c ({args.count / elapsed:,.0f}/c)")
+
+        # Обработчик "упал" после захвата пачки - записи остались в processing
+        queue.claim_batch(args.batch, 'crashed')
+        print(f"   После сбоя: processing = {queue.count(status=PROCESSING)}")
+        # Других обработчиков нет, поэтому можно вернуть все захваченное без ожидания аренды
+        print(f"   Возвращено в очередь: {queue.recover(stale_after=0)}")
+
+        start = time.perf_counter()
+        summary = queue.process_pending(workers=args.workers, batch_size=args.batch)
+        elapsed = time.perf_counter() - start
+        print(f"   Обработка ({args.workers} потоков, пачки по {args.batch}): {elapsed:.2f} c "
+              f"({summary.total / elapsed:,.0f}/c)")
+        print(f"   {summary}")
+        print(f"   Статусы: {queue.counts_by_status()}")
+        if queue.count(status=PENDING) or summary.total != args.count:
+            raise AssertionError("Очередь обработана не полностью")
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from App.context import as_user, get_current_user
+from App.dto.User import User
+from App.dto.course.ProgrammingCourse import ProgrammingCourse
+from App.exceptions import PermissionDeniedError
+
+# Стресс-проверка контекстного текущего пользователя: множество пользователей
+# одновременно редактируют курс и оценивают прогресс из пула потоков и из
+# asyncio-задач. Каждая операция должна видеть только своего пользователя.
+#
+#   python concurrent_users_stress.py
+
+ROLES = ['admin', 'instructor', 'assistant', 'student']
+CAN_EDIT = {'admin', 'instructor'}
+CAN_ASSESS = {'admin', 'instructor', 'assistant'}
+
+
+def make_course() -> ProgrammingCourse:
+    return ProgrammingCourse("Stress", date(2024, 1, 1), date(2024, 6, 1), "John Doe",
+                             ["student1"], ["Basic"], ["Python"])
+
+
+def check_user_operation(course, user: User) -> None:
+    # Выполняет операции от имени user и сверяет результат с его ролью
+    with as_user(user):
+        for _ in range(20):
+            if get_current_user() is not user:
+                raise AssertionError(f"Чужой пользователь в контексте {user}")
+            try:
+                course.instructor = user.username
+                edited = True
+            except PermissionDeniedError:
+                edited = False
+            if edited != (user.role in CAN_EDIT):
+                raise AssertionError(f"Неверная проверка edit_course для {user}")
+            try:
+                course.assess_progress({"student1": [random.random()]})
+                assessed = True
+            except PermissionDeniedError:
+                assessed = False
+            if assessed != (user.role in CAN_ASSESS):
+                raise AssertionError(f"Неверная проверка assess_progress для {user}")
+            time.sleep(0)  # отдаем управление другим потокам
+
+
+async def check_user_operation_async(course, user: User) -> None:
+    with as_user(user):
+        for _ in range(20):
+            await asyncio.sleep(0)  # переключение между задачами внутри блока as_user
+            if get_current_user() is not user:
+                raise AssertionError(f"Чужой пользователь в контексте {user}")
+            try:
+                course.title = f"Stress {user.username}"
+                edited = True
+            except PermissionDeniedError:
+                edited = False
+            if edited != (user.role in CAN_EDIT):
+                raise AssertionError(f"Неверная проверка edit_course для {user}")
+
+
+async def run_async(course, users) -> None:
+    await asyncio.gather(*(check_user_operation_async(course, user) for user in users))
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    users = [User(f"user{i}", ROLES[i % len(ROLES)]) for i in range(2000)]
+    course = make_course()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        for future in [executor.submit(check_user_operation, course, user) for user in users]:
+            future.result()
+    print(f"   Потоки: {len(users)} пользователей, 32 потока - OK за {time.perf_counter() - start:.2f} c")
+
+    start = time.perf_counter()
+    asyncio.run(run_async(course, users))
+    print(f"   asyncio: {len(users)} задач - OK за {time.perf_counter() - start:.2f} c")
+
+    if get_current_user() is not None:
+        raise AssertionError("Пользователь остался в контексте после завершения")
+
+
+if __name__ == "__main__":
+    main()
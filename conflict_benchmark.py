@@ -0,0 +1,84 @@
+import argparse
+import itertools
+import logging
+import random
+import time
+from datetime import date, timedelta
+from App.context import as_user
+from App.dto.Address import Address
+from App.dto.Platform import Platform
+from App.dto.User import User
+from App.dto.course.ProgrammingCourse import ProgrammingCourse
+
+# Бенчмарк поиска пересечений расписаний (Platform.schedule_conflicts): заметающая прямая
+# по группам преподавателей и студентов. На небольшом наборе результат сверяется
+# с попарным перебором.
+#
+#   python conflict_benchmark.py                          # 100 000 курсов x 20 студентов
+#   python conflict_benchmark.py --courses 20000 --students 50
+
+BASE = date(2024, 1, 1)
+
+
+def make_course(i: int, rng: random.Random, instructors: int, students: int, distinct: int) -> ProgrammingCourse:
+    start = BASE + timedelta(days=rng.randrange(3 * 365))
+    return ProgrammingCourse(f"Course {i}", start, start + timedelta(days=rng.randrange(7, 120)),
+                             f"Instructor {rng.randrange(instructors)}",
+                             [f"student{rng.randrange(distinct)}" for _ in range(students)], ["Basic"], ["Python"])
+
+
+def make_platform(courses: int, rng: random.Random, instructors: int, students: int, distinct: int) -> Platform:
+    platform = Platform("Бенчмарк", Address("example.com", "https://www.example.com"))
+    platform.add_courses(make_course(i, rng, instructors, students, distinct) for i in range(courses))
+    return platform
+
+
+def brute_force(platform: Platform) -> set:
+    found = set()
+    for first, second in itertools.combinations(platform.get_courses(), 2):
+        if first.start_date > second.end_date or second.start_date > first.end_date:
+            continue
+        pair = frozenset((id(first), id(second)))
+        if first.instructor == second.instructor:
+            found.add(('instructor', first.instructor, pair))
+        for student in set(first.students) & set(second.students):
+            found.add(('student', student, pair))
+    return found
+
+
+def check(rng: random.Random) -> None:
+    platform = make_platform(400, rng, 20, 5, 150)
+    found = [(c.kind, c.person, frozenset((id(c.first), id(c.second)))) for c in platform.schedule_conflicts()]
+    if len(found) != len(set(found)) or set(found) != brute_force(platform):
+        raise AssertionError("Заметающая прямая разошлась с попарным перебором")
+    print(f"   Проверка на 400 курсах: {len(found)} конфликтов совпадают с перебором")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Поиск пересечений расписаний преподавателей и студентов")
+    parser.add_argument('--courses', type=int, default=100_000)
+    parser.add_argument('--students', type=int, default=20, help="студентов на курс")
+    parser.add_argument('--distinct', type=int, default=200_000, help="число разных студентов")
+    parser.add_argument('--instructors', type=int, default=5_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(42)
+    with as_user(User("benchmark", "admin")):
+        check(rng)
+        platform = make_platform(args.courses, rng, args.instructors, args.students, args.distinct)
+        print(f"Курсов: {args.courses}, записей: {args.courses * args.students}, "
+              f"преподавателей: {args.instructors}, студентов: {args.distinct}")
+
+        for label, options in (("преподаватели", dict(students=False)), ("студенты", dict(instructors=False))):
+            start = time.perf_counter()
+            conflicts = platform.schedule_conflicts(**options)
+            first = next(conflicts, None)
+            to_first = time.perf_counter() - start
+            total = sum(1 for _ in conflicts) + (first is not None)
+            elapsed = time.perf_counter() - start
+            print(f"   {label:<14} {total:10d} конфликтов за {elapsed:6.2f} c (первый через {to_first * 1000:7.1f} мс)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+from App.serializers import JSONSerializer
+
+# Бенчмарк памяти: обычные классы курсов против компактных (__slots__ + интернирование).
+# Записи курсов строятся заново для каждого курса, как после json.load,
+# поэтому одинаковые строки в них - разные объекты.
+#
+#   python course_memory_benchmark.py                 # 10^5 и 10^6 курсов
+#   python course_memory_benchmark.py --counts 100000
+
+
+TYPES = [
+    ('ProgrammingCourse', 'languages', ("Python", "SQL")),
+    ('DesignCourse', 'tools', ("Figma", "Photoshop")),
+    ('ScienceCourse', 'field', ("Physics", "Mathematics")),
+]
+
+
+def make_record(i: int, students_per_course: int) -> dict:
+    course_type, extra_key, extra = TYPES[i % 3]
+    return {
+        'type': course_type,
+        'title': f"Course {i}",
+        'start_date': f"2024-{i % 12 + 1:02d}-01",
+        'end_date': "2025-01-31",
+        'instructor': f"Instructor {i % 1000}",
+        'students': [f"student{(i * 7 + j) % 50000}" for j in range(students_per_course)],
+        'topics': [f"Topic {j}" for j in range(3)],
+        extra_key: list(extra),
+    }
+
+
+def measure(count: int, students_per_course: int, compact: bool):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    courses = []
+    for i in range(count):
+        courses.append(JSONSerializer._create_course_from_dict(make_record(i, students_per_course), compact=compact))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del courses
+    return current, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение памяти обычных и компактных курсов")
+    parser.add_argument('--counts', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--students', type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    print(f"Студентов на курс: {args.students}")
+    for count in args.counts:
+        results = {}
+        for compact in (False, True):
+            current, peak, elapsed = measure(count, args.students, compact)
+            results[compact] = current
+            name = "компактные" if compact else "обычные"
+            print(f"   {count:>9} курсов, {name:<10}: {current / 2 ** 20:9.1f} МБ "
+                  f"({current / count:7.0f} Б/курс), пик {peak / 2 ** 20:9.1f} МБ, {elapsed:6.2f} c")
+        print(f"   экономия: {results[False] / results[True]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import logging
+import os
+import tempfile
+import time
+from App.context import as_user
+from App.dto.Platform import Platform
+from App.dto.User import User
+from streaming_load_benchmark import generate_platform_file
+
+# Бенчмарк инкрементального сохранения: после правки нескольких курсов
+# save_to_file переписывает весь файл, save_incremental дописывает только журнал.
+#
+#   python incremental_save_benchmark.py                     # 200 000 курсов, 10 правок
+#   python incremental_save_benchmark.py --courses 1000000 --edits 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Полное и инкрементальное сохранение платформы")
+    parser.add_argument('--courses', type=int, default=200_000)
+    parser.add_argument('--students', type=int, default=10)
+    parser.add_argument('--edits', type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as directory, as_user(User("benchmark", "admin")):
+        filename = os.path.join(directory, 'platform.json')
+        generate_platform_file(filename, args.courses, args.students)
+        platform = Platform.load_from_file(filename)
+        platform.save_incremental(filename)  # базовый файл и пустой журнал
+
+        def edit(round_number: int) -> None:
+            for i in range(args.edits):
+                course = platform.get_course_by_index((round_number * 7919 + i * 104729) % args.courses)
+                course.title = f"Edited {round_number}-{i}"
+
+        edit(0)
+        start = time.perf_counter()
+        platform.save_to_file(os.path.join(directory, 'full.json'))
+        print(f"   save_to_file ({args.courses} курсов):     {time.perf_counter() - start:8.3f} c")
+
+        for round_number in range(1, 4):
+            edit(round_number)
+            start = time.perf_counter()
+            written = platform.save_incremental(filename)
+            print(f"   save_incremental ({written} записей):      {time.perf_counter() - start:8.4f} c")
+
+        start = time.perf_counter()
+        restored = Platform.load_incremental(filename)
+        print(f"   load_incremental (база + журнал):   {time.perf_counter() - start:8.3f} c")
+        if restored.to_dict() != platform.to_dict():
+            raise AssertionError("Платформа из базы и журнала отличается от исходной")
+        print("   Содержимое после восстановления совпадает")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import logging
+import os
+import tempfile
+import time
+from datetime import date
+from App.dto.course.ProgrammingCourse import ProgrammingCourse
+from App.logging_config import setup_logging, shutdown_logging
+
+# Бенчмарк скорости создания курсов при разных режимах логирования:
+# логирование выключено (уровень WARNING), синхронная запись в файл
+# и production-режим с QueueHandler/QueueListener.
+#
+#   python logging_benchmark.py
+
+
+def construct(count: int) -> float:
+    students = [f"student{i}" for i in range(20)]
+    start = time.perf_counter()
+    for i in range(count):
+        ProgrammingCourse(f"Course {i}", date(2024, 1, 1), date(2024, 6, 1), "John Doe",
+                          students, ["Basic"], ["Python"])
+    return time.perf_counter() - start
+
+
+def main(count: int = 200_000):
+    modes = [
+        ("логирование выключено", dict(production=False, level=logging.WARNING)),
+        ("синхронно в файл", dict(production=False, level=logging.INFO)),
+        ("production (очередь)", dict(production=True, level=logging.INFO)),
+    ]
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # setup_logging пишет в ./logs
+        try:
+            for label, options in modes:
+                setup_logging(console=False, **options)
+                elapsed = construct(count)
+                shutdown_logging()
+                print(f"   {label:<22} {count / elapsed:10.0f} курсов/с ({elapsed:.2f} c на {count})")
+        finally:
+            os.chdir(cwd)
+            logging.getLogger().handlers.clear()
+
+
+if __name__ == "__main__":
+    main()
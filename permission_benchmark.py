@@ -0,0 +1,41 @@
+import logging
+import timeit
+from App.context import set_current_user
+from App.decorators import check_permissions
+from App.dto.User import User
+
+# Микробенчмарк накладных расходов check_permissions на один вызов сеттера
+#
+#   python permission_benchmark.py
+
+
+class PlainCourse:
+    def __init__(self):
+        self._title = ""
+
+    def set_title(self, value):
+        self._title = value
+
+    @check_permissions('edit_course')
+    def set_title_checked(self, value):
+        self._title = value
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    course = PlainCourse()
+    number = 1_000_000
+
+    for label, user in [("без пользователя", None), ("admin", User("admin", "admin")),
+                        ("instructor", User("instructor", "instructor"))]:
+        set_current_user(user)
+        plain = min(timeit.repeat(lambda: course.set_title("x"), number=number, repeat=5))
+        checked = min(timeit.repeat(lambda: course.set_title_checked("x"), number=number, repeat=5))
+        overhead = (checked - plain) / number * 1e9
+        print(f"   {label:<17} без декоратора: {plain / number * 1e9:6.1f} нс  "
+              f"с декоратором: {checked / number * 1e9:6.1f} нс  накладные расходы: {overhead:6.1f} нс/вызов")
+    set_current_user(None)
+
+
+if __name__ == "__main__":
+    main()
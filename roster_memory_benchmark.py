@@ -0,0 +1,74 @@
+import argparse
+import gc
+import resource
+import subprocess
+import sys
+import time
+
+# Бенчмарк памяти списков студентов на синтетических записях (по умолчанию
+# 500 000 курсов x 20 студентов = 10M записей, 1M разных студентов).
+# Каждый способ хранения запускается в отдельном процессе, сравнивается прирост RSS:
+#   strings  - список строк на курс, как после json.load (прежний Course.students)
+#   interned - кортеж интернированных строк (прежние компактные курсы)
+#   roster   - Roster: array('I') номеров из общей таблицы имен
+#   queried  - Roster после проверки "студент in roster" у каждого курса
+#
+#   python roster_memory_benchmark.py
+#   python roster_memory_benchmark.py --courses 100000 --students 50
+
+
+def rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def student_names(course: int, students_per_course: int, distinct: int):
+    # Новые объекты строк для каждой записи - как при разборе JSON
+    return [f"student{(course * 7919 + j * 104729) % distinct}" for j in range(students_per_course)]
+
+
+def run_child(mode: str, courses: int, students_per_course: int, distinct: int) -> None:
+    from sys import intern
+    from App.dto.Roster import Roster
+
+    gc.collect()
+    before = rss_mb()
+    start = time.perf_counter()
+    rosters = []
+    for course in range(courses):
+        names = student_names(course, students_per_course, distinct)
+        if mode == 'strings':
+            rosters.append(names)
+        elif mode == 'interned':
+            rosters.append(tuple(intern(name) for name in names))
+        else:
+            rosters.append(Roster(names))
+            if mode == 'queried':
+                _ = names[0] in rosters[-1]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    grown = rss_mb() - before
+    enrollments = courses * students_per_course
+    print(f"   {mode:<9} прирост RSS: {grown:9.1f} МБ ({grown * 2 ** 20 / enrollments:6.1f} Б/запись), {elapsed:6.2f} c")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Память списков студентов: строки против номеров")
+    parser.add_argument('--courses', type=int, default=500_000)
+    parser.add_argument('--students', type=int, default=20)
+    parser.add_argument('--distinct', type=int, default=1_000_000, help="число разных студентов")
+    parser.add_argument('--child', choices=['strings', 'interned', 'roster', 'queried'])
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.courses, args.students, args.distinct)
+        return
+
+    print(f"Курсов: {args.courses}, студентов на курс: {args.students}, "
+          f"записей: {args.courses * args.students}, разных студентов: {args.distinct}")
+    for mode in ('strings', 'interned', 'roster', 'queried'):
+        subprocess.run([sys.executable, __file__, '--child', mode, '--courses', str(args.courses),
+                        '--students', str(args.students), '--distinct', str(args.distinct)], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import logging
+import random
+import time
+from datetime import date, timedelta
+from App.context import as_user
+from App.dto.Address import Address
+from App.dto.Platform import Platform
+from App.dto.User import User
+from App.dto.course.ProgrammingCourse import ProgrammingCourse
+
+# Бенчмарк поиска курсов по датам: полный обход get_courses() против индекса интервалов
+# Platform.courses_active_on / courses_overlapping, в том числе вперемешку с изменением дат.
+#
+#   python schedule_index_benchmark.py                       # 200 000 курсов
+#   python schedule_index_benchmark.py --courses 50000 --queries 5000
+
+BASE = date(2024, 1, 1)
+
+
+def make_course(i: int, rng: random.Random) -> ProgrammingCourse:
+    start = BASE + timedelta(days=rng.randrange(3 * 365))
+    return ProgrammingCourse(f"Course {i}", start, start + timedelta(days=rng.randrange(7, 180)),
+                             f"Instructor {i % 1000}", [], ["Basic"], ["Python"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Поиск курсов по датам: обход против индекса")
+    parser.add_argument('--courses', type=int, default=200_000)
+    parser.add_argument('--queries', type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(42)
+    with as_user(User("benchmark", "admin")):
+        platform = Platform("Бенчмарк", Address("example.com", "https://www.example.com"))
+        platform.add_courses(make_course(i, rng) for i in range(args.courses))
+        courses = platform.get_courses()
+        weeks = [BASE + timedelta(days=rng.randrange(3 * 365)) for _ in range(args.queries)]
+
+        def scan(week):
+            return [c for c in platform.get_courses() if c.start_date <= week + timedelta(days=6) and c.end_date >= week]
+
+        def check(sample, expected):
+            for week, scanned_courses in zip(sample, expected):
+                found = platform.courses_overlapping(week, week + timedelta(days=6))
+                if [id(c) for c in found] != [id(c) for c in scanned_courses]:
+                    raise AssertionError("Индекс разошелся с полным обходом")
+
+        sample = weeks[:max(1, args.queries // 100)]  # полный обход медленный - проверяется часть недель
+        start = time.perf_counter()
+        scanned = [scan(week) for week in sample]
+        scan_time = (time.perf_counter() - start) / len(scanned)
+        print(f"   Обход списка:            {scan_time * 1000:9.3f} мс/запрос")
+
+        start = time.perf_counter()
+        platform.courses_active_on(BASE)
+        print(f"   Построение индекса:      {(time.perf_counter() - start) * 1000:9.1f} мс")
+
+        start = time.perf_counter()
+        for week in weeks:
+            platform.courses_overlapping(week, week + timedelta(days=6))
+        print(f"   courses_overlapping:     {(time.perf_counter() - start) / len(weeks) * 1000:9.3f} мс/запрос")
+        check(sample, scanned)
+
+        start = time.perf_counter()
+        for week in weeks:
+            platform.courses_active_on(week)
+        print(f"   courses_active_on:       {(time.perf_counter() - start) / len(weeks) * 1000:9.3f} мс/запрос")
+
+        # Запросы вперемешку с переносом дат окончания курсов
+        start = time.perf_counter()
+        for week in weeks:
+            course = courses[rng.randrange(len(courses))]
+            course.end_date = course.end_date + timedelta(days=1)
+            platform.courses_active_on(week)
+        print(f"   изменение + запрос:      {(time.perf_counter() - start) / len(weeks) * 1000:9.3f} мс")
+
+        # После изменения дат сравниваем с новым полным обходом тех же недель
+        check(sample, [scan(week) for week in sample])
+        print(f"   Результаты индекса совпадают с полным обходом ({len(sample)} недель до и после изменений)")
+
+
+if __name__ == "__main__":
+    main()
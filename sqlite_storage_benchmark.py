@@ -0,0 +1,69 @@
+import argparse
+import logging
+import os
+import tempfile
+import time
+from datetime import date
+from App.context import as_user
+from App.dto.Platform import Platform
+from App.dto.User import User
+from streaming_load_benchmark import generate_platform_file
+
+# Бенчмарк хранилища SQLite против JSON: полное сохранение и загрузка,
+# изменение одного курса (JSON переписывается целиком, SQLite обновляет одну строку)
+# и поиск по студенту/датам.
+#
+#   python sqlite_storage_benchmark.py                      # 100 000 курсов
+#   python sqlite_storage_benchmark.py --courses 20000 --students 50
+
+
+def timed(label: str, action):
+    start = time.perf_counter()
+    result = action()
+    print(f"   {label:<42}{time.perf_counter() - start:8.3f} c")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение хранения платформы в JSON и SQLite")
+    parser.add_argument('--courses', type=int, default=100_000)
+    parser.add_argument('--students', type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as directory, as_user(User("benchmark", "admin")):
+        json_path = os.path.join(directory, 'platform.json')
+        db_path = os.path.join(directory, 'platform.db')
+        generate_platform_file(json_path, args.courses, args.students)
+        platform = Platform.load_from_file(json_path)
+
+        print("JSON:")
+        timed("сохранение", lambda: platform.save_to_file(json_path))
+        loaded = timed("загрузка", lambda: Platform.load_from_file(json_path))
+
+        def update_json():
+            loaded.get_course_by_index(args.courses // 2).title = "Renamed"
+            loaded.save_to_file(json_path)
+
+        timed("изменение одного курса + сохранение", update_json)
+        timed("поиск по студенту (обход списков)",
+              lambda: [c for c in loaded.get_courses() if "student42" in c.students])
+
+        print("SQLite:")
+        timed("сохранение", lambda: platform.save_to_sqlite(db_path))
+        platform.repository.close()
+        from_db = timed("загрузка", lambda: Platform.open_sqlite(db_path))
+        timed("изменение одного курса", lambda: setattr(from_db.get_course_by_index(args.courses // 2), 'title', "Renamed"))
+        repository = from_db.repository
+        found = timed("поиск по студенту (SQL)", lambda: repository.find_by_student("student42"))
+        timed("поиск по датам (SQL)", lambda: repository.find_by_date_range(date(2024, 3, 1), date(2024, 3, 31)))
+        timed("поиск по преподавателю (SQL)", lambda: repository.find_by_instructor("Instructor 7"))
+
+        if from_db.to_dict() != loaded.to_dict():
+            raise AssertionError("Платформа из SQLite отличается от платформы из JSON")
+        print(f"   Курсов со student42: {len(found)}; содержимое JSON и SQLite совпадает")
+        repository.close()
+
+
+if __name__ == "__main__":
+    main()
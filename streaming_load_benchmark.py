@@ -0,0 +1,93 @@
+import argparse
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import time
+
+# Бенчмарк загрузки платформы: json.load целиком против потокового режима.
+# Каждый режим запускается в отдельном процессе, чтобы честно измерить пиковый RSS.
+#
+#   python streaming_load_benchmark.py --courses 4000000   # ~2.5 ГБ JSON
+#   python streaming_load_benchmark.py --skip-eager         # только потоковый режим
+
+
+def generate_platform_file(filename: str, courses: int, students_per_course: int) -> None:
+    print(f"Генерация {courses} курсов в {filename}...")
+    types = [
+        ('ProgrammingCourse', 'languages', ["Python", "SQL"]),
+        ('DesignCourse', 'tools', ["Figma", "Photoshop"]),
+        ('ScienceCourse', 'field', ["Physics", "Mathematics"]),
+    ]
+    with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write('{\n  "name": "Синтетическая платформа",\n')
+        f.write('  "address": {"domain": "example.com", "url": "https://www.example.com"},\n')
+        f.write('  "courses": [\n')
+        for i in range(courses):
+            course_type, extra_key, extra = types[i % 3]
+            record = {
+                'type': course_type,
+                'title': f"Course {i}",
+                'start_date': "2024-01-01",
+                'end_date': "2024-06-30",
+                'instructor': f"Instructor {i % 1000}",
+                'students': [f"student{(i * 7 + j) % 1000000}" for j in range(students_per_course)],
+                'topics': ["Basic", "OOP", "Web"],
+                extra_key: extra,
+            }
+            f.write('    ')
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write(',\n' if i < courses - 1 else '\n')
+        f.write('  ]\n}\n')
+
+
+def run_child(filename: str, mode: str) -> None:
+    logging.disable(logging.CRITICAL)
+    from App.dto.Platform import Platform
+
+    start = time.perf_counter()
+    if mode == 'eager':
+        count = len(Platform.load_from_file(filename).get_courses())
+    elif mode == 'streaming':
+        count = len(Platform.load_from_file(filename, streaming=True).get_courses())
+    else:
+        # Курсы только проходят через генератор и не накапливаются
+        from App.serializers import JSONSerializer
+        count = sum(1 for _ in JSONSerializer.iter_courses_from_file(filename))
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"   {mode:<10} курсов: {count:>9}  время: {elapsed:8.2f} c  пиковый RSS: {peak_mb:10.1f} МБ")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк потоковой загрузки платформы")
+    parser.add_argument('--file', default='synthetic_platform_data.json')
+    parser.add_argument('--courses', type=int, default=4_000_000)
+    parser.add_argument('--students', type=int, default=25)
+    parser.add_argument('--skip-eager', action='store_true')
+    parser.add_argument('--keep', action='store_true', help="не удалять сгенерированный файл")
+    parser.add_argument('--child', choices=['eager', 'streaming', 'iterate'])
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.file, args.child)
+        return
+
+    generated = not os.path.exists(args.file)
+    if generated:
+        generate_platform_file(args.file, args.courses, args.students)
+    print(f"Размер файла: {os.path.getsize(args.file) / 1024 ** 3:.2f} ГБ")
+
+    modes = ['iterate', 'streaming'] if args.skip_eager else ['iterate', 'streaming', 'eager']
+    try:
+        for mode in modes:
+            subprocess.run([sys.executable, __file__, '--file', args.file, '--child', mode], check=True)
+    finally:
+        if generated and not args.keep:
+            os.remove(args.file)
+
+
+if __name__ == "__main__":
+    main()
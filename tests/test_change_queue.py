@@ -0,0 +1,97 @@
+import pytest
+
+from App.change_queue import APPROVED, PENDING, PROCESSING, ChangeRequestQueue, default_chain
+from App.dto.Handlers import ChangeRequest
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = ChangeRequestQueue(str(tmp_path / 'changes.db'))
+    yield queue
+    queue.close()
+
+
+def make_requests(count, change_type="materials"):
+    return [ChangeRequest(change_type, {'course': f"Course {i}"}, f"user{i}") for i in range(count)]
+
+
+def test_complete_after_lost_lease_is_rejected(queue):
+    queue.enqueue_many(make_requests(3))
+    slow = queue.claim_batch(10, 'slow')
+    assert queue.recover(stale_after=0) == 3
+    fast = queue.claim_batch(10, 'fast')
+    assert [request.request_id for request in fast] == [request.request_id for request in slow]
+
+    for request in fast:
+        request.approved, request.approved_by = True, "Instructor"
+    for request in slow:
+        request.approved, request.approved_by = True, "Management"
+
+    assert queue.complete_batch(fast, 'fast') == []
+    lost = queue.complete_batch(slow, 'slow')
+    assert [request.request_id for request in lost] == [request.request_id for request in slow]
+    assert {request.approved_by for request in queue.find(status=APPROVED)} == {"Instructor"}
+
+
+def test_stale_complete_before_reclaim_keeps_request_pending(queue):
+    queue.enqueue_many(make_requests(2))
+    slow = queue.claim_batch(10, 'slow')
+    queue.recover(stale_after=0)
+    assert len(queue.complete_batch(slow, 'slow')) == 2
+    assert queue.counts_by_status() == {PENDING: 2}
+
+
+class StealingChain:
+    # Цепочка, во время обработки которой аренда истекает и часть пачки забирает другой обработчик
+    def __init__(self, queue):
+        self.queue = queue
+        self.stolen = []
+
+    def handle_batch(self, requests):
+        requests = list(requests)
+        if not self.stolen:
+            self.queue.recover(stale_after=0)
+            self.stolen = self.queue.claim_batch(2, 'thief')
+            self.queue.claim_batch(10, 'main')  # остаток снова достается тому же обработчику
+        return default_chain().handle_batch(requests)
+
+
+def test_lost_part_of_batch_is_dropped_from_summary(tmp_path):
+    chain = StealingChain(None)
+    queue = chain.queue = ChangeRequestQueue(str(tmp_path / 'changes.db'), chain=chain)
+    queue.enqueue_many(make_requests(5))
+
+    summary = queue.process_batch(10, 'main')
+
+    assert summary.total == 3 and summary.approved == 3
+    assert queue.counts_by_status() == {APPROVED: 3, PROCESSING: 2}
+    assert {request.request_id for request in queue.find(status=PROCESSING)} == {r.request_id for r in chain.stolen}
+    queue.close()
+
+
+def test_request_ids_are_not_reused_after_purge(queue):
+    first = queue.enqueue_many(make_requests(3))
+    queue.process_pending(workers=1)
+    assert queue.purge() == 3
+    second = queue.enqueue_many(make_requests(2))
+    assert min(second) > max(first)
+    assert queue.enqueue(make_requests(1)[0]) == max(second) + 1
+
+
+def test_database_without_autoincrement_is_migrated(tmp_path):
+    import sqlite3
+    from App.change_queue import SCHEMA
+
+    path = str(tmp_path / 'old.db')
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA.replace("AUTOINCREMENT", ""))
+    connection.execute("INSERT INTO change_requests (id, change_type, change_data, requester, status, created_at) "
+                       "VALUES (7, 'materials', '{}', 'user', 'approved', 0)")
+    connection.commit()
+    connection.close()
+
+    queue = ChangeRequestQueue(path)
+    assert queue.get(7).requester == 'user'
+    queue.purge()
+    assert queue.enqueue(make_requests(1)[0]) == 8
+    queue.close()
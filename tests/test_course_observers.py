@@ -0,0 +1,81 @@
+import gc
+import logging
+import weakref
+from datetime import date
+
+import pytest
+
+from App.context import as_user
+from App.dto.Address import Address
+from App.dto.Platform import Platform
+from App.dto.User import User
+from App.dto.course.ProgrammingCourse import ProgrammingCourse
+from App.interfaces import CourseObserver
+
+# Курс держит наблюдателей по слабым ссылкам: курс, переживший платформу,
+# не должен держать ее каталог и базу
+
+
+@pytest.fixture(autouse=True)
+def admin():
+    logging.disable(logging.CRITICAL)
+    with as_user(User("test", "admin")) as user:
+        yield user
+    logging.disable(logging.NOTSET)
+
+
+class RecordingObserver(CourseObserver):
+    def __init__(self):
+        self.events = []
+
+    def course_changed(self, course, field, old_value, new_value):
+        self.events.append(field)
+
+
+def make_course(title="Python"):
+    return ProgrammingCourse(title, date(2024, 1, 1), date(2024, 3, 1), "Иванов",
+                             ["Анна", "Борис"], ["Basic"], ["Python"])
+
+
+def test_observer_is_notified_until_removed():
+    course, observer = make_course(), RecordingObserver()
+    course.add_observer(observer)
+    course.add_observer(observer)
+    course.title = "Python 2"
+    course.remove_observer(observer)
+    course.title = "Python 3"
+    assert observer.events == ['title']
+
+
+def test_course_does_not_keep_observer_alive():
+    course, observer = make_course(), RecordingObserver()
+    course.add_observer(observer)
+    reference = weakref.ref(observer)
+    del observer
+    gc.collect()
+    assert reference() is None
+    course.title = "Python 2"  # мертвый наблюдатель просто пропускается
+    assert course.title == "Python 2"
+
+
+def test_dropped_platform_is_collected_while_course_survives(tmp_path):
+    course = make_course()
+    platform = Platform("Тест", Address("example.com", "https://www.example.com"))
+    platform.add_course(course)
+    platform.save_to_sqlite(str(tmp_path / 'platform.db'))
+    # Каталог и репозиторий - наблюдатели курса, платформа держит их в приватных полях
+    references = [weakref.ref(platform), weakref.ref(platform._Platform__courses),
+                  weakref.ref(platform._Platform__repository)]
+    platform.close()
+    del platform
+    gc.collect()
+    assert [reference() for reference in references] == [None, None, None]
+
+    course.title = "Python 2"
+    course.enroll_many(["Вера"])
+    assert "Вера" in course.students
+
+    other = Platform("Другая", Address("example.com", "https://www.example.com"))
+    other.add_course(course)
+    course.title = "Python 3"
+    assert other.find_courses_by_title("Python 3") == [course]
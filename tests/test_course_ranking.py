@@ -0,0 +1,77 @@
+import logging
+import random
+from datetime import date
+
+import pytest
+
+from App.context import as_user
+from App.dto.Address import Address
+from App.dto.Platform import Platform
+from App.dto.User import User
+from App.dto.course.ProgrammingCourse import ProgrammingCourse
+
+# Поддерживаемый рейтинг (куча с ленивым удалением) должен давать тот же топ,
+# что и sorted(..., reverse=True) по текущему списку курсов
+
+
+@pytest.fixture(autouse=True)
+def admin():
+    logging.disable(logging.CRITICAL)
+    with as_user(User("test", "admin")) as user:
+        yield user
+    logging.disable(logging.NOTSET)
+
+
+def random_students(rng):
+    return [f"student{rng.randrange(40)}" for _ in range(rng.randrange(12))]
+
+
+def make_course(i, rng):
+    return ProgrammingCourse(f"Course {i}", date(2024, 1, 1), date(2024, 3, 1), "Иванов",
+                             random_students(rng), ["Basic"], ["Python"])
+
+
+def expected_top(courses, n):
+    return sorted(courses, key=lambda course: len(course.students), reverse=True)[:n]
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_ranking_matches_sorted(seed):
+    rng = random.Random(seed)
+    platform = Platform("Тест", Address("example.com", "https://www.example.com"), maintain_ranking=True)
+    courses = [make_course(i, rng) for i in range(100)]
+    platform.add_courses(courses)
+    next_index = len(courses)
+
+    for step in range(3000):
+        action = rng.random()
+        if action < 0.1:
+            course = make_course(next_index, rng)
+            next_index += 1
+            platform.add_course(course)
+            courses.append(course)
+        elif action < 0.2 and courses:
+            platform.remove_course(courses.pop(rng.randrange(len(courses))))
+        elif action < 0.5 and courses:
+            rng.choice(courses).enroll_many(random_students(rng))
+        elif action < 0.8 and courses:
+            rng.choice(courses).drop_many(random_students(rng))
+        elif courses:
+            rng.choice(courses).students = random_students(rng)
+        if step % 10 == 0:
+            n = rng.randrange(25)
+            # Курсы сравниваются по количеству студентов (__eq__), поэтому сверяются сами объекты
+            assert [id(c) for c in platform.get_top_courses(n)] == [id(c) for c in expected_top(courses, n)]
+    assert [id(c) for c in platform.get_top_courses(len(courses) + 5)] == \
+        [id(c) for c in expected_top(courses, len(courses))]
+
+
+def test_ranking_and_heap_selection_agree():
+    rng = random.Random(5)
+    courses = [make_course(i, rng) for i in range(300)]
+    maintained = Platform("Тест", Address("example.com", "https://www.example.com"), maintain_ranking=True)
+    maintained.add_courses(courses)
+    selected = Platform("Тест", Address("example.com", "https://www.example.com"))
+    selected.add_courses(courses)
+    for n in (0, 1, 10, 300):
+        assert [id(c) for c in maintained.get_top_courses(n)] == [id(c) for c in selected.get_top_courses(n)]
@@ -0,0 +1,97 @@
+import logging
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from App.context import as_user
+from App.dto.Address import Address
+from App.dto.Platform import Platform
+from App.dto.User import User
+from App.dto.course.ProgrammingCourse import ProgrammingCourse
+
+# Индекс дат (дерево интервалов, буфер изменений и список начал) должен совпадать
+# с полным перебором курсов после любой последовательности добавлений, удалений
+# и смены дат, в том числе вокруг перестроек дерева
+
+BASE = date(2024, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def admin():
+    logging.disable(logging.CRITICAL)
+    with as_user(User("test", "admin")) as user:
+        yield user
+    logging.disable(logging.NOTSET)
+
+
+def random_day(rng):
+    return BASE + timedelta(days=rng.randrange(365))
+
+
+def make_course(i, rng):
+    start = random_day(rng)
+    return ProgrammingCourse(f"Course {i}", start, start + timedelta(days=rng.randrange(60)),
+                             f"Instructor {i % 7}", [], ["Basic"], ["Python"])
+
+
+def move(course, rng):
+    # Новые даты ставятся в порядке, при котором начало не оказывается позже конца
+    start = random_day(rng)
+    end = start + timedelta(days=rng.randrange(60))
+    if start > course.end_date:
+        course.end_date = end
+        course.start_date = start
+    else:
+        course.start_date = start
+        course.end_date = end
+
+
+def expected(courses, key):
+    return sorted((course for course in courses if key(course)), key=id)
+
+
+def check(platform, courses, rng):
+    day = random_day(rng)
+    last = day + timedelta(days=rng.randrange(30))
+    assert sorted(platform.courses_active_on(day), key=id) == \
+        expected(courses, lambda c: c.start_date <= day <= c.end_date)
+    assert sorted(platform.courses_overlapping(day, last), key=id) == \
+        expected(courses, lambda c: c.start_date <= last and c.end_date >= day)
+    assert sorted(platform.courses_starting_between(day, last), key=id) == \
+        expected(courses, lambda c: day <= c.start_date <= last)
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_schedule_matches_brute_force(seed):
+    rng = random.Random(seed)
+    platform = Platform("Тест", Address("example.com", "https://www.example.com"))
+    courses = [make_course(i, rng) for i in range(300)]
+    platform.add_courses(courses)
+    check(platform, courses, rng)  # индекс строится при первом запросе
+    next_index = len(courses)
+
+    for _ in range(3000):
+        action = rng.random()
+        if action < 0.3:
+            course = make_course(next_index, rng)
+            next_index += 1
+            platform.add_course(course)
+            courses.append(course)
+        elif action < 0.55 and courses:
+            course = courses.pop(rng.randrange(len(courses)))
+            platform.remove_course(course)
+        elif courses:
+            move(rng.choice(courses), rng)
+        if rng.random() < 0.2:
+            check(platform, courses, rng)
+    check(platform, courses, rng)
+
+
+def test_results_are_in_catalog_order():
+    rng = random.Random(7)
+    platform = Platform("Тест", Address("example.com", "https://www.example.com"))
+    platform.add_courses(make_course(i, rng) for i in range(200))
+    found = platform.courses_overlapping(BASE, BASE + timedelta(days=365))
+    assert [platform.get_course_id(course) for course in found] == \
+        sorted(platform.get_course_id(course) for course in found)
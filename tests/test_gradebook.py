@@ -0,0 +1,104 @@
+import logging
+import random
+from datetime import date
+
+import pytest
+
+from App.context import as_user
+from App.dto.User import User
+from App.dto.course.DesignCourse import DesignCourse
+from App.dto.course.ProgrammingCourse import ProgrammingCourse
+from App.dto.course.ScienceCourse import ScienceCourse
+
+# Журнал оценок должен давать те же средние, что и полный пересчет assess_progress
+
+STUDENTS = ["Анна", "Борис", "Вера", "Глеб"]
+
+# (класс курса, генератор допустимой оценки для его оценщика)
+COURSES = [
+    (ProgrammingCourse, lambda rng: round(rng.random(), 2)),
+    (DesignCourse, lambda rng: rng.randint(0, 100)),
+    (ScienceCourse, lambda rng: rng.randint(0, 15)),
+]
+COURSE_IDS = [course_class.__name__ for course_class, _ in COURSES]
+
+
+@pytest.fixture(autouse=True)
+def admin():
+    logging.disable(logging.CRITICAL)
+    with as_user(User("test", "admin")) as user:
+        yield user
+    logging.disable(logging.NOTSET)
+
+
+def make_course(course_class):
+    return course_class("Курс", date(2024, 1, 1), date(2024, 6, 1), "Преподаватель", list(STUDENTS), ["Основы"], [])
+
+
+def assert_matches_full_recomputation(course):
+    gradebook = course.gradebook
+    expected = course.assess_progress(gradebook.grades()) if len(gradebook) else {}
+    assert gradebook.averages() == pytest.approx(expected)
+    for student, average in expected.items():
+        assert gradebook.average(student) == pytest.approx(average)
+
+
+@pytest.mark.parametrize("course_class, grade", COURSES, ids=COURSE_IDS)
+def test_averages_match_assess_progress(course_class, grade):
+    rng = random.Random(course_class.__name__)
+    course = make_course(course_class)
+    added = []
+    for _ in range(300):
+        if added and rng.random() < 0.35:
+            student, value = added.pop(rng.randrange(len(added)))
+            course.gradebook.remove_grade(student, value)
+        else:
+            student, value = rng.choice(STUDENTS), grade(rng)
+            course.gradebook.add_grade(student, value)
+            added.append((student, value))
+        assert_matches_full_recomputation(course)
+
+
+@pytest.mark.parametrize("course_class, grade", COURSES, ids=COURSE_IDS)
+def test_remove_down_to_zero_grades(course_class, grade):
+    rng = random.Random(0)
+    course = make_course(course_class)
+    gradebook = course.gradebook
+    values = [grade(rng) for _ in range(5)]
+    for value in values:
+        gradebook.add_grade("Анна", value)
+    gradebook.add_grade("Борис", grade(rng))
+
+    for value in values:
+        gradebook.remove_grade("Анна", value)
+        assert_matches_full_recomputation(course)
+
+    assert "Анна" not in gradebook
+    assert len(gradebook) == 1
+    with pytest.raises(ValueError):
+        gradebook.average("Анна")
+    with pytest.raises(ValueError):
+        gradebook.remove_grade("Анна", values[0])
+
+    gradebook.remove_grade("Борис", gradebook.grades()["Борис"][0])
+    assert len(gradebook) == 0
+    assert gradebook.averages() == {}
+
+
+@pytest.mark.parametrize("course_class, grade", COURSES, ids=COURSE_IDS)
+def test_negative_grade_is_rejected(course_class, grade):
+    course = make_course(course_class)
+    gradebook = course.gradebook
+    gradebook.add_grade("Анна", grade(random.Random(1)))
+    before = gradebook.averages()
+
+    with pytest.raises(ValueError, match="Отрицательная оценка"):
+        gradebook.add_grade("Анна", -1)
+    with pytest.raises(ValueError, match="Отрицательная оценка"):
+        gradebook.add_grade("Борис", -0.5)
+    with pytest.raises(ValueError, match="Отрицательная оценка"):
+        course.assess_progress({"Анна": [-1]})
+
+    # Отклоненная оценка не меняет журнал
+    assert gradebook.averages() == before
+    assert "Борис" not in gradebook
@@ -0,0 +1,121 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from App.notifications import InMemorySink, NotificationDispatcher
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+class BlockingSink(InMemorySink):
+    # Получатель, который не отдает пачку, пока тест не разрешит
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.entered = threading.Event()
+
+    def send_batch(self, channel, notifications):
+        self.entered.set()
+        self.release.wait(10)
+        super().send_batch(channel, notifications)
+
+
+def test_failed_batches_are_retried_with_backoff():
+    sink = InMemorySink(fail_times=2)
+    dispatcher = NotificationDispatcher(sink, workers=1, max_retries=3, retry_delay=0.02)
+    start = time.perf_counter()
+    handle = dispatcher.submit(["Анна", "Борис"], "Занятие перенесено")
+    assert handle.wait(5)
+    elapsed = time.perf_counter() - start
+    dispatcher.close()
+
+    assert handle.succeeded and handle.delivered == 2 and not handle.errors
+    assert sink.batches == [('default', 2)]
+    assert elapsed >= 0.02 + 0.04  # задержки 0.02 и 0.04 перед второй и третьей попытками
+
+
+def test_handle_reports_failure_after_last_retry():
+    sink = InMemorySink(fail_times=10)
+    dispatcher = NotificationDispatcher(sink, workers=1, max_retries=1, retry_delay=0.001)
+    handle = dispatcher.submit(["Анна", "Борис", "Вера"], "Сообщение")
+    assert handle.wait(5)
+    dispatcher.close()
+
+    assert not handle.succeeded
+    assert handle.failed == 3 and handle.delivered == 0
+    assert len(handle.errors) == 1 and isinstance(handle.errors[0], ConnectionError)
+    assert sink.delivered == {}
+
+
+def test_batches_are_grouped_by_channel_and_size():
+    sink = InMemorySink()
+    dispatcher = NotificationDispatcher(sink, workers=1, batch_size=3)
+    handles = [dispatcher.submit([f"s{i}" for i in range(5)], "m", channel='email'),
+               dispatcher.submit(["x", "y"], "m", channel='sms')]
+    dispatcher.flush()
+    dispatcher.close()
+
+    assert all(handle.succeeded for handle in handles)
+    assert [n.student for n in sink.delivered['email']] == [f"s{i}" for i in range(5)]
+    assert all(size <= 3 for _, size in sink.batches)
+    assert sum(size for channel, size in sink.batches if channel == 'email') == 5
+
+
+def test_flush_and_close_deliver_everything_then_reject_submits():
+    sink = InMemorySink()
+    dispatcher = NotificationDispatcher(sink, workers=2, max_queue=4)
+    handles = [dispatcher.submit([f"s{i}"], "m") for i in range(50)]
+    dispatcher.flush()
+    assert all(handle.done() for handle in handles)
+    dispatcher.close()
+    assert sum(len(batch) for batch in sink.delivered.values()) == 50
+    with pytest.raises(RuntimeError):
+        dispatcher.submit(["s"], "m")
+    dispatcher.close()  # повторный вызов ничего не делает
+
+
+def test_close_without_wait_does_not_block_on_full_queue():
+    sink = BlockingSink()
+    dispatcher = NotificationDispatcher(sink, workers=1, max_queue=2)
+    handles = [dispatcher.submit(["first"], "m")]
+    assert sink.entered.wait(5)  # поток занят первой пачкой
+    handles += [dispatcher.submit([f"s{i}"], "m") for i in range(2)]  # очередь заполнена
+
+    start = time.perf_counter()
+    dispatcher.close(wait=False)
+    assert time.perf_counter() - start < 1
+
+    sink.release.set()
+    assert all(handle.wait(5) for handle in handles)
+    assert all(handle.succeeded for handle in handles)
+
+
+def test_submit_racing_close_never_leaves_a_handle_pending():
+    for _ in range(20):
+        dispatcher = NotificationDispatcher(InMemorySink(), workers=2, max_queue=2)
+        handles, start = [], threading.Event()
+
+        def produce():
+            start.wait()
+            for i in range(50):
+                try:
+                    handles.append(dispatcher.submit([f"s{i}"], "m"))
+                except RuntimeError:
+                    return
+
+        producers = [threading.Thread(target=produce) for _ in range(3)]
+        for producer in producers:
+            producer.start()
+        start.set()
+        time.sleep(0.001)
+        dispatcher.close(wait=False)
+        for producer in producers:
+            producer.join(10)
+        assert all(handle.wait(5) for handle in handles)